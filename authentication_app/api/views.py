@@ -75,6 +75,7 @@ class LoginView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    query_budget = {"POST": 4}
 
     def post(self, request):
         """
@@ -122,6 +123,7 @@ class RegistrationView(generics.CreateAPIView):
 
     serializer_class = RegistrationSerializer
     permission_classes = [permissions.AllowAny]
+    query_budget = {"POST": 8}
 
     def post(self, request):
         """
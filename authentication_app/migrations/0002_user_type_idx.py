@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-18 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["type"], name="user_type_idx"),
+        ),
+    ]
@@ -31,3 +31,9 @@ class User(AbstractUser):
         default="customer",
         help_text="Specifies the role of the user, either 'business' or 'customer'.",
     )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Profile listings filtered by user type
+            models.Index(fields=["type"], name="user_type_idx"),
+        ]
@@ -1,3 +1,25 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from core.testing import QueryCountAssertionsMixin
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class AuthenticationQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Registration and login run a fixed number of queries.
+    """
+
+    def test_registration_and_login(self):
+        client = APIClient()
+        credentials = {"username": "max", "password": "secret-pw"}
+
+        self.assertQueryCount(
+            7,
+            client,
+            "post",
+            "/api/registration/",
+            data={**credentials, "email": "max@example.com", "type": "customer"},
+            format="json",
+        )
+        self.assertQueryCount(3, client, "post", "/api/login/", data=credentials)
@@ -10,6 +10,7 @@ from offers_app.models import Offer
 
 class BaseInfos(APIView):
     permission_classes = [permissions.AllowAny]
+    query_budget = {"GET": 5}
 
     def get(self, request):
         review_count = Review.objects.count()
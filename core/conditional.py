@@ -0,0 +1,231 @@
+import hashlib
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework.response import Response
+
+"""
+Conditional GET support (ETag / Last-Modified) for the read endpoints.
+
+Representations that embed related rows (e.g. a rating summary) list their modification times in
+`related_modified_fields`; the newest of all of them is used as the object's modification time.
+
+This module defines:
+- ConditionalRetrieveMixin: Validators for a single object derived from its primary key and updated_at.
+- ConditionalListMixin: An ETag for a list derived from a cheap aggregate fingerprint
+  (COUNT and MAX(updated_at) of the filtered queryset plus the query string and user).
+- Helpers to read validators back from a response and to evaluate them against a request,
+  used to answer 304s from cached responses.
+
+When the request's If-None-Match / If-Modified-Since headers match, a 304 response is returned
+before any serialization happens.
+"""
+
+
+def make_etag(*parts):
+    """
+    Build a quoted, strong ETag from the given parts.
+    """
+    raw = ":".join(str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode("utf-8")).hexdigest())
+
+
+def apply_validators(response, etag=None, last_modified=None):
+    """
+    Set the ETag and Last-Modified headers on a response.
+
+    Args:
+        response: The response to decorate.
+        etag (str, optional): Quoted ETag.
+        last_modified (int, optional): Last modification as a Unix timestamp.
+
+    Returns:
+        The same response.
+    """
+    if etag:
+        response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def validators_from_response(response):
+    """
+    Read the validators previously set on a response.
+
+    Returns:
+        dict: 'etag' and 'last_modified' suitable for apply_validators / not_modified_response.
+    """
+    last_modified = response.get("Last-Modified")
+    return {
+        "etag": response.get("ETag"),
+        "last_modified": parse_http_date_safe(last_modified) if last_modified else None,
+    }
+
+
+def not_modified_response(request, etag=None, last_modified=None):
+    """
+    Evaluate the request's conditional headers against the validators.
+
+    Returns:
+        HttpResponse | None: A 304 (or 412) response carrying the validators, or None
+        if the full response has to be produced.
+    """
+    if etag is None and last_modified is None:
+        return None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return apply_validators(response, etag, last_modified)
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value is not None else None
+
+
+def _newest(values):
+    return max((value for value in values if value is not None), default=None)
+
+
+def _follow(instance, lookup):
+    """
+    Read a '__' separated lookup from an instance, None if a relation on the way is missing.
+    """
+    for attr in lookup.split("__"):
+        try:
+            instance = getattr(instance, attr)
+        except ObjectDoesNotExist:
+            return None
+        if instance is None:
+            return None
+    return instance
+
+
+class ConditionalRetrieveMixin:
+    """
+    Add ETag and Last-Modified validators to retrieve().
+
+    The validators are derived from the object's primary key and the newest of
+    `last_modified_field` and `related_modified_fields`.
+    """
+
+    last_modified_field = "updated_at"
+    # Lookups of embedded related rows whose changes also change the representation
+    related_modified_fields = ()
+
+    def get_last_modified(self, instance):
+        """
+        Return the newest modification time of the object and its embedded related rows.
+        """
+        return _newest(
+            [getattr(instance, self.last_modified_field, None)]
+            + [_follow(instance, lookup) for lookup in self.related_modified_fields]
+        )
+
+    def get_object_validators(self, instance):
+        """
+        Return the validators of a single object.
+
+        Returns:
+            dict: 'etag' and 'last_modified' of the object.
+        """
+        modified = self.get_last_modified(instance)
+        return {
+            "etag": make_etag(
+                instance._meta.label,
+                instance.pk,
+                modified.isoformat() if modified else "",
+            ),
+            "last_modified": _timestamp(modified),
+        }
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return 304 if the client's copy is current, otherwise the serialized object.
+        """
+        instance = self.get_object()
+        validators = self.get_object_validators(instance)
+
+        not_modified = not_modified_response(request, **validators)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.get_serializer(instance)
+        return apply_validators(Response(serializer.data), **validators)
+
+
+class ConditionalListMixin:
+    """
+    Add an ETag validator to list() based on an aggregate fingerprint of the filtered queryset.
+
+    The fingerprint is COUNT(*) and MAX(`last_modified_field`) over the queryset, combined with the
+    query string and the requesting user. Lists only carry an ETag (no Last-Modified), because a
+    deleted row lowers the count without changing the newest modification time.
+
+    Aggregates over combined querysets (UNION, ...) are not supported by the ORM, so their
+    fingerprint is aggregated per combined query, with one query each.
+    """
+
+    last_modified_field = "updated_at"
+    # Lookups of embedded related rows whose changes also change the representation
+    related_modified_fields = ()
+
+    def get_list_fingerprint(self, queryset):
+        """
+        Return the row count and newest modification time of the queryset.
+
+        Returns:
+            tuple[int, datetime | None]: COUNT(*) and the MAX() of last_modified_field and
+            related_modified_fields.
+        """
+        lookups = [self.last_modified_field, *self.related_modified_fields]
+        aggregates = {"count": Count("pk")}
+        aggregates.update(
+            {f"modified_{index}": Max(lookup) for index, lookup in enumerate(lookups)}
+        )
+        queries = (
+            [queryset.query]
+            if not queryset.query.combinator
+            else queryset.query.combined_queries
+        )
+
+        count, modified = 0, []
+        for query in queries:
+            part = QuerySet(model=query.model, query=query.clone())
+            fingerprint = part.order_by().aggregate(**aggregates)
+            count += fingerprint.pop("count")
+            modified.extend(fingerprint.values())
+        return count, _newest(modified)
+
+    def get_list_validators(self, queryset):
+        """
+        Return the validators of the list represented by the queryset.
+
+        Returns:
+            dict: 'etag' of the list.
+        """
+        count, modified = self.get_list_fingerprint(queryset)
+        request = self.request
+        return {
+            "etag": make_etag(
+                queryset.model._meta.label,
+                request.user.pk,
+                request.get_full_path(),
+                count,
+                modified.isoformat() if modified else "",
+            )
+        }
+
+    def list(self, request, *args, **kwargs):
+        """
+        Return 304 if the client's copy of the list is current, otherwise the list.
+        """
+        validators = self.get_list_validators(self.filter_queryset(self.get_queryset()))
+
+        not_modified = not_modified_response(request, **validators)
+        if not_modified is not None:
+            return not_modified
+
+        return apply_validators(super().list(request, *args, **kwargs), **validators)
@@ -0,0 +1,59 @@
+from itertools import chain
+
+from rest_framework import generics
+
+from core.fastpath import iter_representations
+from core.fieldsets import SparseFieldsetViewMixin
+from core.streaming import export_format_param, export_response
+
+"""
+Streaming CSV / NDJSON export endpoints.
+
+An export renders the same representation as the list endpoint of the model, but reads the rows
+with QuerySet.iterator() in chunks and streams them through a StreamingHttpResponse. A worker
+holds one chunk at a time, however many rows are exported. Query parameters are validated before
+the response starts, so invalid filters still return HTTP 400; the rows are queried while the
+response body is sent.
+
+Query Params:
+    output (str): 'csv' (default) or 'ndjson'.
+    fields / omit (str): Sparse fieldset, which also selects the CSV columns (see core.fieldsets).
+
+This module defines:
+- StreamingExportView: Generic view streaming its filtered querysets as CSV or NDJSON.
+"""
+
+
+class StreamingExportView(SparseFieldsetViewMixin, generics.GenericAPIView):
+    """
+    GET: Stream the filtered queryset as CSV or NDJSON.
+
+    Subclasses set queryset, serializer_class and export_basename, and filter in get_queryset().
+    get_export_querysets() may return several querysets (e.g. a hot and an archive table), which
+    are exported one after the other.
+
+    Attributes:
+        export_basename (str): Download file name without extension.
+        export_chunk_size (int): Rows fetched per database round trip.
+    """
+
+    export_basename = "export"
+    export_chunk_size = 500
+    pagination_class = None
+
+    def get_export_querysets(self):
+        """
+        Return the filtered and ordered querysets to export, in order.
+        """
+        return [self.filter_queryset(self.get_queryset())]
+
+    def get(self, request, *args, **kwargs):
+        export_format = export_format_param(request.query_params)
+        querysets = self.get_export_querysets()
+        serializer = self.get_serializer()
+        fields = [field.field_name for field in serializer._readable_fields]
+        rows = chain.from_iterable(
+            iter_representations(serializer, queryset, self.export_chunk_size)
+            for queryset in querysets
+        )
+        return export_response(rows, fields, export_format, self.export_basename)
@@ -0,0 +1,153 @@
+import codecs
+import json
+import re
+from io import BytesIO
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+"""
+JSON renderer and parser with a pluggable encoding backend.
+
+The 'orjson' backend encodes and decodes in C; the 'stdlib' backend is DRF's own json-module path.
+Both produce the same bytes: orjson is configured to hand every non-native type (Decimal,
+datetime/date/time, UUID, lazy strings, querysets, ...) to DRF's JSONEncoder.default(), so values
+are formatted exactly as before. Anything orjson cannot encode or decode exactly (integers beyond
+64 bits, invalid input) goes through the stdlib path, which also keeps DRF's error messages.
+
+Known difference: floats in exponent notation (1e-07 vs 1e-7) and non-finite floats (NaN renders
+as null instead of raising). The API does not emit floats; prices are decimal strings.
+
+Settings:
+    JSON_BACKEND (str): 'orjson', 'stdlib' or 'auto' (orjson if installed; default='auto').
+
+This module defines:
+- get_backend: Resolve the configured backend.
+- dumps: Encode data as compact UTF-8 JSON bytes, formatted like DRF responses.
+- FastJSONRenderer: JSONRenderer using dumps() for compact responses.
+- FastJSONParser: JSONParser decoding with orjson when available.
+"""
+
+
+BACKENDS = ("auto", "orjson", "stdlib")
+
+_encoder = JSONEncoder()
+
+# orjson decodes integers beyond 64 bits as floats; bodies with such digit runs use the stdlib
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+if orjson is not None:
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def get_backend():
+    """
+    Return the JSON backend in use, 'orjson' or 'stdlib'.
+
+    Raises:
+        ImproperlyConfigured: If JSON_BACKEND is unknown or names orjson while it is not installed.
+    """
+    backend = getattr(settings, "JSON_BACKEND", "auto")
+    if backend not in BACKENDS:
+        raise ImproperlyConfigured(
+            f"JSON_BACKEND must be one of: {', '.join(BACKENDS)}."
+        )
+    if backend == "auto":
+        return "orjson" if orjson is not None else "stdlib"
+    if backend == "orjson" and orjson is None:
+        raise ImproperlyConfigured(
+            "JSON_BACKEND is 'orjson' but orjson is not installed."
+        )
+    return backend
+
+
+def _stdlib_dumps(data):
+    return json.dumps(
+        data,
+        cls=JSONEncoder,
+        ensure_ascii=False,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def dumps(data, backend=None):
+    """
+    Encode data as compact, non-ASCII-escaping UTF-8 JSON.
+
+    Args:
+        data: The data to encode.
+        backend (str, optional): 'orjson' or 'stdlib' (default: get_backend()).
+
+    Returns:
+        bytes: The encoded data.
+    """
+    if (backend or get_backend()) == "orjson":
+        try:
+            return orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding compact responses with dumps().
+
+    Indented output (browsable API, `indent` media type parameter) and ASCII-only output
+    (UNICODE_JSON=False) are left to DRF's renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.encoder_class is JSONEncoder
+            and not self.ensure_ascii
+            and self.compact
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        ):
+            # Escaped like DRF: U+2028/U+2029 are valid JSON but not valid JavaScript
+            return (
+                dumps(data)
+                .replace(b"\xe2\x80\xa8", b"\\u2028")
+                .replace(b"\xe2\x80\xa9", b"\\u2029")
+            )
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser decoding UTF-8 bodies with orjson when the orjson backend is active.
+
+    Bodies orjson rejects are parsed again by DRF's parser, so error responses stay unchanged.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if get_backend() != "orjson" or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if _LONG_DIGITS.search(body):
+            return super().parse(BytesIO(body), media_type, parser_context)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(BytesIO(body), media_type, parser_context)
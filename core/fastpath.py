@@ -0,0 +1,437 @@
+import decimal
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.fields.files import FileField as ModelFileField
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from core.streaming import chunked
+
+"""
+Compiled read path for list endpoints.
+
+compile_serializer() turns the readable fields of a (bound) ModelSerializer into a flat
+row-to-dict function over QuerySet.values() rows. Each field gets a converter specialised for its
+DRF field class (datetimes, decimals, files, primary keys, ...) and bound once, instead of going
+through get_attribute()/to_representation() per field and row. Nested serializers on foreign keys
+become joined columns; nested many-serializers on reverse foreign keys are loaded with one extra
+values() query per page. The output is identical to serializer.data, so responses render to the
+same bytes.
+
+Fields the compiler does not know are converted with their own to_representation(), so custom
+fields keep working. Fields it cannot map onto columns (source='*', methods, properties,
+hyperlinks) raise UnsupportedField; CompiledListMixin then falls back to the regular serializer.
+
+This module defines:
+- compile_serializer: Build a CompiledSerializer from a serializer instance.
+- CompiledSerializer: values() lookups plus the row-to-dict conversion.
+- iter_representations: Stream the representations of a queryset chunk by chunk.
+- CompiledListMixin: list() implementation using the compiled read path.
+"""
+
+
+class UnsupportedField(Exception):
+    """
+    Raised when a serializer field cannot be compiled onto QuerySet.values() rows.
+    """
+
+
+# Marks fields omitted from a row, like DRF's SkipField
+_SKIP = object()
+
+
+def _defining_class(field):
+    """
+    Return the class in the field's MRO that implements its to_representation().
+    """
+    for cls in type(field).__mro__:
+        if "to_representation" in vars(cls):
+            return cls
+    return None
+
+
+def _identity(value):
+    return value
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None:
+        return _identity
+    timezone = (
+        field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    )
+    if output_format.lower() != drf_fields.ISO_8601 or timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if isinstance(value, str):
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone)
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def _decimal_converter(field):
+    if field.localize or field.normalize_output or field.decimal_places is None:
+        return field.to_representation
+
+    coerce_to_string = getattr(
+        field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING
+    )
+    exponent = Decimal(".1") ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def convert(value):
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value).strip())
+        value = value.quantize(exponent, rounding=rounding, context=context)
+        return "{:f}".format(value) if coerce_to_string else value
+
+    return convert
+
+
+def _file_converter(field, model_field):
+    if not getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+        return _identity
+
+    storage = model_field.storage
+    request = field.context.get("request")
+
+    def convert(value):
+        url = storage.url(value)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return convert
+
+
+def _falsy_to_none(convert):
+    def wrapper(value):
+        return convert(value) if value else None
+
+    return wrapper
+
+
+def _converter(field, model_field):
+    """
+    Return a function turning a raw values() value into the field's representation.
+    """
+    if isinstance(field, relations.HyperlinkedRelatedField) or isinstance(
+        field, relations.ManyRelatedField
+    ):
+        raise UnsupportedField(field.field_name)
+
+    cls = _defining_class(field)
+    if cls is relations.PrimaryKeyRelatedField:
+        if field.pk_field is not None:
+            raise UnsupportedField(field.field_name)
+        return _identity
+    if cls is drf_fields.DateTimeField:
+        return _falsy_to_none(_datetime_converter(field))
+    if cls is drf_fields.DecimalField:
+        return _decimal_converter(field)
+    if cls is drf_fields.FileField:
+        if not isinstance(model_field, ModelFileField):
+            raise UnsupportedField(field.field_name)
+        return _falsy_to_none(_file_converter(field, model_field))
+    if cls is drf_fields.IntegerField:
+        return int
+    if cls is drf_fields.FloatField:
+        return float
+    if cls is drf_fields.CharField:
+        return str
+    if cls in (drf_fields.JSONField, drf_fields.ReadOnlyField) and not getattr(
+        field, "binary", False
+    ):
+        return _identity
+    return field.to_representation
+
+
+def _resolve(model, attrs):
+    """
+    Map a field's source attributes onto a values() lookup.
+
+    Returns:
+        tuple[str, Field, list[str]]: The lookup, the model field it ends on, and the foreign key
+        lookups traversed on the way (NULL in any of them means the source does not exist).
+    """
+    lookup, guards, model_field = [], [], None
+    for index, attr in enumerate(attrs):
+        if model_field is not None:
+            if not model_field.is_relation:
+                raise UnsupportedField(".".join(attrs))
+            guards.append("__".join(lookup))
+            if attr in ("id", "pk") and index == len(attrs) - 1:
+                # 'business_user.id' is the foreign key column itself
+                return "__".join(lookup), model_field, guards
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            if attr != "pk":
+                raise UnsupportedField(".".join(attrs))
+            model_field = model._meta.pk
+        if model_field.many_to_many or model_field.one_to_many:
+            raise UnsupportedField(".".join(attrs))
+        lookup.append(model_field.name)
+        model = model_field.related_model
+    return "__".join(lookup), model_field, guards
+
+
+class CompiledSerializer:
+    """
+    Row-to-dict conversion for the readable fields of one serializer.
+
+    Attributes:
+        model (type[Model]): The serializer's model.
+        lookups (list[str]): values() lookups required by the conversion.
+    """
+
+    def __init__(self, serializer, prefix=""):
+        self.model = serializer.Meta.model
+        self.pk_lookup = f"{prefix}{self.model._meta.pk.name}"
+        self.lookups = [self.pk_lookup]
+        self.steps = []
+        self.related = []
+        self.skippable = []
+
+        for field in serializer._readable_fields:
+            if isinstance(field, serializers.ListSerializer):
+                self._add_many(field, prefix)
+            elif isinstance(field, serializers.BaseSerializer):
+                self._add_nested(field, prefix)
+            else:
+                self._add_field(field, prefix)
+
+    def _lookup(self, lookup):
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+        return lookup
+
+    def _missing(self, field):
+        """
+        Return the value of a field whose source crosses a NULL relation.
+
+        Mirrors Field.get_attribute(): None for nullable fields, omitted (_SKIP) for optional ones.
+        """
+        if field.default is not drf_fields.empty:
+            raise UnsupportedField(field.field_name)
+        if field.allow_null:
+            return None
+        if not field.required:
+            self.skippable.append(field.field_name)
+            return _SKIP
+        raise UnsupportedField(field.field_name)
+
+    def _add_field(self, field, prefix):
+        if field.source == "*":
+            raise UnsupportedField(field.field_name)
+        lookup, model_field, guards = _resolve(self.model, field.source_attrs)
+        key = self._lookup(f"{prefix}{lookup}")
+        guards = [self._lookup(f"{prefix}{guard}") for guard in guards]
+        convert = _converter(field, model_field)
+
+        if guards:
+            missing = self._missing(field)
+
+            def step(row, related):
+                for guard in guards:
+                    if row[guard] is None:
+                        return missing
+                value = row[key]
+                return None if value is None else convert(value)
+
+        else:
+
+            def step(row, related):
+                value = row[key]
+                return None if value is None else convert(value)
+
+        self.steps.append((field.field_name, step))
+
+    def _add_nested(self, field, prefix):
+        lookup, model_field, guards = _resolve(self.model, field.source_attrs)
+        if not model_field.is_relation:
+            raise UnsupportedField(field.field_name)
+        key = self._lookup(f"{prefix}{lookup}")
+        guards = [self._lookup(f"{prefix}{guard}") for guard in guards]
+        missing = self._missing(field) if guards else None
+        child = CompiledSerializer(field, prefix=f"{prefix}{lookup}__")
+        for child_lookup in child.lookups:
+            self._lookup(child_lookup)
+
+        def step(row, related):
+            for guard in guards:
+                if row[guard] is None:
+                    return missing
+            return None if row[key] is None else child.convert(row, related)
+
+        self.steps.append((field.field_name, step))
+
+    def _add_many(self, field, prefix):
+        if prefix or field.source == "*":
+            raise UnsupportedField(field.field_name)
+        try:
+            relation = self.model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            raise UnsupportedField(field.field_name)
+        if not relation.one_to_many:
+            raise UnsupportedField(field.field_name)
+
+        child = CompiledSerializer(field.child)
+        fk = relation.field.attname
+        name = field.field_name
+        self.related.append((name, relation.related_model, fk, child))
+
+        def step(row, related):
+            return related[name].get(row[self.pk_lookup], [])
+
+        self.steps.append((name, step))
+
+    def values(self, queryset, extra=()):
+        """
+        Turn a model queryset into the values() queryset the conversion reads.
+
+        Args:
+            queryset (QuerySet): Filtered and ordered model queryset.
+            extra (Iterable[str]): Additional lookups to select (e.g. pagination keys).
+
+        Returns:
+            QuerySet[dict]: The values() queryset.
+        """
+        lookups = list(self.lookups)
+        lookups += [lookup for lookup in extra if lookup not in lookups]
+        return queryset.prefetch_related(None).values(*lookups)
+
+    def load_related(self, rows):
+        """
+        Load the nested many-relations of the rows, one values() query per relation.
+
+        Returns:
+            dict[str, dict[Any, list[dict]]]: Converted children per field and parent key.
+        """
+        loaded = {}
+        keys = [row[self.pk_lookup] for row in rows]
+        for name, model, fk, child in self.related:
+            grouped = {}
+            if keys:
+                children = model._default_manager.filter(**{f"{fk}__in": keys})
+                for child_row in child.values(children, extra=(fk,)):
+                    grouped.setdefault(child_row[fk], []).append(
+                        child.convert(child_row, {})
+                    )
+            loaded[name] = grouped
+        return loaded
+
+    def convert(self, row, related):
+        """
+        Convert one values() row (with its loaded relations) into the representation.
+        """
+        data = {name: step(row, related) for name, step in self.steps}
+        for name in self.skippable:
+            if data[name] is _SKIP:
+                del data[name]
+        return data
+
+    def serialize(self, rows):
+        """
+        Convert values() rows into the representation of serializer(many=True).data.
+        """
+        rows = list(rows)
+        related = self.load_related(rows)
+        return [self.convert(row, related) for row in rows]
+
+    def iterate(self, queryset, chunk_size=1000):
+        """
+        Convert a model queryset chunk by chunk, reading it with QuerySet.iterator().
+
+        At most chunk_size rows (and their many-relations) are held in memory at a time.
+
+        Yields:
+            dict: The representation of each row, in queryset order.
+        """
+        rows = self.values(queryset).iterator(chunk_size=chunk_size)
+        for chunk in chunked(rows, chunk_size):
+            yield from self.serialize(chunk)
+
+
+def compile_serializer(serializer):
+    """
+    Compile the readable fields of a bound serializer instance.
+
+    Args:
+        serializer (ModelSerializer): Serializer instance, with context and sparse fieldset applied.
+
+    Raises:
+        UnsupportedField: If a field cannot be read from values() rows.
+
+    Returns:
+        CompiledSerializer: The compiled read path.
+    """
+    return CompiledSerializer(serializer)
+
+
+def iter_representations(serializer, queryset, chunk_size=1000):
+    """
+    Yield the representation of each object of a queryset, for streaming exports.
+
+    Uses the compiled read path when the serializer compiles, otherwise the serializer itself on
+    objects read with QuerySet.iterator().
+
+    Args:
+        serializer (ModelSerializer): Serializer instance without data, with context.
+        queryset (QuerySet): Filtered and ordered model queryset.
+        chunk_size (int): Rows fetched per database round trip.
+
+    Returns:
+        Iterator[dict]: The representations, in queryset order.
+    """
+    try:
+        compiled = compile_serializer(serializer)
+    except UnsupportedField:
+        return (
+            serializer.to_representation(instance)
+            for instance in queryset.iterator(chunk_size=chunk_size)
+        )
+    return compiled.iterate(queryset, chunk_size)
+
+
+class CompiledListMixin:
+    """
+    List view mixin rendering GET lists through compile_serializer().
+
+    Falls back to the regular serializer if the serializer cannot be compiled, the queryset is a
+    combined query (UNION, ...) or `compiled_read` is False. Pagination (page number and keyset)
+    works on the values() rows.
+    """
+
+    compiled_read = True
+
+    def list(self, request, *args, **kwargs):
+        if not self.compiled_read:
+            return super().list(request, *args, **kwargs)
+        try:
+            compiled = compile_serializer(self.get_serializer())
+        except UnsupportedField:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if queryset.query.combinator:
+            return super().list(request, *args, **kwargs)
+        queryset = compiled.values(
+            queryset, extra=getattr(self, "keyset_ordering_fields", ())
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(compiled.serialize(page))
+        return Response(compiled.serialize(queryset))
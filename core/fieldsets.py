@@ -0,0 +1,194 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.permissions import SAFE_METHODS
+
+"""
+Sparse fieldsets for the read endpoints: `?fields=id,title` keeps only the listed fields,
+`?omit=details,description` drops the listed ones (both may be combined).
+
+The selection prunes both sides of a response:
+- SparseFieldsetSerializerMixin removes the fields from the serializer, so they are never rendered.
+- SparseFieldsetViewMixin restricts the SQL columns to the remaining fields with only(), and only
+  keeps the select_related() / prefetch_related() lookups that the remaining fields need.
+"""
+
+
+def _split(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Serializer mixin accepting `fields` and `omit` keyword arguments (lists of field names).
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        omit = kwargs.pop("omit", None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        for name in omit or ():
+            self.fields.pop(name, None)
+
+
+class SparseFieldsetViewMixin:
+    """
+    View mixin applying `?fields=` / `?omit=` to the serializer and the queryset of GET requests.
+
+    Columns a view always needs besides the rendered ones (the primary key, the conditional GET
+    field `last_modified_field` and the keyset ordering fields) are kept loaded.
+
+    Attributes:
+        fields_query_param (str): Query parameter listing the fields to keep (default='fields').
+        omit_query_param (str): Query parameter listing the fields to drop (default='omit').
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def get_sparse_fieldset(self):
+        """
+        Parse and validate the requested fieldset.
+
+        Raises:
+            ParseError: If a requested name is not a readable field of the serializer.
+
+        Returns:
+            dict | None: 'fields' and 'omit' keyword arguments for the serializer,
+            or None if the request does not ask for a sparse fieldset.
+        """
+        if hasattr(self, "_sparse_fieldset"):
+            return self._sparse_fieldset
+
+        self._sparse_fieldset = None
+        params = self.request.query_params
+        if self.request.method not in SAFE_METHODS or not (
+            self.fields_query_param in params or self.omit_query_param in params
+        ):
+            return None
+
+        serializer_class = self.get_serializer_class()
+        readable = [
+            name
+            for name, field in serializer_class().fields.items()
+            if not field.write_only
+        ]
+        fieldset = {}
+        for key, param in (
+            ("fields", self.fields_query_param),
+            ("omit", self.omit_query_param),
+        ):
+            if param not in params:
+                continue
+            names = _split(params[param])
+            unknown = [name for name in names if name not in readable]
+            if unknown:
+                raise ParseError(
+                    f"Unknown field(s) in `{param}`: {', '.join(unknown)}. "
+                    f"Available: {', '.join(readable)}."
+                )
+            fieldset[key] = names
+
+        self._sparse_fieldset = fieldset
+        return fieldset
+
+    def get_serializer(self, *args, **kwargs):
+        fieldset = self.get_sparse_fieldset()
+        if fieldset:
+            kwargs.update(fieldset)
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fieldset = self.get_sparse_fieldset()
+        if not fieldset:
+            return queryset
+        return self.prune_queryset(queryset, self.get_serializer().fields)
+
+    def get_always_loaded_fields(self):
+        """
+        Return the model fields loaded regardless of the requested fieldset.
+        """
+        return [
+            "pk",
+            getattr(self, "last_modified_field", None),
+            *getattr(self, "keyset_ordering_fields", ()),
+        ]
+
+    def prune_queryset(self, queryset, fields):
+        """
+        Restrict a queryset to the columns and relations needed by the serializer fields.
+
+        Fields whose source cannot be mapped onto model fields (methods, properties, '*')
+        leave the queryset unpruned.
+
+        Args:
+            queryset (QuerySet): The queryset to prune.
+            fields (dict[str, Field]): The remaining serializer fields.
+
+        Returns:
+            QuerySet: The pruned queryset.
+        """
+        model = queryset.model
+        columns, select, prefetch = set(), set(), set()
+
+        for name in self.get_always_loaded_fields():
+            if name == "pk":
+                columns.add(model._meta.pk.name)
+            elif name is not None and self._concrete(model, name):
+                columns.add(name)
+
+        for field in fields.values():
+            source = field.source
+            if source == "*":
+                return queryset
+            head, _, rest = source.partition(".")
+            try:
+                model_field = model._meta.get_field(head)
+            except FieldDoesNotExist:
+                return queryset
+
+            if model_field.many_to_many or model_field.one_to_many:
+                prefetch.add(head)
+            elif model_field.is_relation and (
+                rest not in ("", "id", "pk")
+                or isinstance(field, serializers.BaseSerializer)
+            ):
+                # Related model data: join it and load the columns the field reads
+                select.add(head)
+                columns.add(head)
+                if isinstance(field, serializers.BaseSerializer):
+                    path = source.replace(".", "__")
+                    select.add(path)
+                    columns.update(
+                        f"{path}__{child.source.replace('.', '__')}"
+                        for child in field.fields.values()
+                    )
+                else:
+                    columns.add(f"{head}__{rest.replace('.', '__')}")
+            else:
+                columns.add(head)
+
+        for lookup in getattr(self, "related_modified_fields", ()):
+            # Read by the conditional GET validators (see core.conditional)
+            path = lookup.rpartition("__")[0]
+            select.add(path)
+            columns.update((lookup.partition("__")[0], lookup))
+
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if select:
+            queryset = queryset.select_related(*sorted(select))
+        if prefetch:
+            queryset = queryset.prefetch_related(*sorted(prefetch))
+        return queryset.only(*sorted(columns))
+
+    @staticmethod
+    def _concrete(model, name):
+        try:
+            return model._meta.get_field(name).concrete
+        except FieldDoesNotExist:
+            return False
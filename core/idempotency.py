@@ -0,0 +1,197 @@
+import hashlib
+import json
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import UploadedFile
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+"""
+Idempotency keys for create endpoints.
+
+Clients send an `Idempotency-Key` header (any unique string, e.g. a UUID) with a POST. The first
+request with a key does the work and its successful response is stored for IDEMPOTENCY_KEY_TTL
+seconds; repeats with the same key get the stored response replayed (marked with an
+`Idempotent-Replayed: true` header) instead of creating the resource again.
+
+Concurrent duplicates are collapsed: the first request takes a lock (an atomic cache.add), the
+others wait up to IDEMPOTENCY_WAIT seconds for its response and replay it, or get a 409 if it is
+still running. Failed requests (non-2xx) are not stored and release the key, so the client can
+retry with a corrected payload. Reusing a key with a different payload is rejected with 422.
+
+Keys are scoped to the endpoint and the requesting user. Entries live in the default cache, so
+storage is bounded by the cache's TTL expiry and its own eviction.
+
+Settings:
+    IDEMPOTENCY_KEY_TTL (int): Seconds a stored response is replayed (default=86400).
+    IDEMPOTENCY_LOCK_TIMEOUT (int): Seconds after which an abandoned lock expires (default=30).
+    IDEMPOTENCY_WAIT (float): Seconds a concurrent duplicate waits for the response (default=5).
+
+This module defines:
+- IdempotencyMixin: View mixin applying the above to post().
+- request_fingerprint: Hash identifying the payload a key was first used with.
+"""
+
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+KEY_PREFIX = "idempotency"
+POLL_INTERVAL = 0.05
+
+
+class IdempotencyConflict(APIException):
+    """
+    Raised when a duplicate request keeps waiting for the original one to finish.
+    """
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this Idempotency-Key is still being processed."
+    default_code = "idempotency_conflict"
+
+
+class IdempotencyKeyReused(APIException):
+    """
+    Raised when a key is sent again with a different method, path or payload.
+    """
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was already used with a different request."
+    default_code = "idempotency_key_reused"
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _canonical(value):
+    """
+    Return a JSON-serializable stand-in for parsed request data (files by name and size).
+    """
+    if isinstance(value, UploadedFile):
+        return ["file", value.name, value.size]
+    if hasattr(value, "lists"):
+        return {key: _canonical(items) for key, items in sorted(value.lists())}
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def request_fingerprint(request):
+    """
+    Hash the method, path and parsed payload of a request.
+    """
+    payload = json.dumps(
+        [request.method, request.path, _canonical(request.data)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class IdempotencyMixin:
+    """
+    View mixin honoring the Idempotency-Key header on POST.
+
+    Must come before the generic view in the bases, so that its post() wraps the view's.
+    """
+
+    idempotency_header = HEADER
+
+    def get_idempotency_key(self, request):
+        """
+        Return the cache key prefix for the request's Idempotency-Key, or None without header.
+
+        Raises:
+            ValidationError: If the header value is empty or too long.
+        """
+        key = request.headers.get(self.idempotency_header)
+        if key is None:
+            return None
+        key = key.strip()
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValidationError(
+                {
+                    self.idempotency_header: f"Must be 1 to {MAX_KEY_LENGTH} characters long."
+                }
+            )
+        scope = ":".join(
+            [
+                type(self).__module__,
+                type(self).__qualname__,
+                str(request.user.pk if request.user.is_authenticated else ""),
+                key,
+            ]
+        )
+        return f"{KEY_PREFIX}:{hashlib.sha256(scope.encode('utf-8')).hexdigest()}"
+
+    def post(self, request, *args, **kwargs):
+        cache_key = self.get_idempotency_key(request)
+        if cache_key is None:
+            return super().post(request, *args, **kwargs)
+
+        fingerprint = request_fingerprint(request)
+        response_key, lock_key = f"{cache_key}:response", f"{cache_key}:lock"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + _setting("IDEMPOTENCY_WAIT", 5)
+
+        while True:
+            stored = cache.get(response_key)
+            if stored is not None:
+                return self._replay(stored, fingerprint)
+            if cache.add(
+                lock_key, token, timeout=_setting("IDEMPOTENCY_LOCK_TIMEOUT", 30)
+            ):
+                return self._run_once(
+                    request, fingerprint, response_key, lock_key, token, args, kwargs
+                )
+            # A duplicate holds the lock: wait for its response
+            if time.monotonic() >= deadline:
+                raise IdempotencyConflict()
+            time.sleep(POLL_INTERVAL)
+
+    def _run_once(
+        self, request, fingerprint, response_key, lock_key, token, args, kwargs
+    ):
+        """
+        Do the work of the request and store its response if it succeeded.
+        """
+        try:
+            response = super().post(request, *args, **kwargs)
+            if status.is_success(response.status_code):
+                cache.set(
+                    response_key,
+                    {
+                        "fingerprint": fingerprint,
+                        "status": response.status_code,
+                        "data": response.data,
+                        "headers": {
+                            name: response[name]
+                            for name in ("Location", "ETag")
+                            if response.has_header(name)
+                        },
+                    },
+                    timeout=_setting("IDEMPOTENCY_KEY_TTL", 24 * 60 * 60),
+                )
+            return response
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    def _replay(self, stored, fingerprint):
+        """
+        Rebuild the stored response, rejecting keys reused for a different payload.
+        """
+        if stored["fingerprint"] != fingerprint:
+            raise IdempotencyKeyReused()
+        response = Response(stored["data"], status=stored["status"])
+        for name, value in stored["headers"].items():
+            response[name] = value
+        response[REPLAYED_HEADER] = "true"
+        return response
@@ -0,0 +1,156 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import Http404
+
+"""
+Request-scoped identity map.
+
+Permissions, views and serializers often need the same row during one request: a permission
+checks that an order exists, the view loads it again, a serializer looks it up once more.
+The identity map caches the instances loaded through it per request, keyed by model and
+primary key, so each row is fetched at most once. Missing rows are cached as well.
+
+The map lives on the Django HttpRequest (`request.identity_map`), so DRF's Request and the
+serializer context share it. IdentityMapMiddleware creates it up front; get_identity_map() creates
+it lazily for requests that did not pass the middleware (e.g. views called directly in tests).
+
+Every map counts its hits and misses. In DEBUG mode responses carry 'X-Identity-Map-Hits' and
+'X-Identity-Map-Misses' headers, next to core.querybudget's 'X-Query-Count'.
+
+This module defines:
+- IdentityMap: The per-request cache of model instances.
+- get_identity_map: Return the identity map of a request.
+- IdentityMapMiddleware: Attach a fresh identity map to every request.
+- IdentityMapMixin: get_object() through the identity map for generic detail views.
+"""
+
+
+class IdentityMap:
+    """
+    Cache of model instances loaded during one request.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that ran a query.
+    """
+
+    def __init__(self):
+        self._instances = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(model, pk):
+        return (model._meta.label, pk)
+
+    def get(self, queryset, pk):
+        """
+        Return the instance with the given primary key, loading it from the queryset once.
+
+        Args:
+            queryset (QuerySet): Queryset the instance is loaded from on a miss.
+            pk: Primary key, raw URL values included (converted with the pk field's to_python()).
+
+        Returns:
+            Model | None: The instance, or None if the queryset has no such row (or pk is invalid).
+        """
+        model = queryset.model
+        try:
+            pk = model._meta.pk.to_python(pk)
+        except ValidationError:
+            return None
+
+        key = self._key(model, pk)
+        if key in self._instances:
+            self.hits += 1
+            return self._instances[key]
+
+        self.misses += 1
+        instance = queryset.filter(pk=pk).first()
+        self._instances[key] = instance
+        return instance
+
+    def add(self, instance):
+        """
+        Store an instance loaded elsewhere, e.g. one created during the request.
+        """
+        self._instances[self._key(type(instance), instance.pk)] = instance
+
+    def discard(self, model, pk):
+        """
+        Forget the cached instance of a model and primary key, if any.
+        """
+        self._instances.pop(self._key(model, pk), None)
+
+    def stats(self):
+        """
+        Return the hit and miss counters.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def get_identity_map(request):
+    """
+    Return the identity map of a request, creating it if needed.
+
+    Args:
+        request (HttpRequest | Request): The Django or DRF request.
+
+    Returns:
+        IdentityMap: The identity map shared by everything handling the request.
+    """
+    request = getattr(request, "_request", request)
+    identity_map = getattr(request, "identity_map", None)
+    if identity_map is None:
+        identity_map = request.identity_map = IdentityMap()
+    return identity_map
+
+
+class IdentityMapMiddleware:
+    """
+    Attach a fresh identity map to every request and expose its counters in DEBUG mode.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        identity_map = request.identity_map = IdentityMap()
+        response = self.get_response(request)
+        if settings.DEBUG:
+            response["X-Identity-Map-Hits"] = str(identity_map.hits)
+            response["X-Identity-Map-Misses"] = str(identity_map.misses)
+        return response
+
+
+class IdentityMapMixin:
+    """
+    Generic view mixin loading the object through the request's identity map.
+
+    Permissions that load the object in has_permission() (with the view's get_queryset()) share
+    the row with get_object(), so the object is queried once per request. Object permissions are
+    checked on every get_object() call, as in DRF. Views with a lookup_field other than the
+    primary key fall back to DRF's get_object().
+    """
+
+    def get_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.lookup_field not in ("pk", queryset.model._meta.pk.name):
+            return super().get_object()
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_identity_map(self.request).get(
+            queryset, self.kwargs[lookup_url_kwarg]
+        )
+        if instance is None:
+            raise Http404(
+                f"No {queryset.model._meta.object_name} matches the given query."
+            )
+
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    def perform_destroy(self, instance):
+        pk = instance.pk
+        super().perform_destroy(instance)
+        get_identity_map(self.request).discard(type(instance), pk)
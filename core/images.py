@@ -0,0 +1,327 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+"""
+Image processing pipeline for uploaded offer and profile pictures.
+
+Uploads are validated and re-encoded without metadata (EXIF, GPS, ICC, comments) on the request
+path. The resized variants are generated off the request path: after the transaction commits,
+a background worker renders every variant in VARIANTS in every format in FORMATS and records the
+stored file names in the model's variants JSON field, e.g.:
+
+    {
+        "source": "offer_images/logo.png",
+        "thumb": {"webp": "offer_images/variants/logo_thumb.webp", "jpeg": "offer_images/variants/logo_thumb.jpg"},
+        "card": {...},
+        "full": {...},
+    }
+
+Settings:
+    IMAGE_MAX_UPLOAD_SIZE (int): Maximum upload size in bytes (default=10 MB).
+    IMAGE_PROCESSING_WORKERS (int): Background worker threads (default=2).
+    IMAGE_PROCESSING_SYNC (bool): Generate variants inline after commit instead of in a worker.
+
+This module defines:
+- ProcessedImageField: Serializer field validating and sanitizing uploads.
+- ImageVariantsField: Read-only serializer field exposing the variant URLs.
+- sync_image_variants: post_save hook scheduling (re)generation when the source image changed.
+- process_variants: Generate and store the variants of one instance (used by workers and commands).
+"""
+
+
+logger = logging.getLogger(__name__)
+
+# name -> (width, height), crop: cropped to fill the box instead of fitted into it
+VARIANTS = {
+    "thumb": ((160, 160), True),
+    "card": ((480, 360), True),
+    "full": ((1600, 1600), False),
+}
+
+# name -> (Pillow format, file extension, encoder options)
+FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+# Options used when re-encoding the sanitized original
+ORIGINAL_OPTIONS = {
+    "JPEG": {"quality": 95},
+    "WEBP": {"quality": 95},
+    "PNG": {"optimize": True},
+    "GIF": {},
+}
+
+_executor = None
+
+
+def _max_upload_size():
+    return getattr(settings, "IMAGE_MAX_UPLOAD_SIZE", 10 * 1024 * 1024)
+
+
+def _get_executor():
+    """
+    Return the shared worker pool, creating it on first use.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "IMAGE_PROCESSING_WORKERS", 2),
+            thread_name_prefix="image-variants",
+        )
+    return _executor
+
+
+def _strip_metadata(image):
+    """
+    Apply the EXIF orientation and return a copy of the image without any metadata.
+    """
+    image = ImageOps.exif_transpose(image)
+    image.info = {}
+    return image
+
+
+def _as_mode_for(image, image_format):
+    """
+    Convert an image into a mode the target format can encode.
+
+    JPEG has no alpha channel, so transparent images are flattened onto white.
+    """
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    if image_format == "JPEG" and image.mode in ("RGBA", "LA"):
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    if image.mode not in ("RGB", "RGBA"):
+        return image.convert("RGB")
+    return image
+
+
+def _encode(image, image_format, options):
+    buffer = BytesIO()
+    _as_mode_for(image, image_format).save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def sanitize_image(file):
+    """
+    Validate an uploaded image and re-encode it in its own format without metadata.
+
+    Args:
+        file (UploadedFile): The uploaded image.
+
+    Raises:
+        serializers.ValidationError: If the file is too large, not a supported image,
+            or exceeds Pillow's decompression bomb limit.
+
+    Returns:
+        ContentFile: The sanitized image, keeping the uploaded file name.
+    """
+    if file.size > _max_upload_size():
+        raise serializers.ValidationError(
+            f"Image is too large (max. {_max_upload_size() // (1024 * 1024)} MB)."
+        )
+
+    file.seek(0)
+    try:
+        with Image.open(file) as image:
+            image_format = image.format
+            if image_format not in ALLOWED_FORMATS:
+                raise serializers.ValidationError(
+                    f"Unsupported image format. Allowed: {', '.join(sorted(ALLOWED_FORMATS))}."
+                )
+            content = _encode(
+                _strip_metadata(image), image_format, ORIGINAL_OPTIONS[image_format]
+            )
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        raise serializers.ValidationError("Upload a valid image.")
+
+    return ContentFile(content, name=os.path.basename(file.name))
+
+
+def _render(image, size, crop):
+    if crop:
+        return ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+    image = image.copy()
+    image.thumbnail(size, Image.Resampling.LANCZOS)
+    return image
+
+
+def generate_variants(field_file):
+    """
+    Render and store all variants of an image.
+
+    Args:
+        field_file (FieldFile): The stored source image.
+
+    Returns:
+        dict: Stored variant names keyed by variant and format, plus the 'source' name.
+    """
+    storage = field_file.storage
+    source = field_file.name
+    directory, filename = os.path.split(source)
+    stem = os.path.splitext(filename)[0]
+
+    with storage.open(source, "rb") as fh, Image.open(fh) as image:
+        image = _strip_metadata(image)
+
+    variants = {"source": source}
+    for variant, (size, crop) in VARIANTS.items():
+        rendered = _render(image, size, crop)
+        for key, (image_format, extension, options) in FORMATS.items():
+            name = os.path.join(directory, "variants", f"{stem}_{variant}.{extension}")
+            if storage.exists(name):
+                storage.delete(name)
+            variants.setdefault(variant, {})[key] = storage.save(
+                name, ContentFile(_encode(rendered, image_format, options))
+            )
+    return variants
+
+
+def _variant_names(variants):
+    return {
+        name
+        for variant, formats in (variants or {}).items()
+        if variant != "source"
+        for name in formats.values()
+    }
+
+
+def _delete_variants(storage, names):
+    for name in names:
+        try:
+            storage.delete(name)
+        except OSError:
+            logger.warning("Could not delete image variant %s", name)
+
+
+def process_variants(model, pk, field_name, variants_field):
+    """
+    Generate the variants of one instance and record them in its variants field.
+
+    Variants of a previous source image are deleted. If the source image was replaced while
+    processing, the result is discarded (the new upload schedules its own run).
+
+    Args:
+        model (type[Model]): Model class of the instance.
+        pk: Primary key of the instance.
+        field_name (str): Name of the ImageField.
+        variants_field (str): Name of the JSONField holding the variant names.
+    """
+    instance = model._default_manager.filter(pk=pk).first()
+    if instance is None:
+        return
+
+    field_file = getattr(instance, field_name)
+    previous = getattr(instance, variants_field) or {}
+    variants = generate_variants(field_file) if field_file else {}
+
+    current = (
+        model._default_manager.filter(pk=pk).values_list(field_name, flat=True).first()
+    )
+    if (current or None) != (field_file.name or None):
+        _delete_variants(field_file.storage, _variant_names(variants))
+        return
+
+    setattr(instance, variants_field, variants)
+    update_fields = [variants_field] + [
+        field.name
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False)
+    ]
+    instance.save(update_fields=update_fields)
+    _delete_variants(
+        field_file.storage, _variant_names(previous) - _variant_names(variants)
+    )
+
+
+def _process_in_background(model, pk, field_name, variants_field):
+    try:
+        process_variants(model, pk, field_name, variants_field)
+    except Exception:
+        logger.exception(
+            "Generating image variants failed for %s %s", model._meta.label, pk
+        )
+    finally:
+        connections.close_all()
+
+
+def needs_variants(instance, field_name, variants_field):
+    """
+    Return True if the stored variants do not belong to the instance's current image.
+    """
+    name = getattr(instance, field_name).name or None
+    return name != (getattr(instance, variants_field) or {}).get("source")
+
+
+def sync_image_variants(instance, field_name, variants_field):
+    """
+    Schedule variant generation after commit if the instance's image changed.
+
+    Meant to be called from a post_save handler. Does nothing if the variants are current.
+
+    Args:
+        instance (Model): The saved instance.
+        field_name (str): Name of the ImageField.
+        variants_field (str): Name of the JSONField holding the variant names.
+    """
+    if not needs_variants(instance, field_name, variants_field):
+        return
+
+    args = (type(instance), instance.pk, field_name, variants_field)
+
+    def run():
+        if getattr(settings, "IMAGE_PROCESSING_SYNC", False):
+            process_variants(*args)
+        else:
+            _get_executor().submit(_process_in_background, *args)
+
+    transaction.on_commit(run)
+
+
+class ProcessedImageField(serializers.ImageField):
+    """
+    ImageField that validates uploads and strips their metadata (see sanitize_image).
+    """
+
+    def to_internal_value(self, data):
+        return sanitize_image(super().to_internal_value(data))
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only field exposing the variant URLs stored in a variants JSONField.
+
+    Represented as {"thumb": {"webp": url, "jpeg": url}, "card": {...}, "full": {...}},
+    or None while no variants exist yet (clients fall back to the original image).
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def _url(self, name):
+        url = default_storage.url(name)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        return {
+            variant: {key: self._url(name) for key, name in formats.items()}
+            for variant, formats in value.items()
+            if variant != "source"
+        }
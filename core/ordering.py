@@ -0,0 +1,40 @@
+from rest_framework.exceptions import ParseError
+
+"""
+Whitelisted, deterministic ordering for the list APIs.
+
+Views declare the sort keys clients may use (each one backed by an index ending in `id`);
+resolve_ordering turns the `ordering` query parameter into order_by() arguments with an
+`id` tie-breaker in the same direction, so the order is total and pagination never repeats
+or skips rows.
+"""
+
+
+def resolve_ordering(value, allowed, default):
+    """
+    Translate an `ordering` query parameter into order_by() arguments.
+
+    Args:
+        value (str | None): Requested sort key, optionally prefixed with '-' for descending.
+        allowed (Iterable[str]): Declared sort keys.
+        default (Sequence[str]): order_by() arguments used when no ordering is requested.
+
+    Raises:
+        ParseError: If the requested key is not one of the allowed keys.
+
+    Returns:
+        tuple[str, ...]: The order_by() arguments.
+    """
+    if not value:
+        return tuple(default)
+
+    descending = value.startswith("-")
+    field = value[1:] if descending else value
+    if field not in allowed:
+        raise ParseError(
+            f"Invalid ordering '{value}'. Allowed: {', '.join(allowed)} "
+            "(prefix with '-' for descending)."
+        )
+
+    prefix = "-" if descending else ""
+    return (f"{prefix}{field}", f"{prefix}id")
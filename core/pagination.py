@@ -0,0 +1,308 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+"""
+Shared pagination building blocks for the list APIs.
+
+This module defines:
+- KeysetPagination: Cursor pagination that seeks on (ordering field, id) instead of using OFFSET,
+  so every page costs the same regardless of its depth and no COUNT(*) is run.
+- SelectablePaginationMixin: Lets clients opt into keyset pagination per request
+  (`?pagination=cursor` or a `cursor` parameter) while page-number pagination stays the default.
+- StandardResultsSetPagination: A PageNumberPagination subclass with configurable page size parameters
+  that can be switched to keyset (cursor) pagination per request.
+- OptionalResultsSetPagination: Same as StandardResultsSetPagination, but only paginates when the
+  request asks for it, so existing clients keep receiving the plain list.
+"""
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a stable ordering of (field, id).
+
+    The ordering field is taken from the `ordering` query parameter (e.g. '-updated_at') and must be
+    one of the view's `keyset_ordering_fields`; `id` is always used as tie-breaker in the same direction.
+    Cursors are opaque, URL-safe tokens holding the boundary row's ordering value and id.
+
+    Attributes:
+        cursor_query_param (str): Query parameter carrying the cursor (default='cursor').
+        page_size (int): Default number of items per page (default=2).
+        page_size_query_param (str): Query parameter to adjust page size (default='page_size').
+        max_page_size (int): Maximum allowable page size (default=1000).
+        ordering (str): Ordering used when the client does not send one (default='-created_at').
+        ordering_query_param (str): Query parameter selecting the ordering (default='ordering').
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 2
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    ordering = "-created_at"
+    ordering_query_param = "ordering"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return one page of rows located after (or before) the requested cursor.
+
+        Fetches page_size + 1 rows to detect whether another page exists.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(request, view)
+
+        cursor = self.decode_cursor(request, queryset.model)
+        self.reverse = bool(cursor and cursor["r"])
+
+        # Walking backwards means scanning the ordering in the opposite direction
+        descending = self.descending != self.reverse
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{self.field}", f"{prefix}id")
+
+        if cursor is not None:
+            op = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{self.field}__{op}": cursor["v"]})
+                | Q(**{self.field: cursor["v"], f"id__{op}": cursor["p"]})
+            )
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        """
+        Return the page size requested by the client, capped at max_page_size.
+        """
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, request, view):
+        """
+        Resolve the keyset ordering field and direction for this request.
+
+        Raises:
+            ParseError: If the requested field is not a declared keyset ordering field.
+
+        Returns:
+            tuple[str, bool]: Field name and whether the ordering is descending.
+        """
+        ordering = request.query_params.get(self.ordering_query_param) or self.ordering
+        field = ordering.lstrip("-")
+        allowed = getattr(view, "keyset_ordering_fields", (self.ordering.lstrip("-"),))
+
+        if field not in allowed:
+            raise ParseError(
+                f"Cursor pagination supports ordering by: {', '.join(allowed)}."
+            )
+        return field, ordering.startswith("-")
+
+    def decode_cursor(self, request, model):
+        """
+        Decode the cursor query parameter.
+
+        The ordering value is converted with the model field's to_python(), so a tampered cursor
+        cannot reach the database filter with a value of the wrong type.
+
+        Args:
+            request: The current request.
+            model: Model class of the paginated queryset.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+
+        Returns:
+            dict | None: Cursor with value 'v', id 'p' and reverse flag 'r', or None on the first page.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            value = model._meta.get_field(self.field).to_python(payload["v"])
+            if value is None:
+                raise ValueError("The cursor has no ordering value.")
+            return {
+                "v": value,
+                "p": int(payload["p"]),
+                "r": bool(payload.get("r")),
+            }
+        except (TypeError, ValueError, KeyError, AttributeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, row, reverse):
+        """
+        Build the absolute URL pointing at the page next to the given boundary row.
+
+        Rows are model instances or values() dicts (see core.fastpath).
+        """
+        if isinstance(row, dict):
+            value, pk = row[self.field], row["id"]
+        else:
+            value, pk = getattr(row, self.field), row.pk
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, Decimal):
+            value = str(value)
+
+        payload = {"v": value, "p": pk}
+        if reverse:
+            payload["r"] = 1
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        ).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class SelectablePaginationMixin:
+    """
+    Mixin for page-number paginators that lets a request switch to keyset pagination.
+
+    Keyset mode is selected by `?pagination=cursor` or by sending a `cursor` parameter
+    (which is what the `next`/`previous` links of a keyset page contain).
+
+    Attributes:
+        keyset_class (type): Paginator used in keyset mode (default=KeysetPagination).
+        pagination_mode_query_param (str): Query parameter selecting the mode (default='pagination').
+        require_explicit_pagination (bool): If True, requests without any pagination parameter
+            receive the full, unpaginated list (keeps endpoints that were never paginated compatible).
+    """
+
+    keyset_class = KeysetPagination
+    pagination_mode_query_param = "pagination"
+    require_explicit_pagination = False
+
+    def wants_keyset(self, request):
+        """
+        Return True if the client asked for keyset pagination on this request.
+        """
+        return (
+            request.query_params.get(self.pagination_mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def wants_pagination(self, request):
+        """
+        Return True if the request carries any pagination parameter.
+        """
+        params = (
+            self.page_query_param,
+            self.page_size_query_param,
+            self.pagination_mode_query_param,
+            self.keyset_class.cursor_query_param,
+        )
+        return any(param in request.query_params for param in params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.wants_keyset(request):
+            self.keyset = self.keyset_class()
+            self.keyset.page_size = self.page_size
+            self.keyset.page_size_query_param = self.page_size_query_param
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        if self.require_explicit_pagination and not self.wants_pagination(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class StandardResultsSetPagination(SelectablePaginationMixin, PageNumberPagination):
+    """
+    Provides pagination using page number style with default and maximum limits.
+
+    Attributes:
+        page_size (int): Default number of items per page (default=2).
+        page_size_query_param (str): Query parameter to adjust page size (default='page_size').
+        max_page_size (int): Maximum allowable page size (default=1000).
+
+    Keyset mode:
+        Send `?pagination=cursor` to receive {next, previous, results} pages that seek on the
+        view's `keyset_ordering_fields` plus id instead of using COUNT(*) and OFFSET.
+
+    Usage:
+        Add StandardResultsSetPagination to a view or viewset's pagination_class to enable.
+    """
+
+    page_size = 2
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class OptionalResultsSetPagination(StandardResultsSetPagination):
+    """
+    Opt-in variant of StandardResultsSetPagination.
+
+    Requests without `page`, `page_size`, `pagination` or `cursor` parameters are not paginated.
+    """
+
+    require_explicit_pagination = True
@@ -0,0 +1,98 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ParseError
+
+"""
+Parsing of list and export query parameters.
+
+Every helper treats a missing or empty parameter as "not given" and raises ParseError (HTTP 400)
+with the parameter name for invalid values, so filters never silently ignore a typo.
+
+Functions:
+    choice_param: A parameter restricted to a set of values.
+    int_param: An integer parameter with a lower bound (positive by default, for ids).
+    datetime_param: An ISO 8601 datetime or date parameter.
+    filter_created_range: Apply `created_after` / `created_before` to a queryset.
+"""
+
+
+def choice_param(params, name, choices):
+    """
+    Return a query parameter restricted to choices, or None if it is missing or empty.
+
+    Raises:
+        ParseError: If the value is not one of the choices.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    if value not in choices:
+        raise ParseError(f"`{name}` must be one of: {', '.join(choices)}.")
+    return value
+
+
+def int_param(params, name, minimum=1):
+    """
+    Return an integer query parameter of at least minimum, or None if it is missing or empty.
+
+    The default minimum of 1 suits ids; filters on amounts pass minimum=0.
+
+    Raises:
+        ParseError: If the value is not an integer of at least minimum.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    if not value.isdigit() or int(value) < minimum:
+        if minimum == 1:
+            raise ParseError(f"`{name}` must be a positive integer.")
+        raise ParseError(f"`{name}` must be an integer of at least {minimum}.")
+    return int(value)
+
+
+def datetime_param(params, name):
+    """
+    Return an ISO 8601 datetime query parameter, or None if it is missing or empty.
+
+    A plain date means midnight. Naive values are interpreted in the current time zone.
+
+    Raises:
+        ParseError: If the value is neither an ISO 8601 datetime nor a date.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        # A '+' of the UTC offset arrives as a space when the client did not encode it
+        parsed = parse_datetime(value.replace(" ", "+"))
+        if parsed is None:
+            day = parse_date(value)
+            parsed = datetime.combine(day, time.min) if day is not None else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ParseError(f"`{name}` must be an ISO 8601 datetime or date.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def filter_created_range(queryset, params, field="created_at"):
+    """
+    Restrict a queryset to rows created in [created_after, created_before).
+
+    Both bounds are optional ISO 8601 datetimes or dates, so a month is selected with
+    `created_after=2026-09-01&created_before=2026-10-01`.
+
+    Raises:
+        ParseError: If a bound is invalid.
+    """
+    created_after = datetime_param(params, "created_after")
+    if created_after is not None:
+        queryset = queryset.filter(**{f"{field}__gte": created_after})
+    created_before = datetime_param(params, "created_before")
+    if created_before is not None:
+        queryset = queryset.filter(**{f"{field}__lt": created_before})
+    return queryset
@@ -1,7 +1,8 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from orders_app.models import Order
 from rest_framework.exceptions import NotFound
 
+from core.identitymap import get_identity_map
+
 """
 Custom permission classes for the Orders and Offers APIs.
 
@@ -9,6 +10,10 @@ This module defines several permission checks that enforce:
 - Read-only access for all users on safe HTTP methods.
 - Role-based access control for customers, reviewers, business users, and staff.
 - Object-level permissions to ensure only the rightful owners or designated users may modify or delete resources.
+
+Ownership checks compare foreign key columns (e.g. obj.business_user_id) with request.user.pk, so they
+do not load the related user. Objects needed in has_permission() are loaded through the request's
+identity map (core.identitymap) and shared with the view's get_object().
 """
 
 
@@ -74,7 +79,7 @@ class IsReviewer(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
-        return obj.reviewer == request.user
+        return obj.reviewer_id == request.user.pk
 
 
 class IsBusinessOrReadOnly(BasePermission):
@@ -110,6 +115,7 @@ class IsBusinessForUpdateOrAdminForDelete(BasePermission):
         """
         Permit safe (read-only) HTTP methods for any request.
         Verify that the Order exists for write operations, raising NotFound if missing.
+        The Order is loaded through the identity map, so the view's get_object() reuses it.
         Allow PUT/PATCH only for authenticated business users.
         Allow DELETE only for authenticated staff users.
 
@@ -130,7 +136,7 @@ class IsBusinessForUpdateOrAdminForDelete(BasePermission):
         pk = view.kwargs.get(view.lookup_url_kwarg or "pk")
 
         # Ensure the target Order exists, or raise 404
-        if not Order.objects.filter(pk=pk).exists():
+        if get_identity_map(request).get(view.get_queryset(), pk) is None:
             raise NotFound(detail="Order not found.")
 
         # Allow update operations only for business users
@@ -186,4 +192,4 @@ class IsOfferOwner(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
-        return obj.business_user == request.user
+        return obj.business_user_id == request.user.pk
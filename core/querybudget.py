@@ -0,0 +1,109 @@
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+"""
+Per-request SQL query budgets.
+
+Views declare how many queries a request may run, either as a class attribute
+(`query_budget = 3`, or per method: `query_budget = {"GET": 3, "POST": 6}`) or with the
+@query_budget decorator on function-based views. QueryBudgetMiddleware counts the queries
+of every request and reacts when a view exceeds its budget:
+
+    - QUERY_BUDGET_RAISE = True: raise QueryBudgetExceeded (defaults to DEBUG).
+    - otherwise: log a warning on the 'core.querybudget' logger.
+
+In DEBUG mode every response carries an 'X-Query-Count' header (plus 'X-Query-Budget' when
+the view declares one).
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised when a request runs more SQL queries than its view's declared budget.
+    """
+
+
+def query_budget(budget):
+    """
+    Decorator declaring the query budget of a function-based view.
+
+    Args:
+        budget (int | dict[str, int]): Maximum number of queries, optionally per HTTP method.
+    """
+
+    def decorator(view_func):
+        view_func.query_budget = budget
+        return view_func
+
+    return decorator
+
+
+def get_view_budget(view_func, method):
+    """
+    Resolve the query budget declared for a view and HTTP method.
+
+    Returns:
+        int | None: The budget, or None if the view declares none.
+    """
+    budget = getattr(view_func, "query_budget", None)
+    if budget is None:
+        budget = getattr(getattr(view_func, "view_class", None), "query_budget", None)
+    if isinstance(budget, dict):
+        budget = budget.get(method)
+    return budget
+
+
+class QueryCounter:
+    """
+    Database execute wrapper counting the queries run through it.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryBudgetMiddleware:
+    """
+    Count the SQL queries of each request and enforce the view's declared budget.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        request.query_budget = None
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+
+        budget = request.query_budget
+        if budget is not None and counter.count > budget:
+            message = (
+                f"{request.method} {request.path} ran {counter.count} queries "
+                f"(budget: {budget})."
+            )
+            if getattr(settings, "QUERY_BUDGET_RAISE", settings.DEBUG):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        if settings.DEBUG:
+            response["X-Query-Count"] = str(counter.count)
+            if budget is not None:
+                response["X-Query-Budget"] = str(budget)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = get_view_budget(view_func, request.method)
@@ -73,6 +73,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.querybudget.QueryBudgetMiddleware",
+    "core.identitymap.IdentityMapMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -114,6 +116,37 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Multi-worker deployments need a shared backend (e.g. Redis) so cache versions are shared.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+    }
+}
+
+# Lifetime in seconds of cached public offer responses
+OFFER_CACHE_TIMEOUT = int(os.environ.get("OFFER_CACHE_TIMEOUT", "300"))
+
+# Idempotency-Key handling of the create endpoints (see core/idempotency.py)
+IDEMPOTENCY_KEY_TTL = int(os.environ.get("IDEMPOTENCY_KEY_TTL", str(24 * 60 * 60)))
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.environ.get("IDEMPOTENCY_LOCK_TIMEOUT", "30"))
+IDEMPOTENCY_WAIT = float(os.environ.get("IDEMPOTENCY_WAIT", "5"))
+
+# Age in days after which finished orders are moved to the archive (see orders_app/archive.py)
+ORDER_ARCHIVE_AFTER_DAYS = int(os.environ.get("ORDER_ARCHIVE_AFTER_DAYS", "180"))
+
+
+# Query budgets
+# Raise instead of logging when a view exceeds its declared query budget (see core/querybudget.py)
+
+QUERY_BUDGET_RAISE = os.environ.get("QUERY_BUDGET_RAISE", str(DEBUG)) == "True"
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -165,6 +198,29 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
         "rest_framework.authentication.BasicAuthentication",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.fastjson.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.fastjson.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
+# JSON encoding backend of the API: 'auto' (orjson if installed), 'orjson' or 'stdlib'
+# (see core/fastjson.py)
+JSON_BACKEND = os.environ.get("JSON_BACKEND", "auto")
+
 AUTH_USER_MODEL = "authentication_app.User"
+
+
+# Image processing
+# Variants of uploaded images are generated in background threads (see core/images.py)
+
+IMAGE_MAX_UPLOAD_SIZE = int(
+    os.environ.get("IMAGE_MAX_UPLOAD_SIZE", str(10 * 1024 * 1024))
+)
+IMAGE_PROCESSING_WORKERS = int(os.environ.get("IMAGE_PROCESSING_WORKERS", "2"))
+IMAGE_PROCESSING_SYNC = os.environ.get("IMAGE_PROCESSING_SYNC", "False") == "True"
@@ -0,0 +1,184 @@
+import csv
+import json
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ParseError
+
+from core.fastjson import dumps
+
+"""
+Helpers for streaming NDJSON (newline-delimited JSON) imports and NDJSON / CSV exports.
+
+Both directions work on iterators, so memory use stays flat regardless of the number of rows:
+imports read the request body (or a file) line by line, exports render rows from a
+QuerySet.iterator() into a StreamingHttpResponse.
+
+This module defines:
+- iter_ndjson: Parse NDJSON lines into (line number, value, error) tuples.
+- chunked: Group an iterable into lists of a fixed size.
+- ndjson_lines: Render dicts as NDJSON text, several lines per yielded chunk.
+- ndjson_response: Wrap rendered NDJSON chunks in a StreamingHttpResponse.
+- csv_lines: Render dicts as CSV text with a header row, several lines per yielded chunk.
+- export_format_param: Read the export format (`output` query parameter).
+- export_response: Stream rows as NDJSON or CSV, depending on the export format.
+"""
+
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+CSV_CONTENT_TYPE = "text/csv; charset=utf-8"
+
+# Export formats, selected with `?output=` (`format` is taken by DRF's content negotiation)
+EXPORT_FORMATS = ("csv", "ndjson")
+
+# Leading characters spreadsheet applications evaluate as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def iter_ndjson(lines):
+    """
+    Parse NDJSON lines, skipping blank ones.
+
+    Args:
+        lines (Iterable[bytes | str]): Raw lines, e.g. an open file or a request body.
+
+    Yields:
+        tuple[int, Any, str | None]: 1-based line number, parsed value (None on error),
+        and an error message (None if the line parsed).
+    """
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode("utf-8")
+            except UnicodeDecodeError:
+                yield number, None, "Line is not valid UTF-8."
+                continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield number, json.loads(line), None
+        except ValueError as exc:
+            yield number, None, f"Invalid JSON: {exc}"
+
+
+def chunked(iterable, size):
+    """
+    Yield lists of up to `size` consecutive items of an iterable.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def ndjson_lines(items, lines_per_chunk=100):
+    """
+    Render dicts as NDJSON text.
+
+    Values are encoded like DRF responses (datetimes, decimals, UUIDs, ...), see core.fastjson.
+
+    Args:
+        items (Iterable[dict]): Rows to render.
+        lines_per_chunk (int): Number of lines joined into one yielded string.
+
+    Yields:
+        str: One or more complete NDJSON lines.
+    """
+    for chunk in chunked(items, lines_per_chunk):
+        yield b"".join(dumps(item) + b"\n" for item in chunk).decode("utf-8")
+
+
+def ndjson_response(chunks, filename=None):
+    """
+    Build a streaming NDJSON response.
+
+    Args:
+        chunks (Iterable[str]): Rendered NDJSON, e.g. from ndjson_lines().
+        filename (str, optional): Suggested download file name.
+
+    Returns:
+        StreamingHttpResponse: The response streaming the chunks.
+    """
+    response = StreamingHttpResponse(chunks, content_type=NDJSON_CONTENT_TYPE)
+    if filename:
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+class _Echo:
+    """
+    File-like object returning what is written, so csv.writer renders single rows to strings.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return dumps(value).decode("utf-8")
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        # Keep user text from being run as a formula when the file is opened in a spreadsheet
+        return f"'{value}"
+    return value
+
+
+def csv_lines(items, fields, lines_per_chunk=100):
+    """
+    Render dicts as CSV text, starting with a header row.
+
+    Missing keys and None become empty cells, lists and dicts are JSON encoded, and text
+    starting with a formula character is prefixed with an apostrophe.
+
+    Args:
+        items (Iterable[dict]): Rows to render.
+        fields (list[str]): Column names, in order.
+        lines_per_chunk (int): Number of rows joined into one yielded string.
+
+    Yields:
+        str: The header row, then one or more complete CSV rows.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for chunk in chunked(items, lines_per_chunk):
+        yield "".join(
+            writer.writerow([_csv_cell(item.get(field)) for field in fields])
+            for item in chunk
+        )
+
+
+def export_format_param(params):
+    """
+    Return the export format requested with `?output=` ('csv' or 'ndjson', default 'csv').
+
+    Raises:
+        ParseError: If the format is not supported.
+    """
+    export_format = params.get("output") or "csv"
+    if export_format not in EXPORT_FORMATS:
+        raise ParseError(f"`output` must be one of: {', '.join(EXPORT_FORMATS)}.")
+    return export_format
+
+
+def export_response(items, fields, export_format, basename):
+    """
+    Build a streaming export response.
+
+    Args:
+        items (Iterable[dict]): Rows to export, typically read with QuerySet.iterator().
+        fields (list[str]): CSV columns, in order (NDJSON lines keep the keys of each row).
+        export_format (str): 'csv' or 'ndjson'.
+        basename (str): Download file name without extension.
+
+    Returns:
+        StreamingHttpResponse: The response streaming the rendered rows.
+    """
+    if export_format == "ndjson":
+        return ndjson_response(ndjson_lines(items), filename=f"{basename}.ndjson")
+    response = StreamingHttpResponse(
+        csv_lines(items, fields), content_type=CSV_CONTENT_TYPE
+    )
+    response["Content-Disposition"] = f'attachment; filename="{basename}.csv"'
+    return response
@@ -0,0 +1,106 @@
+import re
+
+from django.db import connection
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.fastpath import compile_serializer
+
+"""
+Shared assertions for the apps' test suites.
+
+This module defines:
+- QueryPlanAssertionsMixin: Asserts via EXPLAIN that a queryset is served (and ordered) by an index.
+- QueryCountAssertionsMixin: Pins the number of SQL queries of an API request.
+- CompiledSerializerAssertionsMixin: Compares the compiled read path with the serializer it replaces.
+"""
+
+
+class QueryPlanAssertionsMixin:
+    """
+    TestCase mixin with assertions on database query plans (SQLite EXPLAIN QUERY PLAN output).
+    """
+
+    def assertUsesIndex(self, queryset, index_name=None):
+        """
+        Assert that every table access in the queryset's plan goes through an index.
+
+        Args:
+            queryset (QuerySet): The query to explain.
+            index_name (str, optional): Index that must appear in the plan.
+        """
+        if connection.vendor != "sqlite":
+            self.skipTest("Query plan assertions are written for SQLite.")
+
+        plan = queryset.explain()
+        full_scans = [
+            line
+            for line in plan.splitlines()
+            if re.search(r"\bSCAN \w+$", line.strip())
+        ]
+        self.assertFalse(full_scans, f"Full table scan in plan:\n{plan}")
+        self.assertRegex(plan, r"USING (COVERING )?INDEX|MULTI-INDEX OR")
+        if index_name:
+            self.assertIn(index_name, plan)
+
+    def assertOrderedByIndex(self, queryset, index_name=None):
+        """
+        Assert that the queryset is read through an index in its ORDER BY order, without sorting.
+
+        Args:
+            queryset (QuerySet): The ordered query to explain.
+            index_name (str, optional): Index that must appear in the plan.
+        """
+        self.assertUsesIndex(queryset, index_name)
+        plan = queryset.explain()
+        self.assertNotIn("TEMP B-TREE", plan, f"Sort step in plan:\n{plan}")
+
+
+class QueryCountAssertionsMixin:
+    """
+    TestCase mixin pinning the number of SQL queries an API request runs.
+    """
+
+    def assertQueryCount(self, expected, client, method, url, **kwargs):
+        """
+        Assert that a request runs exactly the expected number of queries and succeeds.
+
+        Args:
+            expected (int): Expected number of queries.
+            client (APIClient): Client used to send the request.
+            method (str): HTTP method name, e.g. 'get'.
+            url (str): Request URL.
+            **kwargs: Passed on to the client method (data, format, ...).
+
+        Returns:
+            Response: The response of the request.
+        """
+        with self.assertNumQueries(expected):
+            response = getattr(client, method)(url, **kwargs)
+        self.assertLess(response.status_code, 400, getattr(response, "data", None))
+        return response
+
+
+class CompiledSerializerAssertionsMixin:
+    """
+    TestCase mixin checking that core.fastpath renders exactly what the serializer renders.
+    """
+
+    def assertCompiledMatches(self, serializer_class, queryset, **kwargs):
+        """
+        Assert that the compiled read path renders the same JSON bytes as the serializer.
+
+        Args:
+            serializer_class (type[Serializer]): The serializer to compile.
+            queryset (QuerySet): Rows to render with both paths.
+            **kwargs: Passed on to the serializer (e.g. sparse `fields` / `omit`).
+        """
+        request = Request(APIRequestFactory().get("/"))
+        context = {"request": request}
+        expected = serializer_class(queryset, many=True, context=context, **kwargs).data
+        compiled = compile_serializer(serializer_class(context=context, **kwargs))
+        actual = compiled.serialize(compiled.values(queryset))
+
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(actual), renderer.render(expected))
@@ -0,0 +1,192 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.api.views import BaseInfos
+from authentication_app.models import User
+from core.fastjson import FastJSONParser, FastJSONRenderer
+from core.identitymap import IdentityMap
+from core.params import datetime_param
+from core.querybudget import QueryBudgetExceeded
+from core.streaming import csv_lines
+from core.testing import QueryCountAssertionsMixin
+from profile_app.models import Profile
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class QueryBudgetTests(QueryCountAssertionsMixin, TestCase):
+    """
+    The query budget middleware counts queries and enforces declared budgets.
+    """
+
+    def test_base_info(self):
+        self.assertQueryCount(4, APIClient(), "get", "/api/base-info/")
+
+    def test_exceeding_budget_raises(self):
+        budget = BaseInfos.query_budget
+        BaseInfos.query_budget = {"GET": 1}
+        try:
+            with self.assertRaises(QueryBudgetExceeded):
+                APIClient().get("/api/base-info/")
+        finally:
+            BaseInfos.query_budget = budget
+
+    @override_settings(QUERY_BUDGET_RAISE=False)
+    def test_exceeding_budget_logs_when_not_raising(self):
+        budget = BaseInfos.query_budget
+        BaseInfos.query_budget = {"GET": 1}
+        try:
+            with self.assertLogs("core.querybudget", level="WARNING"):
+                response = APIClient().get("/api/base-info/")
+        finally:
+            BaseInfos.query_budget = budget
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(DEBUG=True)
+    def test_debug_headers(self):
+        response = APIClient().get("/api/base-info/")
+        self.assertEqual(response["X-Query-Count"], "4")
+        self.assertEqual(response["X-Query-Budget"], "5")
+
+
+class IdentityMapTests(TestCase):
+    """
+    The identity map loads each row once per request and counts the lookups it saved.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner", type="business")
+
+    def test_rows_are_loaded_once(self):
+        identity_map = IdentityMap()
+        with self.assertNumQueries(2):
+            first = identity_map.get(User.objects.all(), str(self.user.pk))
+            second = identity_map.get(User.objects.all(), self.user.pk)
+            missing = identity_map.get(User.objects.all(), self.user.pk + 1)
+            identity_map.get(User.objects.all(), self.user.pk + 1)
+            invalid = identity_map.get(User.objects.all(), "abc")
+
+        self.assertIs(first, second)
+        self.assertIsNone(missing)
+        self.assertIsNone(invalid)
+        self.assertEqual(identity_map.stats(), {"hits": 2, "misses": 2})
+
+    def test_discard_forgets_instance(self):
+        identity_map = IdentityMap()
+        identity_map.get(User.objects.all(), self.user.pk)
+        identity_map.discard(User, self.user.pk)
+
+        with self.assertNumQueries(1):
+            identity_map.get(User.objects.all(), self.user.pk)
+
+    @override_settings(DEBUG=True)
+    def test_counters_are_exposed_in_debug(self):
+        profile = Profile.objects.create(user=self.user)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.patch(
+            f"/api/profile/{profile.pk}/", {"location": "Berlin"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # Loaded by the ownership check, reused by get_object()
+        self.assertEqual(response["X-Identity-Map-Misses"], "1")
+        self.assertEqual(response["X-Identity-Map-Hits"], "1")
+
+
+class FastJSONTests(SimpleTestCase):
+    """
+    FastJSONRenderer / FastJSONParser produce exactly what DRF's JSON renderer / parser produce.
+    """
+
+    payload = {
+        "price": Decimal("1234.50"),
+        "prices": [Decimal("0.1"), Decimal("-3"), Decimal("1E+2")],
+        "utc": datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc),
+        "micro": datetime(2026, 10, 18, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        "berlin": datetime(2026, 7, 1, 8, 30, tzinfo=ZoneInfo("Europe/Berlin")),
+        "naive": datetime(2026, 1, 2, 3, 4, 5),
+        "date": date(2026, 10, 18),
+        "time": time(9, 15, 30, 500),
+        "duration": timedelta(days=1, seconds=5),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "lazy": gettext_lazy("Offer"),
+        "text": 'Umlaute äöü, emoji \U0001f600, line\u2028sep\u2029, \x00\x1f\x7f "/\\',
+        "keys": {1: "int", None: "none", True: "bool"},
+        "big": 2**70,
+        "tuple": (1, 2.5, None, False),
+        "empty": [{}, []],
+    }
+
+    def test_renders_like_drf(self):
+        for backend in ("orjson", "stdlib"):
+            with self.subTest(backend=backend), override_settings(JSON_BACKEND=backend):
+                self.assertEqual(
+                    FastJSONRenderer().render(self.payload),
+                    JSONRenderer().render(self.payload),
+                )
+
+    def test_indent_falls_back_to_drf(self):
+        self.assertEqual(
+            FastJSONRenderer().render(self.payload, "application/json; indent=2"),
+            JSONRenderer().render(self.payload, "application/json; indent=2"),
+        )
+
+    def test_parses_like_drf(self):
+        for body in (
+            b'{"a": [1, 2.5, "\\u00e4", null, true], "b": {"c": "x"}}',
+            b"123456789012345678901234567890",
+            '{"title": "Übersetzung"}'.encode("utf-8"),
+        ):
+            with self.subTest(body=body):
+                self.assertEqual(
+                    FastJSONParser().parse(BytesIO(body)),
+                    JSONParser().parse(BytesIO(body)),
+                )
+
+    def test_parse_errors_like_drf(self):
+        for body in (b'{"a": ', b'{"a": NaN}', b"\xff"):
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError) as expected:
+                    JSONParser().parse(BytesIO(body))
+                with self.assertRaises(ParseError) as actual:
+                    FastJSONParser().parse(BytesIO(body))
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+
+class ExportHelperTests(SimpleTestCase):
+    """
+    CSV rendering and query parameter parsing used by the streaming exports.
+    """
+
+    def test_csv_lines_render_header_and_chunks(self):
+        rows = [{"id": i, "tags": ["a"], "note": None} for i in range(5)]
+        chunks = list(csv_lines(rows, ["id", "tags", "note"], lines_per_chunk=2))
+
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0], "id,tags,note\r\n")
+        self.assertEqual(chunks[1], '0,"[""a""]",\r\n1,"[""a""]",\r\n')
+
+    @override_settings(TIME_ZONE="Europe/Berlin")
+    def test_datetime_param_accepts_dates_and_offsets(self):
+        self.assertEqual(
+            datetime_param({"since": "2026-09-01"}, "since"),
+            datetime(2026, 8, 31, 22, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            datetime_param({"since": "2026-09-01T10:00:00 02:00"}, "since"),
+            datetime(2026, 9, 1, 8, tzinfo=timezone.utc),
+        )
+        self.assertIsNone(datetime_param({"since": ""}, "since"))
+        with self.assertRaises(ParseError):
+            datetime_param({"since": "2026-02-30"}, "since")
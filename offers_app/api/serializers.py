@@ -1,6 +1,12 @@
+from django.db import transaction
 from rest_framework import serializers
 from offers_app.models import Offer, OfferDetail
+from offers_app.search import index_offers
+from offers_app.signals import deferred_offer_refresh, refresh_offer_derived_data
 from authentication_app.models import User
+from core.fieldsets import SparseFieldsetSerializerMixin
+from core.images import ImageVariantsField, ProcessedImageField
+from reviews_app.api.serializers import BusinessRatingSummarySerializer
 
 """
 Serializers for the offers_app, handling representation and validation of Offer and OfferDetail models.
@@ -10,6 +16,7 @@ Classes:
     OfferDetailSerializer: Provides hyperlink to individual OfferDetail instances.
     OfferSingleDetailSerializer: Detailed representation for creating/updating OfferDetail entries.
     OfferSerializer: Main serializer for Offer model, including nested details, price and delivery summaries.
+    OfferExportSerializer: Flat representation of an Offer with its details for NDJSON exports.
 """
 
 
@@ -52,7 +59,7 @@ class OfferSingleDetailSerializer(serializers.ModelSerializer):
     Validates presence of offer_type and exposes all relevant fields.
 
     Fields:
-        id (int): Detail primary key (read-only on update).
+        id (int): Detail primary key; optional on update to address an existing detail.
         title (str): Title of this detail.
         revisions (int): Number of allowed revisions.
         delivery_time_in_days (int): Estimated delivery time.
@@ -61,6 +68,7 @@ class OfferSingleDetailSerializer(serializers.ModelSerializer):
         offer_type (str): Required type identifier for the detail.
     """
 
+    id = serializers.IntegerField(required=False)
     offer_type = serializers.CharField(required=True)
 
     class Meta:
@@ -76,21 +84,29 @@ class OfferSingleDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class OfferSerializer(serializers.ModelSerializer):
+class OfferSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Main serializer for Offer model with nested details and summary fields.
 
-    - Allows creation and update of nested OfferDetail objects.
-    - Computes min_price and min_delivery_time across details.
+    - Allows creation and update of nested OfferDetail objects with bulk, diff-based writes.
+    - Exposes the denormalized min_price and min_delivery_time across details.
     - Exposes business_user id and nested user_details for convenience.
+    - Exposes the business user's rating summary (business_rating; None without reviews).
+    - Sanitizes uploaded images and exposes the URLs of their resized variants (image_variants).
+    - Accepts `fields` / `omit` keyword arguments for sparse fieldsets (see core.fieldsets).
     """
 
     details = OfferSingleDetailSerializer(many=True)
     user = serializers.IntegerField(source="business_user.id", read_only=True)
     business_user = serializers.PrimaryKeyRelatedField(read_only=True)
     user_details = UserDetailsSerializer(source="business_user", read_only=True)
+    business_rating = BusinessRatingSummarySerializer(
+        source="business_user.rating_summary", read_only=True, allow_null=True
+    )
     min_price = serializers.IntegerField(read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
+    image = ProcessedImageField(required=False, allow_null=True)
+    image_variants = ImageVariantsField()
 
     class Meta:
         model = Offer
@@ -102,16 +118,20 @@ class OfferSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "image",
+            "image_variants",
             "business_user",
             "details",
             "min_price",
             "min_delivery_time",
             "user_details",
+            "business_rating",
         ]
 
     def create(self, validated_data):
         """
-        Create an Offer instance and nested OfferDetail objects from validated data.
+        Create an Offer instance and its nested OfferDetail objects in one transaction.
+
+        Details are inserted with a single bulk_create.
 
         Args:
             validated_data (dict): Contains 'details' list and other Offer fields.
@@ -120,37 +140,140 @@ class OfferSerializer(serializers.ModelSerializer):
             Offer: Newly created Offer with associated details.
         """
         details_data = validated_data.pop("details", [])
-        offer = Offer.objects.create(**validated_data)
-        for detail in details_data:
-            OfferDetail.objects.create(offer=offer, **detail)
+
+        with transaction.atomic():
+            offer = Offer.objects.create(**validated_data)
+            OfferDetail.objects.bulk_create(
+                [self._build_detail(offer, detail) for detail in details_data]
+            )
+            refresh_offer_derived_data([offer.pk])
+
+        offer.refresh_from_db(fields=["min_price", "min_delivery_time", "updated_at"])
         return offer
 
     def update(self, instance, validated_data):
         """
-        Update an Offer instance and replace nested OfferDetail objects if provided.
+        Update an Offer instance and apply the changes of nested OfferDetail objects if provided.
+
+        Submitted details are matched to existing ones by 'id', or else by 'offer_type'.
+        Only details whose values differ are written (one bulk_update), unmatched details are
+        inserted (one bulk_create). On a full update (PUT), existing details missing from the
+        payload are deleted, unless orders were placed on them (400, the delete would cascade to
+        the orders); a partial update (PATCH) leaves them untouched. The offer summary,
+        search index and cache are refreshed once for the whole write, not per detail row.
 
         Args:
             instance (Offer): The existing Offer instance.
             validated_data (dict): May include 'details' and other Offer fields.
 
+        Raises:
+            serializers.ValidationError: If a detail 'id' does not belong to this offer, or a
+                detail with orders would be deleted.
+
         Returns:
             Offer: Updated Offer instance.
         """
         details_data = validated_data.pop("details", None)
 
-        # Update Offer fields
-        for attr, val in validated_data.items():
-            setattr(instance, attr, val)
-        instance.save()
+        with transaction.atomic():
+            # Per-row handlers are deferred, the offer is refreshed once below
+            with deferred_offer_refresh():
+                for attr, val in validated_data.items():
+                    setattr(instance, attr, val)
+                instance.save()
+                details_changed = details_data is not None and self._sync_details(
+                    instance, details_data, prune=not self.partial
+                )
 
-        # If details provided, replace existing relations
-        if details_data is not None:
-            instance.details.all().delete()
-            for detail in details_data:
-                OfferDetail.objects.create(offer=instance, **detail)
+            if details_changed:
+                refresh_offer_derived_data([instance.pk])
+                instance.refresh_from_db(
+                    fields=["min_price", "min_delivery_time", "updated_at"]
+                )
+            else:
+                index_offers([instance.pk])
 
         return instance
 
+    def _build_detail(self, offer, data):
+        """
+        Build an unsaved OfferDetail for the offer from validated detail data.
+        """
+        data = {field: value for field, value in data.items() if field != "id"}
+        return OfferDetail(offer=offer, **data)
+
+    def _sync_details(self, offer, details_data, prune):
+        """
+        Diff submitted details against the offer's stored details and write only the changes.
+
+        Args:
+            offer (Offer): Offer whose details are updated.
+            details_data (list[dict]): Validated detail data.
+            prune (bool): Delete stored details that were not submitted.
+
+        Returns:
+            bool: True if any detail row was inserted, updated, or deleted.
+        """
+        existing = list(offer.details.all())
+        by_id = {detail.pk: detail for detail in existing}
+        by_type = {detail.offer_type: detail for detail in existing}
+
+        matched, to_create, to_update, changed_fields = set(), [], [], set()
+        for data in details_data:
+            detail_id = data.get("id")
+            if detail_id is not None and detail_id not in by_id:
+                raise serializers.ValidationError(
+                    {
+                        "details": f"Offer detail {detail_id} does not belong to this offer."
+                    }
+                )
+
+            detail = by_id.get(detail_id) or by_type.get(data["offer_type"])
+            if detail is None or detail.pk in matched:
+                to_create.append(self._build_detail(offer, data))
+                continue
+
+            matched.add(detail.pk)
+            fields = [
+                field
+                for field, value in data.items()
+                if field != "id" and getattr(detail, field) != value
+            ]
+            if fields:
+                for field in fields:
+                    setattr(detail, field, data[field])
+                to_update.append(detail)
+                changed_fields.update(fields)
+
+        stale = (
+            [detail.pk for detail in existing if detail.pk not in matched]
+            if prune
+            else []
+        )
+        if stale:
+            # Deleting a detail would cascade to the orders placed on it
+            ordered = sorted(
+                OfferDetail.objects.filter(pk__in=stale, order_details__isnull=False)
+                .values_list("pk", flat=True)
+                .distinct()
+            )
+            if ordered:
+                raise serializers.ValidationError(
+                    {
+                        "details": "Offer details with orders cannot be removed: "
+                        f"{', '.join(map(str, ordered))}."
+                    }
+                )
+
+        if to_update:
+            OfferDetail.objects.bulk_update(to_update, sorted(changed_fields))
+        if to_create:
+            OfferDetail.objects.bulk_create(to_create)
+        if stale:
+            OfferDetail.objects.filter(pk__in=stale).delete()
+
+        return bool(to_update or to_create or stale)
+
     def validate_details(self, value):
         """
         Ensure each detail dict contains the required 'offer_type' field.
@@ -170,3 +293,27 @@ class OfferSerializer(serializers.ModelSerializer):
                     {idx: "This detail is missing the required field 'offer_type'."}
                 )
         return value
+
+
+class OfferExportSerializer(serializers.ModelSerializer):
+    """
+    Read-only representation of an Offer for NDJSON exports.
+
+    The output can be fed back into the NDJSON import: read-only fields (id, timestamps,
+    summaries) are ignored there.
+    """
+
+    details = OfferSingleDetailSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Offer
+        fields = [
+            "id",
+            "title",
+            "description",
+            "created_at",
+            "updated_at",
+            "min_price",
+            "min_delivery_time",
+            "details",
+        ]
@@ -4,6 +4,10 @@ from .views import (
     SingleOfferView,
     OfferDetailView,
     OfferSingleDetailView,
+    OfferCacheStatsView,
+    OfferFacetsView,
+    OfferImportView,
+    OfferExportView,
 )
 
 """
@@ -16,16 +20,33 @@ Endpoints:
     GET, PUT, PATCH, DELETE /api/offers/<pk>/ -> SingleOfferView: Retrieve, update, or delete a specific offer.
     GET /api/offerdetails/                 -> OfferDetailView: Retrieve minimal representations of offer detail entries.
     GET /api/offerdetails/<pk>/            -> OfferSingleDetailView: Retrieve full detail for a specific OfferDetail.
+    GET /api/offers/cache-stats/           -> OfferCacheStatsView: Response cache hit/miss counters (staff only).
+    GET /api/offers/facets/                -> OfferFacetsView: Facet counts for the offer list filters.
+    POST /api/offers/import/               -> OfferImportView: Bulk NDJSON import (business users).
+    GET /api/offers/export/                -> OfferExportView: Streaming NDJSON export.
 
 Naming conventions:
     'offers'              - Base endpoint for offer collection.
     'offer-detail'        - Detail endpoint for individual offers.
     'offerdetails'        - Base endpoint for offer details list.
     'offerdetails-details'- Detail endpoint for individual offer details.
+    'offers-cache-stats'  - Response cache counters.
+    'offers-facets'       - Facet counts of the offer list.
+    'offers-import'       - Bulk NDJSON import.
+    'offers-export'       - Streaming NDJSON export.
 """
 urlpatterns = [
     # List and create offers
     path("offers/", OffersListView.as_view(), name="offers"),
+    # Response cache hit/miss counters
+    path(
+        "offers/cache-stats/", OfferCacheStatsView.as_view(), name="offers-cache-stats"
+    ),
+    # Facet counts for the offer list filters
+    path("offers/facets/", OfferFacetsView.as_view(), name="offers-facets"),
+    # Bulk NDJSON import and streaming export
+    path("offers/import/", OfferImportView.as_view(), name="offers-import"),
+    path("offers/export/", OfferExportView.as_view(), name="offers-export"),
     # Retrieve, update, or delete a specific offer by ID
     path("offers/<int:pk>/", SingleOfferView.as_view(), name="offer-detail"),
     # List minimal offer detail representations
@@ -1,27 +1,50 @@
-from rest_framework import generics, permissions
-from django.db.models import Q, Min
-from rest_framework.exceptions import ParseError, PermissionDenied
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.core.exceptions import ImproperlyConfigured
 from django.shortcuts import get_object_or_404
 
+from core.conditional import (
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+    apply_validators,
+    not_modified_response,
+    validators_from_response,
+)
+from core.fastpath import CompiledListMixin
+from core.fieldsets import SparseFieldsetViewMixin
+from core.idempotency import IdempotencyMixin
+from core.identitymap import IdentityMapMixin
+from core.ordering import resolve_ordering
+from core.pagination import StandardResultsSetPagination
+from core.streaming import ndjson_response
+from offers_app import cache as offer_cache
+from offers_app.bulk import export_offers, import_offers
+from offers_app.facets import compute_facets
 from offers_app.models import Offer, OfferDetail
+from offers_app.filters import filter_offers
 from .serializers import (
     OfferSerializer,
     OfferDetailSerializer,
     OfferSingleDetailSerializer,
 )
-from .pagination import StandardResultsSetPagination
 from core.permissions import IsBusinessOrReadOnly, IsOfferOwner
 
 """
 API views for offers_app: listing, creating, retrieving, updating, and deleting offers and offer details.
 
 Classes:
+    CachedResponseMixin:
+        - Serves anonymous GET requests from the versioned offer response cache.
+
     OffersListView:
-        - GET: List offers with filtering (creator_id, search), ordering, pagination, and annotated fields (min_price, min_delivery_time).
+        - GET responses carry an ETag; matching If-None-Match requests get a 304.
+        - GET: List offers with filtering (creator_id, search), ordering, pagination, and denormalized fields (min_price, min_delivery_time).
         - POST: Create an offer by authenticated business users.
 
     SingleOfferView:
-        - GET: Retrieve a single offer with annotated fields.
+        - GET: Retrieve a single offer with its denormalized summary fields (ETag / Last-Modified).
         - PUT/PATCH: Update an offer (only by authenticated owner via IsOfferOwner).
         - DELETE: Delete an offer (only by business users; enforced in destroy).
 
@@ -30,10 +53,77 @@ Classes:
 
     OfferSingleDetailView:
         - GET: Retrieve full detail fields for an OfferDetail.
+
+    OfferFacetsView:
+        - GET: Facet counts (price, delivery time, offer type) for the OffersListView filters.
+
+    OfferImportView:
+        - POST: Stream an NDJSON body of offers into the catalog of the requesting business user.
+
+    OfferExportView:
+        - GET: Stream the (filtered) offers as NDJSON.
+
+    OfferCacheStatsView:
+        - GET: Hit/miss counters of the offer response cache (staff only).
 """
 
 
-class OffersListView(generics.ListCreateAPIView):
+class CachedResponseMixin:
+    """
+    Serve anonymous GET requests from the versioned offer response cache.
+
+    Cached data is the serialized response body together with its ETag / Last-Modified validators,
+    so hits skip both the database queries and serialization, and conditional requests are answered
+    with a 304 straight from the cache. Entries are invalidated by version bumps on Offer/OfferDetail
+    writes. Responses carry an 'X-Cache: HIT' or 'X-Cache: MISS' header.
+
+    Attributes:
+        cache_key_func (Callable): Required. Builds the cache key from the request and the URL
+            keyword arguments (e.g. offers_app.cache.list_cache_key / detail_cache_key).
+    """
+
+    cache_key_func = None
+
+    def get(self, request, *args, **kwargs):
+        """
+        Return cached data for anonymous requests, populating the cache on a miss.
+        """
+        if self.cache_key_func is None:
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} must set cache_key_func to use CachedResponseMixin."
+            )
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+
+        key = self.cache_key_func(request, **kwargs)
+        entry = offer_cache.get_response(key)
+        if entry is not None:
+            data, validators = entry
+            response = not_modified_response(request, **validators)
+            if response is None:
+                response = apply_validators(
+                    Response(data, status=status.HTTP_200_OK), **validators
+                )
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            offer_cache.set_response(
+                key, response.data, validators_from_response(response)
+            )
+        response["X-Cache"] = "MISS"
+        return response
+
+
+class OffersListView(
+    IdempotencyMixin,
+    CachedResponseMixin,
+    ConditionalListMixin,
+    CompiledListMixin,
+    SparseFieldsetViewMixin,
+    generics.ListCreateAPIView,
+):
     """
     GET: Paginated list of offers with optional filters and ordering.
     POST: Create a new offer linked to the requesting business user.
@@ -44,23 +134,48 @@ class OffersListView(generics.ListCreateAPIView):
 
     Query Params:
         creator_id (int): Filter by business_user id.
-        search (str): Case-insensitive search on title and description.
-        ordering (str): Ordering field (e.g., '-created_at'). Defaults to '-created_at'.
-        max_delivery_time (int): Filter offers with annotated min_delivery_time <= value.
-        min_price (int): Filter offers with annotated min_price >= value.
-
-    Annotations:
+        search (str): Full-text search on title, description, and detail titles/features.
+        ordering (str): One of ordering_fields, '-' prefixed for descending (e.g. '-created_at');
+            other values are rejected with 400. Defaults to relevance when searching,
+            otherwise '-created_at'. Ties are broken by id.
+        max_delivery_time (int): Filter offers with min_delivery_time <= value.
+        min_price (int): Filter offers with min_price >= value.
+        fields / omit (str): Comma-separated sparse fieldset; unrequested columns are not
+            loaded and details are only prefetched when rendered (see core.fieldsets).
+
+    Denormalized columns (indexed, maintained on OfferDetail writes):
         min_price: Minimum price among related OfferDetail items.
         min_delivery_time: Minimum delivery_time_in_days among related OfferDetail items.
 
+    Caching:
+        Anonymous GETs are cached per normalized query string (see CachedResponseMixin).
+        Responses carry an ETag fingerprinting the filtered offers (see ConditionalListMixin).
+
     Pagination:
         StandardResultsSetPagination (default page_size=2).
+        `?pagination=cursor` switches to keyset pagination over keyset_ordering_fields.
+
+    Serialization:
+        GET pages are rendered from values() rows by the compiled read path (see core.fastpath).
+
+    Idempotency:
+        POSTs with an `Idempotency-Key` header are executed once; repeats replay the stored
+        response (see core.idempotency).
     """
 
-    queryset = Offer.objects.prefetch_related("details").all()
+    queryset = Offer.objects.select_related(
+        "business_user", "business_user__rating_summary"
+    ).prefetch_related("details")
     serializer_class = OfferSerializer
     permission_classes = [IsBusinessOrReadOnly]
+    # The embedded rating summary changes the representation without touching the offer
+    related_modified_fields = ("business_user__rating_summary__updated_at",)
+    query_budget = {"GET": 5, "POST": 16}
+    cache_key_func = staticmethod(offer_cache.list_cache_key)
     pagination_class = StandardResultsSetPagination
+    # Sort keys, each backed by an index (see Offer.Meta.indexes)
+    ordering_fields = ("created_at", "updated_at", "min_price", "min_delivery_time")
+    keyset_ordering_fields = ("created_at", "updated_at")
 
     def perform_create(self, serializer):
         """
@@ -73,54 +188,34 @@ class OffersListView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         """
-        Apply filters, search, ordering, and annotations to the base queryset.
+        Apply filters, search, and ordering to the base queryset.
 
         Returns:
-            QuerySet[Offer]: Annotated and filtered offers.
+            QuerySet[Offer]: Filtered and ordered offers.
         """
-        qs = super().get_queryset()
         params = self.request.query_params
+        qs = filter_offers(super().get_queryset(), params)
 
-        creator_id = params.get("creator_id")
-        if creator_id:
-            qs = qs.filter(business_user_id=creator_id)
-
-        search = params.get("search")
-        if search:
-            qs = qs.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
-
-        ordering = params.get("ordering")
-        if ordering:
-            qs = qs.order_by(ordering)
+        if params.get("search"):
+            default = ("search_rank", "-created_at", "-id")
         else:
-            qs = qs.order_by("-created_at")
-
-        # Annotate aggregated fields
-        qs = qs.annotate(
-            min_price=Min("details__price"),
-            min_delivery_time=Min("details__delivery_time_in_days"),
+            default = ("-created_at", "-id")
+        qs = qs.order_by(
+            *resolve_ordering(params.get("ordering"), self.ordering_fields, default)
         )
 
-        delivery_max = params.get("max_delivery_time")
-        if delivery_max:
-            if not delivery_max.isdigit():
-                raise ParseError("`max_delivery_time` must be an integer.")
-            qs = qs.filter(min_delivery_time__lte=int(delivery_max))
-
-        min_price = params.get("min_price")
-        if min_price:
-            if not min_price.isdigit():
-                raise ParseError("`min_price` must be an integer.")
-            qs = qs.filter(min_price__gte=int(min_price))
-
         return qs
 
 
-class SingleOfferView(generics.RetrieveUpdateDestroyAPIView):
+class SingleOfferView(
+    IdentityMapMixin,
+    CachedResponseMixin,
+    ConditionalRetrieveMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
-    GET: Retrieve details of a single offer with nested details and annotated metrics.
+    GET: Retrieve details of a single offer with nested details and summary metrics.
     PUT/PATCH: Update the offer (owned by the business user).
     DELETE: Delete the offer (business users only; enforced via PermissionDenied override).
 
@@ -129,23 +224,26 @@ class SingleOfferView(generics.RetrieveUpdateDestroyAPIView):
         - UPDATE/DELETE: Owner or staff (IsOfferOwner for object-level checks, additional destroy logic).
 
     Queryset:
-        Annotated with min_price and min_delivery_time.
+        Offers with min_price and min_delivery_time read from their denormalized columns.
+        GET supports sparse fieldsets (`?fields=` / `?omit=`, see core.fieldsets).
+
+    Caching:
+        Anonymous GETs are cached per offer (see CachedResponseMixin).
+        Responses carry ETag / Last-Modified validators (see ConditionalRetrieveMixin).
     """
 
+    queryset = Offer.objects.select_related(
+        "business_user", "business_user__rating_summary"
+    ).prefetch_related("details")
     serializer_class = OfferSerializer
     permission_classes = [permissions.IsAuthenticated | IsOfferOwner]
-
-    def get_queryset(self):
-        """
-        Provide annotated queryset for retrieving an offer.
-
-        Returns:
-            QuerySet[Offer]: Offers annotated with aggregate metrics.
-        """
-        return Offer.objects.annotate(
-            min_price=Min("details__price"),
-            min_delivery_time=Min("details__delivery_time_in_days"),
-        )
+    # The embedded rating summary changes the representation without touching the offer
+    related_modified_fields = ("business_user__rating_summary__updated_at",)
+    # A nested write that updates, inserts and deletes details (after checking that the deleted
+    # details have no orders) runs 19 statements, independent of the number of details; the
+    # offer is refreshed once
+    query_budget = {"GET": 3, "PUT": 19, "PATCH": 19, "DELETE": 9}
+    cache_key_func = staticmethod(offer_cache.detail_cache_key)
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -173,6 +271,7 @@ class OfferDetailView(generics.RetrieveAPIView):
     queryset = OfferDetail.objects.all()
     serializer_class = OfferDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = {"GET": 2}
 
 
 class OfferSingleDetailView(generics.RetrieveAPIView):
@@ -189,3 +288,100 @@ class OfferSingleDetailView(generics.RetrieveAPIView):
     queryset = OfferDetail.objects.all()
     serializer_class = OfferSingleDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = {"GET": 2}
+
+
+class OfferFacetsView(CachedResponseMixin, generics.ListAPIView):
+    """
+    GET: Return facet counts for the offers matching the OffersListView filters.
+
+    Accepts the same filter parameters as OffersListView (creator_id, search, max_delivery_time,
+    min_price); ordering and pagination parameters are ignored. All counts are computed in one
+    aggregate query (see offers_app.facets.compute_facets).
+
+    Caching:
+        Anonymous GETs are cached per normalized query string and invalidated together with
+        the offer list (see CachedResponseMixin).
+
+    Returns:
+        {'total': int, 'price': [...], 'delivery_time': [...], 'offer_type': [...]} with HTTP 200.
+    """
+
+    queryset = Offer.objects.all()
+    permission_classes = [permissions.AllowAny]
+    pagination_class = None
+    query_budget = {"GET": 1}
+    cache_key_func = staticmethod(offer_cache.list_cache_key)
+
+    def get_queryset(self):
+        """
+        Apply the shared offer list filters to all offers.
+        """
+        return filter_offers(super().get_queryset(), self.request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        return Response(compute_facets(self.get_queryset()), status=status.HTTP_200_OK)
+
+
+class OfferImportView(APIView):
+    """
+    POST: Import offers from an NDJSON request body (Content-Type: application/x-ndjson).
+
+    The body is read line by line without buffering it; see offers_app.bulk for the line format,
+    chunked validation and batched writes. All offers are created for the requesting user.
+
+    Permissions:
+        - IsBusinessOrReadOnly: Authenticated business users only.
+
+    Returns:
+        {'created': int, 'failed': int, 'errors': [{'line': int, 'errors': ...}]} with HTTP 201,
+        or HTTP 400 if no line could be imported.
+    """
+
+    permission_classes = [IsBusinessOrReadOnly]
+
+    def post(self, request, *args, **kwargs):
+        # Iterate the underlying HttpRequest so the body is streamed, not parsed at once
+        report = import_offers(request._request, request.user)
+        if report["created"] == 0 and report["failed"]:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_201_CREATED)
+
+
+class OfferExportView(APIView):
+    """
+    GET: Stream offers as NDJSON (one offer with its details per line), ordered by id.
+
+    Accepts the OffersListView filter parameters (creator_id, search, max_delivery_time,
+    min_price). Rows are read with QuerySet.iterator(), so memory stays flat for any catalog size.
+
+    Permissions:
+        - IsAuthenticated: Require login.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        queryset = filter_offers(Offer.objects.all(), request.query_params)
+        return ndjson_response(
+            export_offers(queryset, context={"request": request}),
+            filename="offers.ndjson",
+        )
+
+
+class OfferCacheStatsView(APIView):
+    """
+    GET: Return hit/miss counters of the offer response cache for tuning.
+
+    Permissions:
+        - IsAdminUser: Staff only.
+
+    Returns:
+        {'hits': int, 'misses': int, 'hit_rate': float} with HTTP 200.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    query_budget = {"GET": 1}
+
+    def get(self, request):
+        return Response(offer_cache.get_stats(), status=status.HTTP_200_OK)
@@ -0,0 +1,127 @@
+from django.db import transaction
+
+from core.streaming import chunked, iter_ndjson, ndjson_lines
+from offers_app.api.serializers import OfferExportSerializer, OfferSerializer
+from offers_app.models import Offer, OfferDetail
+from offers_app.signals import refresh_offer_derived_data
+
+"""
+Bulk NDJSON import and export of offers.
+
+Import format: one JSON object per line, validated like a POST /api/offers/ payload, e.g.
+
+    {"title": "Logo", "description": "...", "details": [{"title": "Basic", "revisions": 1,
+     "delivery_time_in_days": 3, "price": 50, "features": [], "offer_type": "basic"}]}
+
+Lines are validated in chunks; the valid offers of each chunk are written with two bulk_create
+calls in one transaction, invalid lines are reported with their line number and skipped.
+The export emits the same format (plus read-only fields) from a QuerySet.iterator().
+
+Functions:
+    import_offers: Import NDJSON lines for a business user and return a report.
+    export_offers: Render a queryset of offers as NDJSON chunks.
+"""
+
+
+IMPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 500
+
+# Errors listed in an import report; further failures are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+def _create_offers(rows, business_user):
+    """
+    Insert validated offers with their details in one transaction.
+
+    Returns:
+        int: Number of offers created.
+    """
+    with transaction.atomic():
+        offers = Offer.objects.bulk_create(
+            [
+                Offer(
+                    business_user=business_user,
+                    **{
+                        field: value
+                        for field, value in row.items()
+                        if field != "details"
+                    },
+                )
+                for row in rows
+            ]
+        )
+        OfferDetail.objects.bulk_create(
+            [
+                OfferDetail(
+                    offer=offer,
+                    **{
+                        field: value for field, value in detail.items() if field != "id"
+                    },
+                )
+                for offer, row in zip(offers, rows)
+                for detail in row["details"]
+            ]
+        )
+        refresh_offer_derived_data([offer.pk for offer in offers])
+    return len(offers)
+
+
+def import_offers(lines, business_user, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Import offers from NDJSON lines for a business user.
+
+    Args:
+        lines (Iterable[bytes | str]): NDJSON lines, e.g. a request body or an open file.
+        business_user (User): Owner of the imported offers.
+        batch_size (int): Number of lines validated and written per transaction.
+
+    Returns:
+        dict: {'created': int, 'failed': int, 'errors': [{'line': int, 'errors': ...}, ...]}
+        with at most MAX_REPORTED_ERRORS error entries.
+    """
+    report = {"created": 0, "failed": 0, "errors": []}
+
+    for chunk in chunked(iter_ndjson(lines), batch_size):
+        valid = []
+        for number, value, error in chunk:
+            if error is None:
+                if not isinstance(value, dict):
+                    error = "Expected a JSON object."
+                else:
+                    serializer = OfferSerializer(data=value)
+                    if serializer.is_valid():
+                        valid.append(serializer.validated_data)
+                        continue
+                    error = serializer.errors
+
+            report["failed"] += 1
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append({"line": number, "errors": error})
+
+        if valid:
+            report["created"] += _create_offers(valid, business_user)
+
+    return report
+
+
+def export_offers(queryset, chunk_size=EXPORT_CHUNK_SIZE, context=None):
+    """
+    Render offers as NDJSON, reading them in chunks from the database.
+
+    Args:
+        queryset (QuerySet[Offer]): Offers to export.
+        chunk_size (int): Rows fetched (and details prefetched) per database round trip.
+        context (dict, optional): Serializer context.
+
+    Returns:
+        Iterator[str]: NDJSON chunks.
+    """
+    offers = (
+        queryset.prefetch_related("details")
+        .order_by("pk")
+        .iterator(chunk_size=chunk_size)
+    )
+    return ndjson_lines(
+        OfferExportSerializer(offer, context=context or {}).data for offer in offers
+    )
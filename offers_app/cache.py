@@ -0,0 +1,151 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+"""
+Versioned response cache for the public offer endpoints.
+
+Cached entries are never scanned or purged. Instead every key embeds a version counter:
+
+    - a global version, bumped on any Offer/OfferDetail write, used by list responses;
+    - a per-offer version, bumped on writes to that offer or its details, used by detail responses.
+
+Bumping a version makes all older entries unreachable; they simply expire via OFFER_CACHE_TIMEOUT.
+Versions are bumped when the writing transaction commits: a bump inside the transaction would let
+a concurrent GET cache the not yet committed (old) data under the new version. A bump sets fresh
+version tokens for all affected keys in one set_many() round trip.
+
+Functions:
+    bump_offer_versions: Invalidate the list responses and the detail responses of offers on commit.
+    bump_offer_version: Same for at most one offer.
+    list_cache_key / detail_cache_key: Build versioned cache keys for a request.
+    get_response / set_response: Read and write cached response data and validators, counting hits and misses.
+    get_stats: Return the hit/miss counters.
+"""
+
+
+KEY_PREFIX = "offers"
+GLOBAL_VERSION_KEY = f"{KEY_PREFIX}:version"
+HITS_KEY = f"{KEY_PREFIX}:cache:hits"
+MISSES_KEY = f"{KEY_PREFIX}:cache:misses"
+
+
+def _timeout():
+    return getattr(settings, "OFFER_CACHE_TIMEOUT", 300)
+
+
+def _offer_version_key(offer_id):
+    return f"{KEY_PREFIX}:version:{offer_id}"
+
+
+def _get_version(key):
+    """
+    Return the current value of a version counter, initializing it to 1.
+    """
+    cache.add(key, 1, timeout=None)
+    return cache.get(key, 1)
+
+
+def _incr(key):
+    """
+    Increment a counter that never expires, creating it if missing.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+
+
+def bump_offer_versions(offer_ids=()):
+    """
+    Invalidate cached list responses and the cached detail responses of offers.
+
+    The versions change when the current transaction commits (immediately outside one).
+
+    Args:
+        offer_ids (Iterable[int]): Offers whose detail responses become stale.
+    """
+    keys = [GLOBAL_VERSION_KEY, *(_offer_version_key(pk) for pk in set(offer_ids))]
+    transaction.on_commit(
+        lambda: cache.set_many(dict.fromkeys(keys, uuid.uuid4().hex), timeout=None)
+    )
+
+
+def bump_offer_version(offer_id=None):
+    """
+    Invalidate cached list responses and, if given, the cached detail response of one offer.
+
+    Args:
+        offer_id (int, optional): Offer whose detail responses become stale.
+    """
+    bump_offer_versions([offer_id] if offer_id is not None else [])
+
+
+def _fingerprint(request):
+    """
+    Hash the host, path and normalized (sorted) query parameters of a request.
+    """
+    params = request.query_params
+    normalized = "&".join(
+        f"{name}={value}"
+        for name in sorted(params)
+        for value in sorted(params.getlist(name))
+    )
+    raw = f"{request.get_host()}{request.path}?{normalized}"
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def list_cache_key(request):
+    """
+    Build the cache key of a list response for the request's query parameters.
+    """
+    version = _get_version(GLOBAL_VERSION_KEY)
+    return f"{KEY_PREFIX}:list:{version}:{_fingerprint(request)}"
+
+
+def detail_cache_key(request, pk):
+    """
+    Build the cache key of the detail response of the offer with primary key pk.
+    """
+    version = _get_version(_offer_version_key(pk))
+    return f"{KEY_PREFIX}:detail:{pk}:{version}:{_fingerprint(request)}"
+
+
+def get_response(key):
+    """
+    Return the cached response for the key, counting the hit or miss.
+
+    Returns:
+        tuple[Any, dict] | None: Response data and its validators ('etag', 'last_modified'),
+        or None on a miss.
+    """
+    entry = cache.get(key)
+    _incr(HITS_KEY if entry is not None else MISSES_KEY)
+    return entry
+
+
+def set_response(key, data, validators=None):
+    """
+    Store response data and its validators under the key for OFFER_CACHE_TIMEOUT seconds.
+    """
+    cache.set(key, (data, validators or {}), timeout=_timeout())
+
+
+def get_stats():
+    """
+    Return the response cache counters.
+
+    Returns:
+        dict: hits, misses and hit_rate (0.0 when nothing was requested yet).
+    """
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
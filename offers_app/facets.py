@@ -0,0 +1,87 @@
+from django.db.models import Count, Q
+
+from offers_app.models import OFFER_TYPES
+
+"""
+Facet counts for the offer list.
+
+All facets of a filtered Offer queryset are computed by compute_facets in a single aggregate
+query: every bucket is a conditional COUNT(DISTINCT id) over the denormalized min_price /
+min_delivery_time columns, and the offer_type buckets join the offer details once.
+
+Constants:
+    PRICE_BUCKETS: (key, lower bound inclusive, upper bound exclusive or None) on min_price.
+    DELIVERY_BUCKETS: (key, max days) on min_delivery_time, cumulative like the max_delivery_time filter.
+"""
+
+
+PRICE_BUCKETS = (
+    ("0-50", 0, 50),
+    ("50-100", 50, 100),
+    ("100-250", 100, 250),
+    ("250-500", 250, 500),
+    ("500+", 500, None),
+)
+
+DELIVERY_BUCKETS = (
+    ("1", 1),
+    ("3", 3),
+    ("7", 7),
+    ("14", 14),
+    ("30", 30),
+)
+
+
+def _price_condition(lower, upper):
+    condition = Q(min_price__gte=lower)
+    if upper is not None:
+        condition &= Q(min_price__lt=upper)
+    return condition
+
+
+def compute_facets(queryset):
+    """
+    Count the offers of a queryset per price bucket, delivery-time bucket and offer type.
+
+    Args:
+        queryset (QuerySet[Offer]): The filtered offers.
+
+    Returns:
+        dict: {
+            'total': int,
+            'price': [{'key', 'min', 'max', 'count'}, ...],
+            'delivery_time': [{'key', 'max_days', 'count'}, ...],
+            'offer_type': [{'key', 'count'}, ...],
+        }
+    """
+    aggregates = {"total": Count("pk", distinct=True)}
+    for index, (key, lower, upper) in enumerate(PRICE_BUCKETS):
+        aggregates[f"price_{index}"] = Count(
+            "pk", distinct=True, filter=_price_condition(lower, upper)
+        )
+    for index, (key, max_days) in enumerate(DELIVERY_BUCKETS):
+        aggregates[f"delivery_{index}"] = Count(
+            "pk", distinct=True, filter=Q(min_delivery_time__lte=max_days)
+        )
+    for offer_type, label in OFFER_TYPES:
+        aggregates[f"type_{offer_type}"] = Count(
+            "pk", distinct=True, filter=Q(details__offer_type=offer_type)
+        )
+
+    counts = queryset.order_by().aggregate(**aggregates)
+
+    return {
+        "total": counts["total"],
+        "price": [
+            {"key": key, "min": lower, "max": upper, "count": counts[f"price_{index}"]}
+            for index, (key, lower, upper) in enumerate(PRICE_BUCKETS)
+        ],
+        "delivery_time": [
+            {"key": key, "max_days": max_days, "count": counts[f"delivery_{index}"]}
+            for index, (key, max_days) in enumerate(DELIVERY_BUCKETS)
+        ],
+        "offer_type": [
+            {"key": offer_type, "count": counts[f"type_{offer_type}"]}
+            for offer_type, label in OFFER_TYPES
+        ],
+    }
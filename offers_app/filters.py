@@ -0,0 +1,47 @@
+from core.params import int_param
+from offers_app.search import search_offers
+
+"""
+Query parameter filters shared by the offer list endpoints (OffersListView, OfferFacetsView).
+
+Functions:
+    filter_offers: Apply the creator_id, search, max_delivery_time and min_price filters.
+"""
+
+
+def filter_offers(queryset, params):
+    """
+    Filter an Offer queryset by the list query parameters.
+
+    Args:
+        queryset (QuerySet[Offer]): Offers to filter.
+        params (QueryDict): Request query parameters:
+            creator_id (int): Filter by business_user id.
+            search (str): Full-text search; annotates 'search_rank' (see offers_app.search).
+            max_delivery_time (int): Offers with min_delivery_time <= value.
+            min_price (int): Offers with min_price >= value.
+
+    Raises:
+        ParseError: If creator_id is not a positive integer, or max_delivery_time or min_price
+            is not a non-negative integer (see core.params).
+
+    Returns:
+        QuerySet[Offer]: The filtered offers.
+    """
+    creator_id = int_param(params, "creator_id")
+    if creator_id is not None:
+        queryset = queryset.filter(business_user_id=creator_id)
+
+    search = params.get("search")
+    if search:
+        queryset = search_offers(queryset, search)
+
+    delivery_max = int_param(params, "max_delivery_time", minimum=0)
+    if delivery_max is not None:
+        queryset = queryset.filter(min_delivery_time__lte=delivery_max)
+
+    min_price = int_param(params, "min_price", minimum=0)
+    if min_price is not None:
+        queryset = queryset.filter(min_price__gte=min_price)
+
+    return queryset
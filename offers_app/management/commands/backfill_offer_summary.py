@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from offers_app.models import Offer
+
+"""
+Management command to backfill the denormalized detail summary columns on Offer.
+
+Usage:
+    python manage.py backfill_offer_summary [--batch-size N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Recompute min_price and min_delivery_time for all offers in primary key batches.
+
+    Each batch is updated in its own transaction, so the command can be interrupted
+    and re-run safely at any time.
+    """
+
+    help = "Recompute Offer.min_price and Offer.min_delivery_time from offer details."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of offers updated per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pk = 0
+        total = 0
+
+        while True:
+            batch = list(
+                Offer.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+
+            with transaction.atomic():
+                total += Offer.objects.filter(pk__in=batch).refresh_detail_summary()
+            last_pk = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {total} offers."))
@@ -0,0 +1,99 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.fastjson import FastJSONRenderer, get_backend
+from offers_app.api.serializers import OfferSerializer
+from offers_app.management.commands.benchmark_serializers import (
+    create_benchmark_rows,
+)
+from offers_app.models import Offer
+from orders_app.api.serializers import OrderSerializer
+from orders_app.models import Order
+
+"""
+Management command comparing DRF's JSONRenderer with core.fastjson.FastJSONRenderer.
+
+Payloads:
+    offers / orders: Serialized list pages as returned by the list endpoints.
+    offer rows / order rows: Raw values() rows, i.e. Decimal and datetime objects that are
+        formatted by the encoder itself.
+
+Each payload is rendered by both renderers, checked for byte-identical output, and timed.
+The benchmark rows are created in a transaction that is rolled back afterwards.
+
+Usage:
+    python manage.py benchmark_json [--page-size N] [--repeat N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Benchmark JSON rendering of realistic offer and order payloads.
+    """
+
+    help = "Compare DRF's JSONRenderer with FastJSONRenderer on offer and order pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=1000,
+            help="Rows per rendered payload (default: 1000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Runs per renderer; the best run is reported (default: 20).",
+        )
+
+    def handle(self, *args, **options):
+        size, repeat = options["page_size"], options["repeat"]
+        if size < 1 or repeat < 1:
+            raise CommandError("--page-size and --repeat must be positive.")
+
+        context = {"request": Request(APIRequestFactory().get("/"))}
+        with transaction.atomic():
+            create_benchmark_rows(size)
+            offers = Offer.objects.select_related("business_user").prefetch_related(
+                "details"
+            )[:size]
+            orders = Order.objects.all()[:size]
+            payloads = {
+                "offers": OfferSerializer(offers, many=True, context=context).data,
+                "orders": OrderSerializer(orders, many=True, context=context).data,
+                "offer rows": list(Offer.objects.values()[:size]),
+                "order rows": list(Order.objects.values()[:size]),
+            }
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"backend: {get_backend()}")
+        self.stdout.write(f"{'':12}{'stdlib':>12}{'fast':>12}{'speedup':>10}")
+        for name, payload in payloads.items():
+            self.run_payload(name, payload, repeat)
+
+    def run_payload(self, name, payload, repeat):
+        stdlib, fast = JSONRenderer(), FastJSONRenderer()
+        if stdlib.render(payload) != fast.render(payload):
+            raise CommandError(f"{name}: FastJSONRenderer output differs.")
+
+        baseline = self.best_of(lambda: stdlib.render(payload), repeat)
+        accelerated = self.best_of(lambda: fast.render(payload), repeat)
+        self.stdout.write(
+            f"{name:12}{baseline * 1000:>10.2f}ms{accelerated * 1000:>10.2f}ms"
+            f"{baseline / accelerated:>9.1f}x"
+        )
+
+    @staticmethod
+    def best_of(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
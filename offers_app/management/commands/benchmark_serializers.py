@@ -0,0 +1,168 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from authentication_app.models import User
+from core.fastpath import compile_serializer
+from offers_app.api.serializers import OfferSerializer
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.serializers import OrderSerializer
+from orders_app.models import Order
+from reviews_app.api.serializers import ReviewSerializer
+from reviews_app.models import Review
+
+"""
+Management command comparing the DRF serializers with the compiled read path (core.fastpath).
+
+Renders one list page of offers, orders and reviews with both paths (queries, serialization and
+JSON rendering included), checks that the output is byte-identical and prints the best timings.
+The benchmark rows are created in a transaction that is rolled back afterwards.
+
+Usage:
+    python manage.py benchmark_serializers [--page-size N] [--repeat N]
+"""
+
+
+def create_benchmark_rows(size):
+    """
+    Create `size` offers (three details each), orders and reviews for the benchmark commands.
+
+    Callers run it inside a transaction they roll back.
+    """
+    business = User.objects.create(
+        username="benchmark-business", first_name="Bench", type="business"
+    )
+    customer = User.objects.create(username="benchmark-customer", type="customer")
+    offers = Offer.objects.bulk_create(
+        Offer(
+            business_user=business,
+            title=f"Offer {index}",
+            description="Benchmark offer " * 8,
+            min_price=10,
+            min_delivery_time=3,
+        )
+        for index in range(size)
+    )
+    OfferDetail.objects.bulk_create(
+        OfferDetail(
+            offer=offer,
+            title=offer_type,
+            revisions=2,
+            delivery_time_in_days=3,
+            price=price,
+            features=["Logo", "Visitenkarte"],
+            offer_type=offer_type,
+        )
+        for offer in offers
+        for offer_type, price in (
+            ("basic", "10.00"),
+            ("standard", "49.90"),
+            ("premium", "199.99"),
+        )
+    )
+    Order.objects.bulk_create(
+        Order(
+            customer_user=customer,
+            business_user=business,
+            title=f"Order {index}",
+            price="49.90",
+            features=["Logo"],
+            offer_type="standard",
+        )
+        for index in range(size)
+    )
+    Review.objects.bulk_create(
+        Review(
+            business_user=business,
+            reviewer=customer,
+            rating=index % 5 + 1,
+            description="Benchmark review",
+        )
+        for index in range(size)
+    )
+
+
+class Command(BaseCommand):
+    """
+    Benchmark list serialization of offers, orders and reviews at a given page size.
+    """
+
+    help = "Compare DRF serializers with the compiled read path for list pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=1000,
+            help="Rows per rendered page (default: 1000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per path; the best run is reported (default: 5).",
+        )
+
+    def handle(self, *args, **options):
+        size, repeat = options["page_size"], options["repeat"]
+        if size < 1 or repeat < 1:
+            raise CommandError("--page-size and --repeat must be positive.")
+
+        context = {"request": Request(APIRequestFactory().get("/"))}
+        with transaction.atomic():
+            create_benchmark_rows(size)
+            targets = (
+                (
+                    "offers",
+                    OfferSerializer,
+                    Offer.objects.select_related("business_user").prefetch_related(
+                        "details"
+                    ),
+                ),
+                ("orders", OrderSerializer, Order.objects.all()),
+                ("reviews", ReviewSerializer, Review.objects.all()),
+            )
+            self.stdout.write(
+                f"{'':10}{'serializer':>12}{'compiled':>12}{'speedup':>10}"
+            )
+            for name, serializer_class, queryset in targets:
+                queryset = queryset.order_by("-created_at", "-id")
+                self.run_target(name, serializer_class, queryset, size, repeat, context)
+            transaction.set_rollback(True)
+
+    def run_target(self, name, serializer_class, queryset, size, repeat, context):
+        renderer = JSONRenderer()
+
+        def serializer_path():
+            rows = list(queryset[:size])
+            return renderer.render(
+                serializer_class(rows, many=True, context=context).data
+            )
+
+        def compiled_path():
+            compiled = compile_serializer(serializer_class(context=context))
+            rows = compiled.values(queryset)[:size]
+            return renderer.render(compiled.serialize(rows))
+
+        if serializer_path() != compiled_path():
+            raise CommandError(f"{name}: compiled output differs from the serializer.")
+
+        baseline = self.best_of(serializer_path, repeat)
+        compiled = self.best_of(compiled_path, repeat)
+        self.stdout.write(
+            f"{name:10}{baseline * 1000:>10.1f}ms{compiled * 1000:>10.1f}ms"
+            f"{baseline / compiled:>9.1f}x"
+        )
+
+    @staticmethod
+    def best_of(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
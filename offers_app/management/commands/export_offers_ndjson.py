@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from offers_app.bulk import EXPORT_CHUNK_SIZE, export_offers
+from offers_app.models import Offer
+
+"""
+Management command to export all offers as NDJSON.
+
+Usage:
+    python manage.py export_offers_ndjson [--output PATH] [--batch-size N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Stream all offers with their details to a file or stdout, one offer per line.
+    """
+
+    help = "Export offers with nested details as NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", help="File to write (default: stdout).", default=None
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f"Offers fetched per database round trip (default: {EXPORT_CHUNK_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        chunks = export_offers(Offer.objects.all(), options["batch_size"])
+
+        if options["output"] is None:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8") as fh:
+            fh.writelines(chunks)
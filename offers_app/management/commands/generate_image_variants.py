@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+
+from core.images import needs_variants, process_variants
+from offers_app.models import Offer
+from profile_app.models import Profile
+
+"""
+Management command to generate the resized variants of offer images and profile pictures.
+
+Usage:
+    python manage.py generate_image_variants [--force]
+"""
+
+
+# Model, image field, variants field
+TARGETS = (
+    (Offer, "image", "image_variants"),
+    (Profile, "file", "file_variants"),
+)
+
+
+class Command(BaseCommand):
+    """
+    Generate missing or stale image variants synchronously.
+
+    Useful to backfill images uploaded before the pipeline existed, or after changing
+    core.images.VARIANTS / FORMATS (with --force).
+    """
+
+    help = "Generate thumbnail, card and full variants of offer and profile images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate variants even if they are up to date.",
+        )
+
+    def handle(self, *args, **options):
+        for model, field_name, variants_field in TARGETS:
+            processed = failed = 0
+            queryset = (
+                model.objects.exclude(**{field_name: ""})
+                .exclude(**{f"{field_name}__isnull": True})
+                .only("pk", field_name, variants_field)
+                .order_by("pk")
+            )
+
+            for instance in queryset.iterator():
+                if not options["force"] and not needs_variants(
+                    instance, field_name, variants_field
+                ):
+                    continue
+                try:
+                    process_variants(model, instance.pk, field_name, variants_field)
+                    processed += 1
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f"{model._meta.label} {instance.pk}: {exc}")
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{model._meta.verbose_name_plural}: {processed} processed, {failed} failed."
+                )
+            )
@@ -0,0 +1,61 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication_app.models import User
+from offers_app.bulk import IMPORT_BATCH_SIZE, import_offers
+
+"""
+Management command to bulk import offers from an NDJSON file.
+
+Usage:
+    python manage.py import_offers_ndjson <path|-> --user <id|username> [--batch-size N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Import offers line by line for one business user and print a per-line error report.
+
+    The file is streamed; every batch of valid lines is written in its own transaction.
+    """
+
+    help = "Import offers with nested details from an NDJSON file ('-' for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON file to import, or '-' for stdin.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Id or username of the business user owning the imported offers.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f"Lines validated and written per transaction (default: {IMPORT_BATCH_SIZE}).",
+        )
+
+    def get_user(self, value):
+        lookup = {"pk": value} if value.isdigit() else {"username": value}
+        try:
+            return User.objects.get(type="business", **lookup)
+        except User.DoesNotExist:
+            raise CommandError(f"Business user '{value}' not found.")
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+
+        if options["path"] == "-":
+            report = import_offers(sys.stdin.buffer, user, options["batch_size"])
+        else:
+            with open(options["path"], "rb") as fh:
+                report = import_offers(fh, user, options["batch_size"])
+
+        for error in report["errors"]:
+            self.stderr.write(f"Line {error['line']}: {error['errors']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {report['created']} offers, {report['failed']} lines failed."
+            )
+        )
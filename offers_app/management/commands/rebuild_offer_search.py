@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from offers_app.search import create_search_index, drop_search_index
+
+"""
+Management command to rebuild the offers full-text search index from scratch.
+
+Usage:
+    python manage.py rebuild_offer_search
+"""
+
+
+class Command(BaseCommand):
+    """
+    Drop and recreate the offers search index table, re-indexing every offer.
+    """
+
+    help = "Rebuild the full-text search index for offers."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drop_search_index(connection)
+            create_search_index(connection)
+
+        self.stdout.write(self.style.SUCCESS("Offer search index rebuilt."))
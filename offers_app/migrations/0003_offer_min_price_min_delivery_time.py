@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0002_alter_offerdetail_delivery_time_in_days"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="offer",
+            name="min_delivery_time",
+            field=models.IntegerField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Shortest delivery time in days among the offer's details (denormalized)",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="offer",
+            name="min_price",
+            field=models.DecimalField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                help_text="Lowest price among the offer's details (denormalized)",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-18 17:20
+
+from django.db import migrations
+
+from offers_app.search import create_search_index, drop_search_index
+
+
+def forwards(apps, schema_editor):
+    create_search_index(schema_editor.connection)
+
+
+def backwards(apps, schema_editor):
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0003_offer_min_price_min_delivery_time"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
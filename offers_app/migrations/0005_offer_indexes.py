@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-18 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0004_offer_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(
+                fields=["business_user", "-created_at"],
+                name="offer_business_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(fields=["-created_at"], name="offer_created_idx"),
+        ),
+    ]
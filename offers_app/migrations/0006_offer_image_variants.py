@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0005_offer_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="offer",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Names of the generated thumbnail, card and full variants of the image",
+            ),
+        ),
+    ]
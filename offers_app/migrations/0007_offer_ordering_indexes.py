@@ -0,0 +1,68 @@
+# Generated by Django 5.2.1 on 2026-10-18 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0006_offer_image_variants"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="offer",
+            name="offer_business_created_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="offer",
+            name="offer_created_idx",
+        ),
+        migrations.AlterField(
+            model_name="offer",
+            name="min_delivery_time",
+            field=models.IntegerField(
+                blank=True,
+                editable=False,
+                help_text="Shortest delivery time in days among the offer's details (denormalized)",
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="offer",
+            name="min_price",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                editable=False,
+                help_text="Lowest price among the offer's details (denormalized)",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="offer_business_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(fields=["created_at", "id"], name="offer_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(fields=["updated_at", "id"], name="offer_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(fields=["min_price", "id"], name="offer_min_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(
+                fields=["min_delivery_time", "id"], name="offer_min_delivery_idx"
+            ),
+        ),
+    ]
@@ -1,11 +1,14 @@
 from django.db import models
+from django.db.models import Min, OuterRef, Subquery
 from django.conf import settings
+from django.utils import timezone
 
 """
 Data models for the offers_app, defining offers and their detailed variants.
 
 Models:
     Offer: Represents a listing created by a business user with a title, description, image, and timestamps.
+        Also stores denormalized min_price / min_delivery_time summaries of its details.
     OfferDetail: Represents a specific package or tier of an Offer, including pricing, delivery time, and features.
 
 Constants:
@@ -20,6 +23,38 @@ OFFER_TYPES = (
 )
 
 
+class OfferQuerySet(models.QuerySet):
+    """
+    QuerySet for Offer with helpers to maintain denormalized detail summaries.
+    """
+
+    def refresh_detail_summary(self, touch=False):
+        """
+        Recompute min_price and min_delivery_time from related OfferDetail rows.
+
+        Runs as a single UPDATE with correlated subqueries, so it can be applied to
+        one offer or to a whole batch of offers at once.
+
+        Args:
+            touch (bool): Also set updated_at, so that detail changes invalidate the offer's
+                ETag / Last-Modified validators (default=False, e.g. for backfills).
+
+        Returns:
+            int: Number of offers updated.
+        """
+        details = OfferDetail.objects.filter(offer=OuterRef("pk")).values("offer")
+        extra = {"updated_at": timezone.now()} if touch else {}
+        return self.update(
+            **extra,
+            min_price=Subquery(
+                details.annotate(value=Min("price")).values("value")[:1]
+            ),
+            min_delivery_time=Subquery(
+                details.annotate(value=Min("delivery_time_in_days")).values("value")[:1]
+            ),
+        )
+
+
 class Offer(models.Model):
     """
     Core model for offers made by business users.
@@ -32,6 +67,9 @@ class Offer(models.Model):
         created_at (DateTimeField): Timestamp when the offer was created.
         updated_at (DateTimeField): Timestamp when the offer was last modified.
         user_details (ForeignKey): Legacy or auxiliary link to a User; typically unused if using business_user.
+        min_price (DecimalField): Lowest price among the offer's details, kept in sync on detail writes.
+        min_delivery_time (IntegerField): Shortest delivery time among the offer's details, kept in sync on detail writes.
+        image_variants (JSONField): Stored names of the resized image variants (see core.images).
     """
 
     business_user = models.ForeignKey(
@@ -76,6 +114,47 @@ class Offer(models.Model):
         null=True,
         help_text="Auxiliary link to a User; not used for business ownership",
     )
+    min_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Lowest price among the offer's details (denormalized)",
+    )
+    min_delivery_time = models.IntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Shortest delivery time in days among the offer's details (denormalized)",
+    )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Names of the generated thumbnail, card and full variants of the image",
+    )
+
+    objects = OfferQuerySet.as_manager()
+
+    class Meta:
+        # Every list sort key (see OffersListView.ordering_fields) has an index ending in id,
+        # so that "<key>, id" and "-<key>, -id" are both read in index order without sorting.
+        indexes = [
+            # Offers of one business, newest first (creator_id filter)
+            models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="offer_business_created_idx",
+            ),
+            # Default list ordering
+            models.Index(fields=["created_at", "id"], name="offer_created_idx"),
+            models.Index(fields=["updated_at", "id"], name="offer_updated_idx"),
+            # Sorting and filtering by the denormalized detail summaries
+            models.Index(fields=["min_price", "id"], name="offer_min_price_idx"),
+            models.Index(
+                fields=["min_delivery_time", "id"], name="offer_min_delivery_idx"
+            ),
+        ]
 
 
 class OfferDetail(models.Model):
@@ -0,0 +1,256 @@
+import re
+
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.expressions import RawSQL
+
+from offers_app.models import Offer, OfferDetail
+
+"""
+Full-text search support for offers.
+
+The searchable text of an offer (title, description, detail titles and detail features)
+is kept in a sidecar index table named SEARCH_TABLE:
+
+    - SQLite: an FTS5 virtual table keyed by the offer id (rowid), ranked with bm25().
+    - PostgreSQL: a table holding a weighted tsvector per offer with a GIN index, ranked with ts_rank().
+
+Other database backends fall back to case-insensitive substring matching of the same columns
+(including the detail features JSON) without ranking.
+
+Functions:
+    index_offers: (Re)build the index entries for the given offer ids.
+    unindex_offers: Remove the index entries for the given offer ids.
+    search_offers: Filter an Offer queryset by a search string and annotate it with 'search_rank'.
+    create_search_index / drop_search_index: Schema helpers used by migrations and rebuilds.
+"""
+
+
+SEARCH_TABLE = "offers_app_offer_search"
+
+# Relative weights of the indexed columns: title, description, details
+SQLITE_COLUMN_WEIGHTS = (10.0, 4.0, 1.0)
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _vendor(conn=None):
+    """
+    Return the name of the search backend for the given connection.
+
+    Returns:
+        str | None: 'sqlite', 'postgresql', or None if full-text search is unsupported.
+    """
+    vendor = (conn or connection).vendor
+    return vendor if vendor in ("sqlite", "postgresql") else None
+
+
+def create_search_index(conn):
+    """
+    Create the search index table for the connection's backend and fill it from existing offers.
+
+    Args:
+        conn: Database connection (e.g. schema_editor.connection inside a migration).
+    """
+    vendor = _vendor(conn)
+    with conn.cursor() as cursor:
+        if vendor == "sqlite":
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                "title, description, details, tokenize='unicode61 remove_diacritics 2')"
+            )
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, title, description, details) "
+                "SELECT o.id, COALESCE(o.title, ''), COALESCE(o.description, ''), "
+                "COALESCE((SELECT group_concat(COALESCE(d.title, '') || ' ' || d.features, ' ') "
+                "FROM offers_app_offerdetail d WHERE d.offer_id = o.id), '') "
+                "FROM offers_app_offer o"
+            )
+        elif vendor == "postgresql":
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+                "offer_id bigint PRIMARY KEY REFERENCES offers_app_offer (id) ON DELETE CASCADE, "
+                "document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document_gin "
+                f"ON {SEARCH_TABLE} USING GIN (document)"
+            )
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (offer_id, document) "
+                "SELECT o.id, "
+                "setweight(to_tsvector('simple', COALESCE(o.title, '')), 'A') || "
+                "setweight(to_tsvector('simple', COALESCE(o.description, '')), 'B') || "
+                "setweight(to_tsvector('simple', COALESCE((SELECT string_agg("
+                "COALESCE(d.title, '') || ' ' || d.features::text, ' ') "
+                "FROM offers_app_offerdetail d WHERE d.offer_id = o.id), '')), 'C') "
+                "FROM offers_app_offer o "
+                "ON CONFLICT (offer_id) DO NOTHING"
+            )
+
+
+def drop_search_index(conn):
+    """
+    Drop the search index table for the connection's backend.
+
+    Args:
+        conn: Database connection (e.g. schema_editor.connection inside a migration).
+    """
+    if _vendor(conn) is None:
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+def _feature_text(features):
+    """
+    Flatten an OfferDetail.features JSON value into indexable text.
+    """
+    if isinstance(features, (list, tuple)):
+        return " ".join(str(feature) for feature in features)
+    return str(features or "")
+
+
+def _documents(offer_ids):
+    """
+    Build the indexable text columns for the given offers.
+
+    Returns:
+        dict[int, tuple[str, str, str]]: Mapping of offer id to (title, description, details).
+    """
+    details = {}
+    for offer_id, title, features in OfferDetail.objects.filter(
+        offer_id__in=offer_ids
+    ).values_list("offer_id", "title", "features"):
+        details.setdefault(offer_id, []).append(
+            f"{title or ''} {_feature_text(features)}"
+        )
+
+    return {
+        pk: (title or "", description or "", " ".join(details.get(pk, [])))
+        for pk, title, description in Offer.objects.filter(
+            pk__in=offer_ids
+        ).values_list("pk", "title", "description")
+    }
+
+
+def index_offers(offer_ids):
+    """
+    Rebuild the search index entries of the given offers.
+
+    Offers that no longer exist are removed from the index.
+
+    Args:
+        offer_ids (Iterable[int]): Primary keys of the offers to index.
+    """
+    vendor = _vendor()
+    offer_ids = list(offer_ids)
+    if vendor is None or not offer_ids:
+        return
+
+    documents = _documents(offer_ids)
+    unindex_offers(offer_ids)
+    if not documents:
+        return
+
+    with connection.cursor() as cursor:
+        if vendor == "sqlite":
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, title, description, details) "
+                "VALUES (%s, %s, %s, %s)",
+                [(pk, *columns) for pk, columns in documents.items()],
+            )
+        else:
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (offer_id, document) VALUES (%s, "
+                "setweight(to_tsvector('simple', %s), 'A') || "
+                "setweight(to_tsvector('simple', %s), 'B') || "
+                "setweight(to_tsvector('simple', %s), 'C'))",
+                [(pk, *columns) for pk, columns in documents.items()],
+            )
+
+
+def unindex_offers(offer_ids):
+    """
+    Remove the search index entries of the given offers.
+
+    Args:
+        offer_ids (Iterable[int]): Primary keys of the offers to remove.
+    """
+    vendor = _vendor()
+    offer_ids = list(offer_ids)
+    if vendor is None or not offer_ids:
+        return
+
+    key = "rowid" if vendor == "sqlite" else "offer_id"
+    placeholders = ", ".join(["%s"] * len(offer_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_TABLE} WHERE {key} IN ({placeholders})", offer_ids
+        )
+
+
+def search_offers(queryset, query):
+    """
+    Restrict an Offer queryset to offers matching the search string.
+
+    Every word of the query must match (as a prefix, so partially typed words match too).
+    The result is annotated with 'search_rank', where lower values mean better matches.
+
+    Args:
+        queryset (QuerySet[Offer]): Offers to search in.
+        query (str): Raw search string from the client.
+
+    Returns:
+        QuerySet[Offer]: Matching offers annotated with search_rank.
+    """
+    tokens = TOKEN_PATTERN.findall(query)
+    if not tokens:
+        return queryset.none().annotate(search_rank=Value(0))
+
+    vendor = _vendor()
+    offer_id = f'"{Offer._meta.db_table}"."id"'
+
+    if vendor == "sqlite":
+        match = " ".join(f'"{token}"*' for token in tokens)
+        weights = ", ".join(str(weight) for weight in SQLITE_COLUMN_WEIGHTS)
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+                [match],
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT bm25({SEARCH_TABLE}, {weights}) FROM {SEARCH_TABLE} "
+                f"WHERE {SEARCH_TABLE} MATCH %s AND rowid = {offer_id}",
+                [match],
+            )
+        )
+
+    if vendor == "postgresql":
+        tsquery = " & ".join(f"{token}:*" for token in tokens)
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT offer_id FROM {SEARCH_TABLE} "
+                "WHERE document @@ to_tsquery('simple', %s)",
+                [tsquery],
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -ts_rank(document, to_tsquery('simple', %s)) "
+                f"FROM {SEARCH_TABLE} WHERE offer_id = {offer_id}",
+                [tsquery],
+            )
+        )
+
+    condition = Q()
+    for token in tokens:
+        condition &= (
+            Q(title__icontains=token)
+            | Q(description__icontains=token)
+            | Q(details__title__icontains=token)
+            | Q(details__features__icontains=token)
+        )
+    return queryset.filter(
+        pk__in=Offer.objects.filter(condition).values("pk")
+    ).annotate(search_rank=Value(0))
@@ -0,0 +1,132 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.images import sync_image_variants
+from offers_app.cache import bump_offer_version, bump_offer_versions
+from offers_app.models import Offer, OfferDetail
+from offers_app.search import index_offers, unindex_offers
+
+"""
+Signal handlers for the offers_app, keeping denormalized Offer data in sync.
+
+Functions:
+    refresh_offer_derived_data: Refreshes everything derived from an offer's details
+        (summary columns, search index, response cache). Bulk writes, which bypass model
+        signals, call it directly.
+    deferred_offer_refresh: Context manager skipping the per-row refresh and re-indexing
+        handlers, for writes that call refresh_offer_derived_data once afterwards.
+
+Handlers:
+    refresh_offer_of_detail: Runs refresh_offer_derived_data for the parent Offer whenever one
+        of its OfferDetail rows is saved or deleted.
+    index_saved_offer / unindex_deleted_offer: Keep the full-text search index in sync with
+        offer writes.
+    invalidate_offer_cache: Bumps the response cache versions on any Offer write.
+    generate_offer_image_variants: Schedules image variant generation when the offer image changed.
+"""
+
+
+_deferred = ContextVar("deferred_offer_refresh", default=False)
+
+
+@contextmanager
+def deferred_offer_refresh():
+    """
+    Skip refresh_offer_of_detail and index_saved_offer within the block.
+
+    The caller is responsible for refreshing (or at least re-indexing) the written offers after
+    the block, once for all rows.
+    """
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+
+
+def refresh_offer_derived_data(offer_ids):
+    """
+    Recompute min_price / min_delivery_time, touch updated_at, re-index and invalidate cached
+    responses of offers.
+
+    Args:
+        offer_ids (Iterable[int]): Primary keys of the offers whose details changed.
+    """
+    offer_ids = list(offer_ids)
+    Offer.objects.filter(pk__in=offer_ids).refresh_detail_summary(touch=True)
+    index_offers(offer_ids)
+    bump_offer_versions(offer_ids)
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_of_detail(sender, instance, origin=None, **kwargs):
+    """
+    Refresh the data derived from the details of the parent Offer.
+
+    Skipped when the detail is deleted as part of deleting its Offer, and inside
+    deferred_offer_refresh().
+
+    Args:
+        sender: The OfferDetail model class.
+        instance (OfferDetail): The detail that was written or deleted.
+        origin: For deletions, the instance or queryset whose deletion caused this one.
+    """
+    if isinstance(origin, Offer) or _deferred.get():
+        return
+    refresh_offer_derived_data([instance.offer_id])
+
+
+@receiver(post_save, sender=Offer)
+def index_saved_offer(sender, instance, **kwargs):
+    """
+    Re-index an Offer after it has been created or updated (skipped inside
+    deferred_offer_refresh()).
+
+    Args:
+        sender: The Offer model class.
+        instance (Offer): The saved offer.
+    """
+    if _deferred.get():
+        return
+    index_offers([instance.pk])
+
+
+@receiver(post_delete, sender=Offer)
+def unindex_deleted_offer(sender, instance, **kwargs):
+    """
+    Remove a deleted Offer from the search index.
+
+    Args:
+        sender: The Offer model class.
+        instance (Offer): The deleted offer.
+    """
+    unindex_offers([instance.pk])
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_offer_cache(sender, instance, **kwargs):
+    """
+    Invalidate cached responses that include the written or deleted Offer.
+
+    Args:
+        sender: The Offer model class.
+        instance (Offer): The saved or deleted offer.
+    """
+    bump_offer_version(instance.pk)
+
+
+@receiver(post_save, sender=Offer)
+def generate_offer_image_variants(sender, instance, **kwargs):
+    """
+    Schedule generation of the image variants if the offer's image changed.
+
+    Args:
+        sender: The Offer model class.
+        instance (Offer): The saved offer.
+    """
+    sync_image_variants(instance, "image", "image_variants")
@@ -1,3 +1,817 @@
-from django.test import TestCase
+import base64
+import json
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from authentication_app.models import User
+from core.testing import (
+    CompiledSerializerAssertionsMixin,
+    QueryCountAssertionsMixin,
+    QueryPlanAssertionsMixin,
+)
+from offers_app.api.serializers import OfferSerializer
+from offers_app.models import Offer, OfferDetail
+from offers_app.search import SEARCH_TABLE
+from orders_app.models import Order
+
+
+class OfferIndexTests(QueryPlanAssertionsMixin, TestCase):
+    """
+    The hot Offer queries must be served by an index.
+    """
+
+    def test_offers_of_business_newest_first_use_index(self):
+        self.assertOrderedByIndex(
+            Offer.objects.filter(business_user_id=1).order_by("-created_at", "-id"),
+            "offer_business_created_idx",
+        )
+
+    def test_list_sort_keys_use_index(self):
+        indexes = {
+            "created_at": "offer_created_idx",
+            "updated_at": "offer_updated_idx",
+            "min_price": "offer_min_price_idx",
+            "min_delivery_time": "offer_min_delivery_idx",
+        }
+        for field, index_name in indexes.items():
+            for prefix in ("", "-"):
+                self.assertOrderedByIndex(
+                    Offer.objects.order_by(f"{prefix}{field}", f"{prefix}id")[:2],
+                    index_name,
+                )
+
+    def test_summary_filters_use_index(self):
+        self.assertUsesIndex(Offer.objects.filter(min_price__gte=100))
+        self.assertUsesIndex(Offer.objects.filter(min_delivery_time__lte=7))
+
+
+class OfferOrderingTests(TestCase):
+    """
+    The offer list only sorts by declared keys and breaks ties by id.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        business = User.objects.create(username="business", type="business")
+        self.offers = [
+            Offer.objects.create(business_user=business, title=f"Offer {index}")
+            for index in range(3)
+        ]
+        for offer, price in zip(self.offers, (20, 10, 20)):
+            OfferDetail.objects.create(
+                offer=offer, price=price, delivery_time_in_days=3, offer_type="basic"
+            )
+
+    def ids(self, ordering):
+        response = self.client.get(f"/api/offers/?page_size=10&ordering={ordering}")
+        return [offer["id"] for offer in response.json()["results"]]
+
+    def test_ties_are_broken_by_id(self):
+        first, second, third = (offer.pk for offer in self.offers)
+
+        self.assertEqual(self.ids("min_price"), [second, first, third])
+        self.assertEqual(self.ids("-min_price"), [third, first, second])
+
+    def test_undeclared_ordering_is_rejected(self):
+        for ordering in ("title", "details__price", "-business_user__username", "x"):
+            response = self.client.get(f"/api/offers/?ordering={ordering}")
+            self.assertEqual(response.status_code, 400, ordering)
+
+
+class OfferDetailSummaryTests(TestCase):
+    """
+    min_price / min_delivery_time follow detail writes and can be recomputed in bulk.
+    """
+
+    def setUp(self):
+        business = User.objects.create(username="business", type="business")
+        self.offer = Offer.objects.create(business_user=business, title="Logo")
+        self.cheap = OfferDetail.objects.create(
+            offer=self.offer, price=50, delivery_time_in_days=7, offer_type="basic"
+        )
+        self.fast = OfferDetail.objects.create(
+            offer=self.offer, price=200, delivery_time_in_days=2, offer_type="premium"
+        )
+
+    def summary(self, offer=None):
+        offer = Offer.objects.get(pk=(offer or self.offer).pk)
+        return offer.min_price, offer.min_delivery_time
+
+    def test_detail_edits_and_deletes_update_the_summary(self):
+        self.assertEqual(self.summary(), (50, 2))
+
+        self.cheap.price = 80
+        self.cheap.save()
+        self.assertEqual(self.summary(), (80, 2))
+
+        OfferDetail.objects.filter(pk=self.fast.pk).delete()
+        self.assertEqual(self.summary(), (80, 7))
+
+        self.cheap.delete()
+        self.assertEqual(self.summary(), (None, None))
+
+    def test_bulk_updates_are_repaired_by_refresh(self):
+        OfferDetail.objects.filter(offer=self.offer).update(
+            price=10, delivery_time_in_days=1
+        )
+        self.assertEqual(self.summary(), (50, 2))
+        updated_at = Offer.objects.get(pk=self.offer.pk).updated_at
+
+        self.assertEqual(
+            Offer.objects.filter(pk=self.offer.pk).refresh_detail_summary(), 1
+        )
+
+        self.assertEqual(self.summary(), (10, 1))
+        # Without touch=True the validators of the offer are left alone
+        self.assertEqual(Offer.objects.get(pk=self.offer.pk).updated_at, updated_at)
+
+    def test_backfill_command_recomputes_all_offers_in_batches(self):
+        empty = Offer.objects.create(title="Without details")
+        Offer.objects.update(min_price=999, min_delivery_time=99)
+
+        out = StringIO()
+        call_command("backfill_offer_summary", batch_size=1, stdout=out)
+
+        self.assertIn("Updated 2 offers.", out.getvalue())
+        self.assertEqual(self.summary(), (50, 2))
+        self.assertEqual(self.summary(empty), (None, None))
+
+
+class OfferSearchTests(TestCase):
+    """
+    `?search=` matches offers and their details through the sidecar full-text index.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        # Authenticated requests bypass the response cache
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+        self.titled = Offer.objects.create(
+            business_user=self.business, title="Logo Design", description="Vector"
+        )
+        self.described = Offer.objects.create(
+            business_user=self.business,
+            title="Branding",
+            description="A logo and a style guide",
+        )
+        self.detailed = Offer.objects.create(business_user=self.business, title="Web")
+        self.detail = OfferDetail.objects.create(
+            offer=self.detailed,
+            title="Landingpage",
+            features=["Responsive", "Kontaktformular"],
+            price=100,
+            delivery_time_in_days=5,
+            offer_type="basic",
+        )
+
+    def titles(self, search):
+        response = self.client.get(f"/api/offers/?search={search}&page_size=10")
+        self.assertEqual(response.status_code, 200)
+        return [offer["title"] for offer in response.json()["results"]]
+
+    def indexed_ids(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT rowid FROM {SEARCH_TABLE} ORDER BY rowid")
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_title_matches_rank_before_description_matches(self):
+        self.assertEqual(self.titles("logo"), ["Logo Design", "Branding"])
+
+    def test_detail_titles_and_features_match(self):
+        self.assertEqual(self.titles("landingpage"), ["Web"])
+        self.assertEqual(self.titles("kontaktformular"), ["Web"])
+
+    def test_words_match_as_prefixes_and_all_must_match(self):
+        self.assertEqual(self.titles("desi"), ["Logo Design"])
+        self.assertEqual(self.titles("logo sty"), ["Branding"])
+        self.assertEqual(self.titles("logo web"), [])
+
+    def test_deletes_leave_the_index(self):
+        self.detail.delete()
+        self.assertEqual(self.titles("kontaktformular"), [])
+
+        self.detailed.delete()
+        self.assertEqual(self.indexed_ids(), [self.titled.pk, self.described.pk])
+
+    def test_rebuild_command_restores_the_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        self.assertEqual(self.titles("logo"), [])
+
+        out = StringIO()
+        call_command("rebuild_offer_search", stdout=out)
+
+        self.assertIn("Offer search index rebuilt.", out.getvalue())
+        self.assertEqual(self.titles("logo"), ["Logo Design", "Branding"])
+        self.assertEqual(self.titles("responsive"), ["Web"])
+
+    def test_fallback_matches_the_same_columns(self):
+        with mock.patch("offers_app.search._vendor", return_value=None):
+            self.assertEqual(sorted(self.titles("logo")), ["Branding", "Logo Design"])
+            self.assertEqual(self.titles("kontaktformular"), ["Web"])
+            self.assertEqual(self.titles("landingpage"), ["Web"])
+
+
+class OfferResponseCacheTests(TestCase):
+    """
+    Anonymous offer responses are cached and invalidated by offer and detail writes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        business = User.objects.create_user("business", password="pw", type="business")
+        self.offer = Offer.objects.create(business_user=business, title="Logo")
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, price=100, delivery_time_in_days=5, offer_type="basic"
+        )
+
+    def test_repeated_list_request_is_a_hit(self):
+        first = self.client.get("/api/offers/?page_size=5&creator_id=1")
+        second = self.client.get("/api/offers/?creator_id=1&page_size=5")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.json(), second.json())
+
+    def test_detail_write_invalidates_cached_responses(self):
+        self.client.get("/api/offers/")
+        self.client.get(f"/api/offers/{self.offer.pk}/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.detail.price = 50
+            self.detail.save()
+
+        listing = self.client.get("/api/offers/")
+        detail = self.client.get(f"/api/offers/{self.offer.pk}/")
+        self.assertEqual(listing["X-Cache"], "MISS")
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.json()["min_price"], 50)
+
+    def test_versions_are_bumped_when_the_update_commits(self):
+        url = f"/api/offers/{self.offer.pk}/"
+        self.client.get(url)
+        owner = APIClient()
+        owner.force_authenticate(self.offer.business_user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = owner.patch(url, {"title": "Logo design"}, format="json")
+            self.assertEqual(response.status_code, 200)
+            # Until the commit, readers still get the entry of the committed data
+            self.assertEqual(self.client.get(url)["X-Cache"], "HIT")
+
+        detail = self.client.get(url)
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.json()["title"], "Logo design")
+        self.assertEqual(self.client.get(url)["X-Cache"], "HIT")
+
+
+class OfferConditionalGetTests(TestCase):
+    """
+    Offer responses carry validators and matching conditional requests get a 304.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business = User.objects.create(username="business", type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+        self.offer = Offer.objects.create(business_user=self.business, title="Logo")
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, price=100, delivery_time_in_days=5, offer_type="basic"
+        )
+        self.url = f"/api/offers/{self.offer.pk}/"
+
+    def test_retrieve_revalidates(self):
+        response = self.client.get(self.url)
+        self.assertIn("Last-Modified", response)
+
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+        self.assertEqual(not_modified.content, b"")
+
+    def test_detail_write_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        self.detail.price = 50
+        self.detail.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_follows_rows(self):
+        etag = self.client.get("/api/offers/")["ETag"]
+        response = self.client.get("/api/offers/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Offer.objects.create(business_user=self.business, title="Other").delete()
+        self.offer.delete()
+        response = self.client.get("/api/offers/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_cached_response_revalidates_without_queries(self):
+        anonymous = APIClient()
+        etag = anonymous.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = anonymous.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+
+class OfferFacetTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Facet counts follow the list filters and are computed in one query.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        business = User.objects.create(username="business", type="business")
+        for title, price, days, offer_types in (
+            ("Logo design", 30, 2, ("basic",)),
+            ("Logo animation", 120, 5, ("basic", "premium")),
+            ("Website", 900, 20, ("standard",)),
+        ):
+            offer = Offer.objects.create(business_user=business, title=title)
+            for offer_type in offer_types:
+                OfferDetail.objects.create(
+                    offer=offer,
+                    price=price,
+                    delivery_time_in_days=days,
+                    offer_type=offer_type,
+                )
+
+    def counts(self, facets, name):
+        return {bucket["key"]: bucket["count"] for bucket in facets[name]}
+
+    def test_facets_of_all_offers(self):
+        facets = self.assertQueryCount(1, self.client, "get", "/api/offers/facets/")
+        facets = facets.json()
+
+        self.assertEqual(facets["total"], 3)
+        self.assertEqual(
+            self.counts(facets, "price"),
+            {"0-50": 1, "50-100": 0, "100-250": 1, "250-500": 0, "500+": 1},
+        )
+        self.assertEqual(
+            self.counts(facets, "delivery_time"),
+            {"1": 0, "3": 1, "7": 2, "14": 2, "30": 3},
+        )
+        self.assertEqual(
+            self.counts(facets, "offer_type"),
+            {"basic": 2, "standard": 1, "premium": 1},
+        )
+
+    def test_facets_share_list_filters(self):
+        facets = self.assertQueryCount(
+            1, self.client, "get", "/api/offers/facets/?search=logo&max_delivery_time=3"
+        ).json()
+
+        self.assertEqual(facets["total"], 1)
+        self.assertEqual(self.counts(facets, "offer_type")["premium"], 0)
+
+    def test_invalid_filters_are_rejected_by_list_and_facets(self):
+        for url in ("/api/offers/", "/api/offers/facets/"):
+            for query in ("creator_id=abc", "creator_id=0", "min_price=-1"):
+                with self.subTest(url=url, query=query):
+                    response = self.client.get(f"{url}?{query}")
+                    self.assertEqual(response.status_code, 400)
+                    self.assertIn(query.split("=")[0], response.json()["detail"])
+            response = self.client.get(f"{url}?min_price=0&max_delivery_time=0")
+            self.assertEqual(response.status_code, 200)
+
+    def test_facets_are_cached(self):
+        self.client.get("/api/offers/facets/")
+        self.assertEqual(self.client.get("/api/offers/facets/")["X-Cache"], "HIT")
+
+
+class OfferBulkTests(TestCase):
+    """
+    NDJSON import writes in batches and reports per-line errors; the export streams.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business = User.objects.create(username="business", type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def line(self, title, price=10):
+        return json.dumps(
+            {
+                "title": title,
+                "description": "Imported",
+                "details": [
+                    {
+                        "title": "Basic",
+                        "revisions": 1,
+                        "delivery_time_in_days": 4,
+                        "price": price,
+                        "features": ["Logo"],
+                        "offer_type": "basic",
+                    }
+                ],
+            }
+        )
+
+    def post_ndjson(self, lines):
+        return self.client.post(
+            "/api/offers/import/",
+            data="\n".join(lines),
+            content_type="application/x-ndjson",
+        )
+
+    def test_import_reports_invalid_lines(self):
+        response = self.post_ndjson(
+            [self.line("Logo", 30), "{broken", "", json.dumps({"title": "No details"})]
+        )
+
+        self.assertEqual(response.status_code, 201)
+        report = response.json()
+        self.assertEqual((report["created"], report["failed"]), (1, 2))
+        self.assertEqual([error["line"] for error in report["errors"]], [2, 4])
+        self.assertIn("details", report["errors"][1]["errors"])
+
+        offer = Offer.objects.get()
+        self.assertEqual((offer.business_user, offer.min_price), (self.business, 30))
+        self.assertEqual(self.client.get("/api/offers/?search=logo").json()["count"], 1)
+
+    def test_import_queries_do_not_grow_with_lines(self):
+        with CaptureQueriesContext(connection) as few:
+            self.post_ndjson([self.line(f"Offer {index}") for index in range(2)])
+        with CaptureQueriesContext(connection) as many:
+            self.post_ndjson([self.line(f"Offer {index}") for index in range(40)])
+
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(Offer.objects.count(), 42)
+
+    def test_only_invalid_lines_is_a_bad_request(self):
+        self.assertEqual(self.post_ndjson(["[]"]).status_code, 400)
+
+    def test_export_round_trips(self):
+        self.post_ndjson([self.line("Logo"), self.line("Website")])
+
+        response = self.client.get("/api/offers/export/?search=website")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(len(lines), 1)
+        exported = json.loads(lines[0])
+        self.assertEqual(exported["title"], "Website")
+        self.assertEqual(exported["details"][0]["price"], "10.00")
+
+        self.assertEqual(self.post_ndjson(lines).json()["created"], 1)
+
+    def test_export_command_writes_to_its_stdout(self):
+        self.post_ndjson([self.line("Logo"), self.line("Website")])
+
+        out = StringIO()
+        call_command("export_offers_ndjson", batch_size=1, stdout=out)
+
+        titles = [json.loads(line)["title"] for line in out.getvalue().splitlines()]
+        self.assertEqual(sorted(titles), ["Logo", "Website"])
+
+
+class OfferSparseFieldsetTests(TestCase):
+    """
+    Sparse fieldsets prune the rendered fields, the loaded columns and the details prefetch.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        business = User.objects.create(username="business", type="business")
+        self.offer = Offer.objects.create(
+            business_user=business, title="Logo", description="Long text"
+        )
+        OfferDetail.objects.create(
+            offer=self.offer, price=10, delivery_time_in_days=3, offer_type="basic"
+        )
+
+    def test_list_cards(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/offers/?fields=id,title,image,min_price")
+
+        self.assertEqual(
+            list(response.json()["results"][0]), ["id", "title", "image", "min_price"]
+        )
+        sql = "\n".join(query["sql"] for query in queries)
+        self.assertNotIn("offers_app_offerdetail", sql)
+        self.assertNotIn('"description"', sql)
+        self.assertEqual(len(queries), 3)
+
+    def test_omit_and_nested_fields(self):
+        response = self.client.get(
+            f"/api/offers/{self.offer.pk}/?omit=details,description"
+        )
+        data = response.json()
+
+        self.assertNotIn("details", data)
+        self.assertNotIn("description", data)
+        self.assertEqual(data["user_details"]["username"], "business")
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get("/api/offers/?fields=id,secret")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class OfferCompiledReadTests(CompiledSerializerAssertionsMixin, TestCase):
+    """
+    The compiled list read path renders the same bytes as OfferSerializer.
+    """
+
+    def setUp(self):
+        cache.clear()
+        business = User.objects.create(
+            username="business", first_name="Büsi", type="business"
+        )
+        offer = Offer.objects.create(
+            business_user=business,
+            title="Logo",
+            description="Ünïcode <b>",
+            image="offer_images/logo.png",
+            image_variants={
+                "source": "offer_images/logo.png",
+                "thumb": {"webp": "offer_images/variants/logo_thumb.webp"},
+            },
+        )
+        for offer_type, price in (("basic", "10.5"), ("premium", "1234.125")):
+            OfferDetail.objects.create(
+                offer=offer,
+                title=offer_type,
+                price=price,
+                delivery_time_in_days=3,
+                features=["Logo", "Icon"],
+                offer_type=offer_type,
+            )
+        # Orphaned offer without user, image, details or summary
+        Offer.objects.create(title="Orphan")
+
+    def test_matches_serializer(self):
+        self.assertCompiledMatches(OfferSerializer, Offer.objects.order_by("id"))
+
+    def test_matches_sparse_serializer(self):
+        self.assertCompiledMatches(
+            OfferSerializer,
+            Offer.objects.order_by("id"),
+            fields=["id", "user", "user_details", "min_price"],
+        )
+
+    def test_list_endpoint(self):
+        response = self.client.get("/api/offers/?page_size=10&ordering=created_at")
+        results = response.json()["results"]
+
+        self.assertEqual(results[0]["user"], results[0]["business_user"])
+        self.assertNotIn("user", results[1])
+        self.assertEqual(results[0]["min_price"], 10)
+        self.assertEqual(
+            [d["offer_type"] for d in results[0]["details"]], ["basic", "premium"]
+        )
+
+    def test_keyset_pages(self):
+        response = self.client.get("/api/offers/?pagination=cursor&page_size=1")
+        next_page = self.client.get(response.json()["next"]).json()
+
+        self.assertEqual(next_page["results"][0]["title"], "Logo")
+        self.assertIsNone(next_page["next"])
+
+    def test_tampered_cursors_are_not_found(self):
+        for value in ("abc", {}, [1, 2], None, "2026-13-01T00:00:00"):
+            cursor = base64.urlsafe_b64encode(
+                json.dumps({"v": value, "p": 1}).encode("utf-8")
+            ).decode("ascii")
+            with self.subTest(value=value):
+                response = self.client.get(
+                    f"/api/offers/?pagination=cursor&cursor={cursor}"
+                )
+                self.assertEqual(response.status_code, 404)
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class OfferNestedWriteTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Nested detail writes only touch the detail rows that actually changed.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business = User.objects.create_user(
+            "business", password="pw", type="business"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+        response = self.client.post(
+            "/api/offers/",
+            {
+                "title": "Logo",
+                "description": "Logos",
+                "details": [
+                    self.detail_payload("basic", 100, 7),
+                    self.detail_payload("premium", 300, 2),
+                ],
+            },
+            format="json",
+        )
+        self.offer_id = response.json()["id"]
+        self.basic, self.premium = OfferDetail.objects.filter(
+            offer_id=self.offer_id
+        ).order_by("price")
+
+    def detail_payload(self, offer_type, price, days):
+        return {
+            "title": offer_type.title(),
+            "revisions": 1,
+            "delivery_time_in_days": days,
+            "price": price,
+            "features": ["Logo"],
+            "offer_type": offer_type,
+        }
+
+    def test_create_sets_summary(self):
+        offer = Offer.objects.get(pk=self.offer_id)
+        self.assertEqual(offer.min_price, 100)
+        self.assertEqual(offer.min_delivery_time, 2)
+
+    def test_patch_updates_matched_detail_in_place(self):
+        response = self.client.patch(
+            f"/api/offers/{self.offer_id}/",
+            {"details": [self.detail_payload("basic", 50, 7)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["min_price"], 50)
+        self.assertEqual(
+            set(OfferDetail.objects.values_list("pk", flat=True)),
+            {self.basic.pk, self.premium.pk},
+        )
+
+    def test_unchanged_details_are_not_written(self):
+        payload = {"details": [self.detail_payload("premium", 300, 2)]}
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.patch(f"/api/offers/{self.offer_id}/", payload, format="json")
+
+        detail_writes = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(("UPDATE", "INSERT", "DELETE"))
+            and '"offers_app_offerdetail"' in query["sql"].split("SET")[0]
+        ]
+        self.assertEqual(detail_writes, [])
+
+    def test_put_deletes_details_missing_from_payload(self):
+        # The offer is refreshed once, however many details are deleted
+        response = self.assertQueryCount(
+            18,
+            self.client,
+            "put",
+            f"/api/offers/{self.offer_id}/",
+            data={
+                "title": "Logo",
+                "description": "Logos",
+                "details": [
+                    dict(self.detail_payload("standard", 200, 4), id=self.premium.pk)
+                ],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(OfferDetail.objects.values_list("pk", "offer_type")),
+            [(self.premium.pk, "standard")],
+        )
+
+    def test_put_keeps_details_with_orders(self):
+        order = Order.objects.create(
+            customer_user=User.objects.create(username="customer", type="customer"),
+            business_user=self.business,
+            offer_detail=self.premium,
+            status="in_progress",
+        )
+
+        response = self.client.put(
+            f"/api/offers/{self.offer_id}/",
+            {
+                "title": "Logo design",
+                "description": "Logos",
+                "details": [self.detail_payload("basic", 100, 5)],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(str(self.premium.pk), str(response.json()["details"]))
+        self.assertTrue(Order.objects.filter(pk=order.pk).exists())
+        self.assertTrue(OfferDetail.objects.filter(pk=self.premium.pk).exists())
+        self.assertEqual(Offer.objects.get(pk=self.offer_id).title, "Logo")
+
+    def test_foreign_detail_id_is_rejected(self):
+        response = self.client.patch(
+            f"/api/offers/{self.offer_id}/",
+            {"details": [dict(self.detail_payload("basic", 1, 1), id=999)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class OfferQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Offer endpoints run a fixed number of queries, independent of the number of rows.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business = User.objects.create(username="business", type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+        self.offer = self.create_offers(1)[0]
+
+    def create_offers(self, count):
+        offers = []
+        for index in range(count):
+            owner = User.objects.create(
+                username=f"owner{User.objects.count()}", type="business"
+            )
+            offer = Offer.objects.create(business_user=owner, title=f"Offer {index}")
+            for offer_type in ("basic", "standard", "premium"):
+                OfferDetail.objects.create(
+                    offer=offer,
+                    price=10,
+                    delivery_time_in_days=3,
+                    offer_type=offer_type,
+                )
+            offers.append(offer)
+        return offers
+
+    def detail_payload(self, offer_type, price):
+        return {
+            "title": offer_type,
+            "revisions": 1,
+            "delivery_time_in_days": 3,
+            "price": price,
+            "features": [],
+            "offer_type": offer_type,
+        }
+
+    def test_list_is_constant_in_page_size(self):
+        anonymous = APIClient()
+        for extra in (0, 5):
+            self.create_offers(extra)
+            cache.clear()
+            self.assertQueryCount(4, anonymous, "get", "/api/offers/?page_size=100")
+            self.assertQueryCount(4, self.client, "get", "/api/offers/?page_size=100")
+
+    def test_retrieve(self):
+        self.assertQueryCount(2, self.client, "get", f"/api/offers/{self.offer.pk}/")
+
+    def test_offer_details(self):
+        detail = self.offer.details.first()
+        self.assertQueryCount(1, self.client, "get", f"/api/offerdetails/{detail.pk}/")
+
+    def test_write_endpoints(self):
+        details = [
+            self.detail_payload(offer_type, 10)
+            for offer_type in ("basic", "standard", "premium")
+        ]
+        # The response also loads the business user's rating summary
+        response = self.assertQueryCount(
+            16,
+            self.client,
+            "post",
+            "/api/offers/",
+            data={"title": "New", "description": "New", "details": details},
+            format="json",
+        )
+        url = f"/api/offers/{response.json()['id']}/"
+
+        self.assertQueryCount(
+            13,
+            self.client,
+            "patch",
+            url,
+            data={"title": "Changed", "details": [self.detail_payload("basic", 5)]},
+            format="json",
+        )
+        # Cascades to the details, their orders and archived orders
+        self.assertQueryCount(8, self.client, "delete", url)
+
+    def test_cache_stats(self):
+        self.business.is_staff = True
+        self.assertQueryCount(0, self.client, "get", "/api/offers/cache-stats/")
@@ -0,0 +1,162 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+
+from orders_app.models import OrderDailyRollup
+
+"""
+Revenue and order volume analytics of a business user, answered from OrderDailyRollup.
+
+A range query reads at most one rollup row per day, offer type and status, aggregated by the
+database into day, week (ISO, starting Monday) or month periods. The cost depends on the length
+of the range, not on the number of orders.
+
+Per period the response has:
+    orders: Number of orders created in the period (any status).
+    completed / cancelled: How many of them are completed or cancelled now.
+    revenue: Sum of the prices of the completed ones, as a decimal string.
+    offer_types: The same numbers per offer type.
+
+Periods without orders are included with zeros, so the buckets form a continuous series.
+
+Functions:
+    parse_analytics_params: Validate the interval, start and end query parameters.
+    business_analytics: Build the analytics response of a business user.
+"""
+
+
+INTERVALS = {"day": None, "week": TruncWeek, "month": TruncMonth}
+DEFAULT_RANGE_DAYS = 30
+# Longest range accepted per interval, in days
+MAX_RANGE_DAYS = {"day": 366, "week": 3 * 366, "month": 10 * 366}
+
+
+def _date_param(params, name, default):
+    value = params.get(name)
+    if not value:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ParseError(f"`{name}` must be a date (YYYY-MM-DD).")
+
+
+def parse_analytics_params(params):
+    """
+    Validate the analytics query parameters.
+
+    Args:
+        params (QueryDict): interval ('day', 'week' or 'month'; default 'day'), start and end
+            (inclusive ISO dates; default: the last DEFAULT_RANGE_DAYS days up to today).
+
+    Raises:
+        ParseError: If a parameter is invalid or the range is too long for the interval.
+
+    Returns:
+        tuple[str, date, date]: interval, start and end.
+    """
+    interval = params.get("interval") or "day"
+    if interval not in INTERVALS:
+        raise ParseError(f"`interval` must be one of: {', '.join(INTERVALS)}.")
+    end = _date_param(params, "end", timezone.localdate())
+    start = _date_param(params, "start", end - timedelta(days=DEFAULT_RANGE_DAYS - 1))
+    if start > end:
+        raise ParseError("`start` must not be after `end`.")
+    if (end - start).days >= MAX_RANGE_DAYS[interval]:
+        raise ParseError(
+            f"Ranges with interval '{interval}' may span at most "
+            f"{MAX_RANGE_DAYS[interval]} days."
+        )
+    return interval, start, end
+
+
+def _period_start(day, interval):
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    if interval == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_period(day, interval):
+    if interval == "week":
+        return day + timedelta(days=7)
+    if interval == "month":
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+
+def _empty_totals():
+    return {"orders": 0, "completed": 0, "cancelled": 0, "revenue": 0}
+
+
+def _add(totals, status, count, cents):
+    totals["orders"] += count
+    if status in ("completed", "cancelled"):
+        totals[status] += count
+    if status == "completed":
+        totals["revenue"] += cents
+
+
+def _format(totals):
+    return {**totals, "revenue": f"{Decimal(totals['revenue']).scaleb(-2):.2f}"}
+
+
+def business_analytics(business_user_id, interval, start, end):
+    """
+    Return the order analytics of a business user between start and end (inclusive).
+
+    Runs one aggregate query over the rollup rows of the range.
+
+    Returns:
+        dict: {'business_user', 'interval', 'start', 'end', 'totals', 'periods': [...]}, each
+        period {'period': first day, **totals, 'offer_types': {offer_type: totals}}.
+    """
+    rollups = OrderDailyRollup.objects.filter(
+        business_user_id=business_user_id, day__range=(start, end)
+    )
+    trunc = INTERVALS[interval]
+    rows = (
+        rollups.annotate(period=trunc("day") if trunc else F("day"))
+        .values("period", "offer_type", "status")
+        .annotate(order_count=Sum("order_count"), price_cents=Sum("price_cents"))
+        .order_by()
+    )
+
+    periods = {}
+    day = _period_start(start, interval)
+    while day <= end:
+        periods[day] = {**_empty_totals(), "offer_types": {}}
+        day = _next_period(day, interval)
+
+    totals = _empty_totals()
+    for row in rows:
+        bucket = periods[_period_start(row["period"], interval)]
+        offer_type = bucket["offer_types"].setdefault(
+            row["offer_type"], _empty_totals()
+        )
+        for target in (totals, bucket, offer_type):
+            _add(target, row["status"], row["order_count"], row["price_cents"])
+
+    return {
+        "business_user": business_user_id,
+        "interval": interval,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "totals": _format(totals),
+        "periods": [
+            {
+                "period": period.isoformat(),
+                **_format({key: bucket[key] for key in _empty_totals()}),
+                "offer_types": {
+                    name: _format(values)
+                    for name, values in sorted(bucket["offer_types"].items())
+                },
+            }
+            for period, bucket in periods.items()
+        ],
+    }
@@ -1,15 +1,19 @@
 from rest_framework import serializers
-from orders_app.models import Order, OfferDetail
+from orders_app.models import STATUS_TYPES, Order, OfferDetail
+from orders_app.transitions import MAX_BULK_TRANSITIONS
+from core.fieldsets import SparseFieldsetSerializerMixin
+from core.identitymap import get_identity_map
 
 """
 Serializers for the orders_app, managing creation and validation of Order instances.
 
 Classes:
     OrderSerializer: Handles validating an OfferDetail ID and creating an Order for the current user.
+    OrderTransitionSerializer: Validates a batch of order status transitions.
 """
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Order model that facilitates ordering a specific OfferDetail.
 
@@ -17,6 +21,8 @@ class OrderSerializer(serializers.ModelSerializer):
         offer_detail_id (int): ID of the OfferDetail to order (write-only).
         All other Order model fields (read/write as defined in Meta).
 
+    Accepts `fields` / `omit` keyword arguments for sparse fieldsets (see core.fieldsets).
+
     Methods:
         validate_offer_detail_id: Ensures the provided OfferDetail exists.
         create: Creates an Order linking customer, business, and detail properties.
@@ -28,6 +34,9 @@ class OrderSerializer(serializers.ModelSerializer):
         """
         Validate that an OfferDetail with the given primary key exists.
 
+        The detail is loaded with its offer through the request's identity map (when a request
+        is in the context), so other lookups of the same row in this request reuse it.
+
         Args:
             value (int): OfferDetail primary key provided by the client.
 
@@ -37,12 +46,17 @@ class OrderSerializer(serializers.ModelSerializer):
         Returns:
             OfferDetail: The retrieved OfferDetail instance.
         """
-        try:
-            return OfferDetail.objects.get(pk=value)
-        except OfferDetail.DoesNotExist:
+        queryset = OfferDetail.objects.select_related("offer")
+        request = self.context.get("request")
+        if request is not None:
+            offer_detail = get_identity_map(request).get(queryset, value)
+        else:
+            offer_detail = queryset.filter(pk=value).first()
+        if offer_detail is None:
             raise serializers.ValidationError(
                 "Offer detail with this ID does not exist."
             )
+        return offer_detail
 
     def create(self, validated_data):
         """
@@ -64,7 +78,7 @@ class OrderSerializer(serializers.ModelSerializer):
 
         order = Order.objects.create(
             customer_user=user,
-            business_user=offer_detail.offer.business_user,
+            business_user_id=offer_detail.offer.business_user_id,
             title=offer_detail.title,
             revisions=offer_detail.revisions,
             delivery_time_in_days=offer_detail.delivery_time_in_days,
@@ -85,3 +99,29 @@ class OrderSerializer(serializers.ModelSerializer):
 
         model = Order
         fields = "__all__"
+
+
+class OrderTransitionItemSerializer(serializers.Serializer):
+    """
+    One requested status change: the order id and its target status.
+    """
+
+    id = serializers.IntegerField(min_value=1)
+    status = serializers.ChoiceField(choices=STATUS_TYPES)
+
+
+class OrderTransitionSerializer(serializers.Serializer):
+    """
+    Validates the payload of a bulk status transition request.
+
+    Fields:
+        transitions (list): 1 to MAX_BULK_TRANSITIONS {'id': int, 'status': str} items.
+
+    Whether a transition is allowed is decided per order by orders_app.transitions.
+    """
+
+    transitions = serializers.ListField(
+        child=OrderTransitionItemSerializer(),
+        min_length=1,
+        max_length=MAX_BULK_TRANSITIONS,
+    )
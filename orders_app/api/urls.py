@@ -1,5 +1,14 @@
 from django.urls import path
-from .views import OrderListView, OrderDetailView, OrderCountView, OrderCompletedView
+from .views import (
+    OrderListView,
+    OrderDetailView,
+    OrderExportView,
+    OrderTransitionView,
+    OrderCountView,
+    OrderCompletedView,
+    OrderStatsView,
+    OrderAnalyticsView,
+)
 
 """
 URL patterns for the orders_app API.
@@ -9,20 +18,36 @@ Defines endpoints under the '/api/' prefix for managing orders and retrieving or
 Endpoints:
     GET, POST   /api/orders/                       -> OrderListView: List user-specific orders or create a new order (customers only).
     GET, PUT, PATCH, DELETE /api/orders/<pk>/      -> OrderDetailView: Retrieve, update, or delete a specific order.
+    GET          /api/orders/export/               -> OrderExportView: Stream the user's orders as CSV or NDJSON.
+    POST         /api/orders/transitions/          -> OrderTransitionView: Change the status of many orders (business users only).
     GET          /api/order-count/<pk>/           -> OrderCountView: Get count of in-progress orders for a business user.
     GET          /api/completed-order-count/<pk>/ -> OrderCompletedView: Get count of completed orders for a business user.
+    GET          /api/order-stats/<pk>/           -> OrderStatsView: Get the order counts of all statuses for a business user.
+    GET          /api/order-analytics/<pk>/       -> OrderAnalyticsView: Get order volume and revenue per period (business itself or staff).
 
 Naming conventions:
     'orders'                  - Collection endpoint for orders.
     'order-detail'            - Detail endpoint for individual orders.
+    'order-export'            - Streaming export endpoint for orders.
+    'order-transitions'       - Bulk status transition endpoint.
     'order-count'             - Endpoint for in-progress order count.
     'completed-order-count'   - Endpoint for completed order count.
+    'order-stats'             - Endpoint for all order counts of a business user.
+    'order-analytics'         - Endpoint for the order analytics of a business user.
 """
 urlpatterns = [
     # List all orders for the user and create a new order
     path("orders/", OrderListView.as_view(), name="orders"),
     # Retrieve, update, or delete a specific order by ID
     path("orders/<int:pk>/", OrderDetailView.as_view(), name="order-detail"),
+    # Stream the user's orders as CSV or NDJSON
+    path("orders/export/", OrderExportView.as_view(), name="order-export"),
+    # Change the status of many orders in one transaction
+    path(
+        "orders/transitions/",
+        OrderTransitionView.as_view(),
+        name="order-transitions",
+    ),
     # Get count of 'in_progress' orders for a business user
     path("order-count/<int:pk>/", OrderCountView.as_view(), name="order-count"),
     # Get count of 'completed' orders for a business user
@@ -31,4 +56,12 @@ urlpatterns = [
         OrderCompletedView.as_view(),
         name="completed-order-count",
     ),
+    # Get the counts of all order statuses for a business user
+    path("order-stats/<int:pk>/", OrderStatsView.as_view(), name="order-stats"),
+    # Get order volume and revenue per day, week or month for a business user
+    path(
+        "order-analytics/<int:pk>/",
+        OrderAnalyticsView.as_view(),
+        name="order-analytics",
+    ),
 ]
@@ -1,11 +1,28 @@
 from rest_framework import generics, status, permissions
-from django.db.models import Q
+from rest_framework.exceptions import ParseError, PermissionDenied
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 
-from orders_app.models import Order
-from .serializers import OrderSerializer
-from core.permissions import IsCustomerOrReadOnly, IsBusinessForUpdateOrAdminForDelete
+from orders_app.analytics import business_analytics, parse_analytics_params
+from orders_app.filters import filter_orders, include_history
+from orders_app.models import STATUS_TYPES, ArchivedOrder, Order, OrderCounter
+from orders_app.transitions import transition_orders
+from .serializers import OrderSerializer, OrderTransitionSerializer
+from core.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from core.exports import StreamingExportView
+from core.ordering import resolve_ordering
+from core.pagination import OptionalResultsSetPagination
+from core.fastpath import CompiledListMixin
+from core.fieldsets import SparseFieldsetViewMixin
+from core.idempotency import IdempotencyMixin
+from core.identitymap import IdentityMapMixin
+from core.params import filter_created_range
+from core.permissions import (
+    IsBusinessForUpdateOrAdminForDelete,
+    IsBusinessOrReadOnly,
+    IsCustomerOrReadOnly,
+)
 from authentication_app.models import User
 
 """
@@ -13,45 +30,142 @@ API views for the orders_app, handling listing, creation, retrieval, updates, de
 
 Views:
     OrderListView:
-        - GET: List all orders related to the requesting user (as customer or business).
+        - GET: List all orders related to the requesting user (as customer or business), with an ETag.
         - POST: Create a new order from an OfferDetail (customers only).
     OrderDetailView:
-        - GET: Retrieve a single order by its ID.
+        - GET: Retrieve a single order by its ID (ETag / Last-Modified).
         - PUT/PATCH: Update an existing order (business owner only).
         - DELETE: Delete an order (business owner or admin for delete operations).
+    OrderExportView:
+        - GET: Stream the user's orders as CSV or NDJSON.
+    OrderTransitionView:
+        - POST: Change the status of many orders of the business user in one transaction.
     OrderCountView:
         - GET: Return count of in-progress orders for a given business user.
     OrderCompletedView:
         - GET: Return count of completed orders for a given business user.
+    OrderStatsView:
+        - GET: Return the order counts of all statuses for a given business user.
+    OrderAnalyticsView:
+        - GET: Return order volume and revenue per day, week or month for a business user.
+
+The count views read the materialized OrderCounter rows instead of counting orders; the analytics
+view reads the OrderDailyRollup rows.
 """
 
 
-class OrderListView(generics.ListCreateAPIView):
+class OrderListView(
+    IdempotencyMixin,
+    ConditionalListMixin,
+    CompiledListMixin,
+    SparseFieldsetViewMixin,
+    generics.ListCreateAPIView,
+):
     """
     GET: Return a list of Order instances related to the authenticated user.
         - Customers see their placed orders.
         - Business users see orders assigned to them.
 
+    Query Params:
+        role (str): 'customer' or 'business' to list only the orders the user placed or
+            fulfills (default: both).
+        status (str): One of 'in_progress', 'completed', 'cancelled'.
+        updated_since (str): ISO 8601 datetime; only orders with updated_at >= value.
+        ordering (str): 'created_at' or 'updated_at', '-' prefixed for descending
+            (default: '-created_at'). Ties are broken by id.
+        history (str): 'true' to include archived orders (see orders_app.archive).
+
+    Delta polling:
+        Clients remember the newest updated_at they have seen and poll with
+        `?updated_since=<value>&ordering=updated_at&pagination=cursor`, following `next` links.
+        Rows at exactly that timestamp are repeated, so clients merge by id.
+
+    History:
+        Finished orders are moved to the archive after ORDER_ARCHIVE_AFTER_DAYS. With
+        `?history=true` the list is a UNION of the user's active and archived orders, with the
+        same filters and ordering. It supports page number pagination but not cursors, and is
+        rendered by the regular serializer.
+
     POST: Place a new order by providing an 'offer_detail_id'.
         - Requires authenticated customer (IsCustomerOrReadOnly).
         - Validates, creates the Order, and returns full representation.
+
+    Pagination:
+        OptionalResultsSetPagination: Plain list unless pagination is requested;
+        `?pagination=cursor` switches to keyset pagination over keyset_ordering_fields.
+
+    Conditional GET:
+        Responses carry an ETag fingerprinting the user's orders (see ConditionalListMixin).
+
+    Sparse fieldsets:
+        `?fields=` / `?omit=` prune the rendered fields and loaded columns (see core.fieldsets).
+
+    Serialization:
+        GET lists are rendered from values() rows by the compiled read path (see core.fastpath).
+
+    Idempotency:
+        POSTs with an `Idempotency-Key` header are executed once; repeats replay the stored
+        response (see core.idempotency).
     """
 
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [permissions.IsAuthenticated, IsCustomerOrReadOnly]
+    # GET with history=true fingerprints both tables for the ETag
+    query_budget = {"GET": 4, "POST": 5}
+    pagination_class = OptionalResultsSetPagination
+    # Sort keys, each backed by per-role indexes (see Order.Meta.indexes)
+    ordering_fields = ("created_at", "updated_at")
+    keyset_ordering_fields = ("created_at", "updated_at")
 
     def get_queryset(self):
         """
-        Filter orders where the user is either the customer or business participant.
+        Filter the user's orders by the query parameters and apply the ordering.
 
         Returns:
-            QuerySet[Order]: Orders for the requesting user.
+            QuerySet[Order]: Filtered and ordered orders for the requesting user.
         """
-        user = self.request.user
-        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+        params = self.request.query_params
+        queryset = filter_orders(super().get_queryset(), self.request.user, params)
+        return queryset.order_by(*self.get_ordering())
 
-    def post(self, request, *args, **kwargs):
+    def get_ordering(self):
+        """
+        Return the order_by() arguments requested with the `ordering` parameter.
+        """
+        return resolve_ordering(
+            self.request.query_params.get("ordering"),
+            self.ordering_fields,
+            ("-created_at", "-id"),
+        )
+
+    def filter_queryset(self, queryset):
+        """
+        Combine the filtered orders with the archived ones if the client asks for history.
+
+        Both sides are filtered (and pruned to a sparse fieldset) separately, because a UNION
+        cannot be filtered afterwards.
+
+        Raises:
+            ParseError: If history is combined with cursor pagination.
+        """
+        queryset = super().filter_queryset(queryset)
+        params = self.request.query_params
+        if self.request.method != "GET" or not include_history(params):
+            return queryset
+        if self.paginator is not None and self.paginator.wants_keyset(self.request):
+            raise ParseError("`history` cannot be combined with cursor pagination.")
+
+        archived = super().filter_queryset(
+            filter_orders(ArchivedOrder.objects.all(), self.request.user, params)
+        )
+        return (
+            queryset.order_by()
+            .union(archived.order_by(), all=True)
+            .order_by(*self.get_ordering())
+        )
+
+    def create(self, request, *args, **kwargs):
         """
         Create a new Order from validated input and return its serialized data.
 
@@ -70,7 +184,12 @@ class OrderListView(generics.ListCreateAPIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
+class OrderDetailView(
+    IdentityMapMixin,
+    ConditionalRetrieveMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     GET: Retrieve details of a specific Order by its primary key.
     PUT/PATCH: Update order fields (only allowed for the business user who owns the order).
@@ -78,22 +197,135 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     Permissions:
         - IsBusinessForUpdateOrAdminForDelete: Enforces business update and staff delete rules.
+          The order it loads is reused by get_object() (see core.identitymap).
+
+    Conditional GET:
+        Responses carry ETag / Last-Modified validators; matching requests get a 304
+        without serialization (see ConditionalRetrieveMixin).
+
+    Sparse fieldsets:
+        `?fields=` / `?omit=` prune the rendered fields and loaded columns (see core.fieldsets).
     """
 
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsBusinessForUpdateOrAdminForDelete]
+    query_budget = {"GET": 2, "PUT": 6, "PATCH": 6, "DELETE": 5}
 
-    def get(self, request, pk, *args, **kwargs):
+
+class OrderExportView(StreamingExportView):
+    """
+    GET: Stream the orders of the authenticated user as CSV or NDJSON, oldest first.
+
+    Rows have the OrderListView representation and are read in chunks with
+    QuerySet.iterator(), so memory stays flat for any number of orders (see core.exports).
+
+    Query Params:
+        output (str): 'csv' (default) or 'ndjson'.
+        role, status, updated_since (str): As for OrderListView.
+        created_after / created_before (str): ISO 8601 datetime or date; only orders created
+            in [created_after, created_before).
+        history (str): 'true' to export archived orders as well. They come first, followed by
+            the active orders; each part is ordered by created_at.
+        fields / omit (str): Sparse fieldset selecting the exported columns.
+
+    Permissions:
+        - IsAuthenticated: Require login.
+    """
+
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    export_basename = "orders"
+
+    def get_queryset(self):
         """
-        Override GET to return serialized Order with HTTP 200.
+        Filter the user's orders by the query parameters, ordered by creation.
+        """
+        return self.filter_export(super().get_queryset())
 
-        Raises:
-            Http404: If no Order matches the provided pk.
+    def filter_export(self, queryset):
+        """
+        Apply the user and query parameter filters to an Order or ArchivedOrder queryset.
         """
-        order = get_object_or_404(Order, pk=pk)
-        serializer = self.get_serializer(order)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        params = self.request.query_params
+        queryset = filter_orders(queryset, self.request.user, params)
+        return filter_created_range(queryset, params).order_by("created_at", "id")
+
+    def get_export_querysets(self):
+        querysets = super().get_export_querysets()
+        if include_history(self.request.query_params):
+            archived = self.filter_export(ArchivedOrder.objects.all())
+            querysets.insert(0, self.filter_queryset(archived))
+        return querysets
+
+
+class OrderTransitionView(APIView):
+    """
+    POST: Change the status of many orders in one request.
+
+    Body:
+        {"transitions": [{"id": 1, "status": "completed"}, {"id": 2, "status": "cancelled"}]}
+
+    Transitions follow the state machine in orders_app.transitions (in_progress -> completed or
+    cancelled). They are applied in one transaction, with one UPDATE per target status, and the
+    order counters are kept in sync. Orders of other business users are reported as not found.
+
+    Permissions:
+        - IsAuthenticated, IsBusinessOrReadOnly: Business users only.
+
+    Returns:
+        {'updated': int, 'failed': int, 'results': [...]} with HTTP 200. Results are in request
+        order, either {'id', 'status', 'updated'} or {'id', 'error'}.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsBusinessOrReadOnly]
+    query_budget = {"POST": 9}
+
+    def post(self, request, *args, **kwargs):
+        serializer = OrderTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = transition_orders(
+            request.user,
+            [
+                (item["id"], item["status"])
+                for item in serializer.validated_data["transitions"]
+            ],
+        )
+        return Response(
+            {
+                "updated": sum(1 for result in results if result.get("updated")),
+                "failed": sum(1 for result in results if "error" in result),
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+def get_order_counts(pk):
+    """
+    Read the materialized order counters of a business user.
+
+    Runs a single query when the user has counters; the business user lookup only happens
+    for users without any.
+
+    Raises:
+        Http404: If pk is not a business user.
+
+    Returns:
+        dict[str, int]: Number of orders per status, including zero counts.
+    """
+    counts = {value: 0 for value, _ in STATUS_TYPES}
+    rows = OrderCounter.objects.filter(
+        business_user_id=pk, business_user__type="business"
+    ).values_list("status", "count")
+    found = False
+    for order_status, count in rows:
+        counts[order_status] = count
+        found = True
+    if not found:
+        get_object_or_404(User, pk=pk, type="business")
+    return counts
 
 
 class OrderCountView(generics.RetrieveAPIView):
@@ -111,13 +343,13 @@ class OrderCountView(generics.RetrieveAPIView):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = {"GET": 2}
 
     def get(self, request, pk, *args, **kwargs):
         """
-        Validate business user existence and count their in-progress orders.
+        Read the in-progress counter of the business user.
         """
-        get_object_or_404(User, pk=pk, type="business")
-        count = Order.objects.filter(business_user=pk, status="in_progress").count()
+        count = get_order_counts(pk)["in_progress"]
         return Response({"order_count": count}, status=status.HTTP_200_OK)
 
 
@@ -136,11 +368,77 @@ class OrderCompletedView(generics.RetrieveAPIView):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = {"GET": 2}
 
     def get(self, request, pk, *args, **kwargs):
         """
-        Validate business user existence and count their completed orders.
+        Read the completed counter of the business user.
         """
-        get_object_or_404(User, pk=pk, type="business")
-        count = Order.objects.filter(business_user=pk, status="completed").count()
+        count = get_order_counts(pk)["completed"]
         return Response({"completed_order_count": count}, status=status.HTTP_200_OK)
+
+
+class OrderStatsView(generics.RetrieveAPIView):
+    """
+    GET: Retrieve the order counts of all statuses for the specified business user.
+
+    URL Param:
+        pk (int): ID of the business user whose orders are counted.
+
+    Returns:
+        {'business_user': int, 'in_progress': int, 'completed': int, 'cancelled': int,
+        'total': int} with HTTP 200.
+
+    Permissions:
+        - IsAuthenticated: User must be logged in.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = {"GET": 2}
+
+    def get(self, request, pk, *args, **kwargs):
+        """
+        Read all counters of the business user in one query.
+        """
+        counts = get_order_counts(pk)
+        return Response(
+            {"business_user": pk, **counts, "total": sum(counts.values())},
+            status=status.HTTP_200_OK,
+        )
+
+
+class OrderAnalyticsView(APIView):
+    """
+    GET: Order volume and revenue of a business user per day, week or month.
+
+    URL Param:
+        pk (int): ID of the business user.
+
+    Query Params:
+        interval (str): 'day', 'week' or 'month' (default: 'day').
+        start, end (str): Inclusive ISO dates (default: the last 30 days).
+
+    Answered from the daily rollups with one aggregate query (see orders_app.analytics).
+
+    Permissions:
+        - IsAuthenticated: The business user itself or staff.
+
+    Returns:
+        {'business_user', 'interval', 'start', 'end', 'totals', 'periods'} with HTTP 200,
+        403 for other users, 404 if pk is not a business user.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = {"GET": 2}
+
+    def get(self, request, pk, *args, **kwargs):
+        user = request.user
+        if user.pk != pk and not user.is_staff:
+            raise PermissionDenied("You can only view your own analytics.")
+        if user.pk != pk or getattr(user, "type", None) != "business":
+            get_object_or_404(User, pk=pk, type="business")
+
+        interval, start, end = parse_analytics_params(request.query_params)
+        return Response(
+            business_analytics(pk, interval, start, end), status=status.HTTP_200_OK
+        )
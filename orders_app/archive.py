@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from orders_app.models import FINISHED_STATUSES, ArchivedOrder, Order
+from orders_app.signals import keep_counters
+
+"""
+Archive tier for finished orders.
+
+Orders that are completed or cancelled and were last updated more than ORDER_ARCHIVE_AFTER_DAYS
+ago are moved from the Order table to ArchivedOrder, keeping their primary key. The hot table
+then only holds active and recently finished orders, which is what the order list, the detail
+and count views and the permission checks query. Order lists include the archive only when a
+client asks for history (see OrderListView).
+
+Orders are moved in primary key batches. Each batch copies the rows and deletes the originals
+in one transaction, so an interrupted run loses nothing and the next run continues with the
+orders that are left. Archived orders stay counted in OrderCounter.
+
+Settings:
+    ORDER_ARCHIVE_AFTER_DAYS (int): Age in days after which finished orders are archived
+        (default=180).
+
+Functions:
+    archive_cutoff: The updated_at before which finished orders are archivable.
+    archive_batch: Move one batch of archivable orders.
+    archive_orders: Move all archivable orders, batch by batch.
+"""
+
+
+ARCHIVE_BATCH_SIZE = 1000
+
+# Columns copied from Order to ArchivedOrder (same names, primary key included)
+ARCHIVED_FIELDS = [field.attname for field in Order._meta.concrete_fields]
+
+
+def archive_cutoff(days=None, now=None):
+    """
+    Return the updated_at before which finished orders are archived.
+
+    Args:
+        days (int, optional): Age in days (default: ORDER_ARCHIVE_AFTER_DAYS).
+        now (datetime, optional): Reference time (default: now).
+    """
+    if days is None:
+        days = getattr(settings, "ORDER_ARCHIVE_AFTER_DAYS", 180)
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+def archive_batch(cutoff, batch_size=ARCHIVE_BATCH_SIZE):
+    """
+    Move up to batch_size finished orders last updated before cutoff into the archive.
+
+    Returns:
+        int: Number of orders moved (0 when nothing is left to archive).
+    """
+    with transaction.atomic():
+        rows = list(
+            Order.objects.select_for_update()
+            .filter(status__in=FINISHED_STATUSES, updated_at__lt=cutoff)
+            .order_by("pk")
+            .values(*ARCHIVED_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+        ArchivedOrder.objects.bulk_create([ArchivedOrder(**row) for row in rows])
+        with keep_counters():
+            Order.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+    return len(rows)
+
+
+def archive_orders(cutoff, batch_size=ARCHIVE_BATCH_SIZE, max_batches=None):
+    """
+    Move all finished orders last updated before cutoff into the archive.
+
+    Args:
+        cutoff (datetime): Orders last updated before this time are archived.
+        batch_size (int): Orders moved per transaction.
+        max_batches (int, optional): Stop after this many batches; a later run resumes.
+
+    Returns:
+        int: Number of orders moved.
+    """
+    moved = batches = 0
+    while max_batches is None or batches < max_batches:
+        count = archive_batch(cutoff, batch_size)
+        if not count:
+            break
+        moved += count
+        batches += 1
+    return moved
@@ -0,0 +1,66 @@
+from django.db.models import Q
+
+from core.params import choice_param, datetime_param
+from orders_app.models import STATUS_TYPES
+
+"""
+Query parameter filters of the order list endpoint (OrderListView).
+
+Functions:
+    filter_orders: Restrict the orders to the user's role and apply the status and
+        updated_since filters.
+    include_history: Whether the list should include archived orders.
+"""
+
+
+ROLES = ("customer", "business")
+
+
+def filter_orders(queryset, user, params):
+    """
+    Filter an Order queryset to the orders of a user and the list query parameters.
+
+    Works on ArchivedOrder querysets as well, which have the same fields.
+
+    Args:
+        queryset (QuerySet[Order | ArchivedOrder]): Orders to filter.
+        user (User): The requesting user.
+        params (QueryDict): Request query parameters:
+            role (str): 'customer' (orders placed by the user) or 'business' (orders assigned
+                to the user); both when omitted.
+            status (str): One of STATUS_TYPES.
+            updated_since (datetime): Orders with updated_at >= value (ISO 8601).
+
+    Raises:
+        ParseError: If role, status or updated_since is invalid.
+
+    Returns:
+        QuerySet[Order]: The filtered orders.
+    """
+    role = choice_param(params, "role", ROLES)
+    if role == "customer":
+        queryset = queryset.filter(customer_user=user)
+    elif role == "business":
+        queryset = queryset.filter(business_user=user)
+    else:
+        queryset = queryset.filter(Q(customer_user=user) | Q(business_user=user))
+
+    status = choice_param(params, "status", [value for value, _ in STATUS_TYPES])
+    if status is not None:
+        queryset = queryset.filter(status=status)
+
+    updated_since = datetime_param(params, "updated_since")
+    if updated_since is not None:
+        queryset = queryset.filter(updated_at__gte=updated_since)
+
+    return queryset
+
+
+def include_history(params):
+    """
+    Return True if the request asks for archived orders with `history=true`.
+
+    Raises:
+        ParseError: If history is not 'true' or 'false'.
+    """
+    return choice_param(params, "history", ("true", "false")) == "true"
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from orders_app.archive import ARCHIVE_BATCH_SIZE, archive_cutoff, archive_orders
+
+"""
+Management command to move old finished orders into the archive (see orders_app.archive).
+
+Usage:
+    python manage.py archive_orders [--older-than-days N] [--batch-size N] [--max-batches N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Archive completed and cancelled orders in primary key batches.
+
+    Each batch is moved in its own transaction, so the command can be interrupted (or limited
+    with --max-batches) and re-run; it continues with the orders that are left.
+    """
+
+    help = "Move finished orders older than the archive age into the archive table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=None,
+            help="Archive orders finished more than N days ago "
+            "(default: ORDER_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help=f"Number of orders moved per transaction (default: {ARCHIVE_BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after N batches; a later run resumes (default: no limit).",
+        )
+
+    def handle(self, *args, **options):
+        days, batch_size = options["older_than_days"], options["batch_size"]
+        if batch_size < 1 or (days is not None and days < 0):
+            raise CommandError(
+                "--batch-size must be positive and --older-than-days not negative."
+            )
+
+        cutoff = archive_cutoff(days)
+        moved = archive_orders(cutoff, batch_size, options["max_batches"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {moved} orders finished before {cutoff.isoformat()}."
+            )
+        )
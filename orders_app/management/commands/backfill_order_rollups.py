@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication_app.models import User
+from orders_app.models import OrderDailyRollup
+
+"""
+Management command to (re)compute the OrderDailyRollup rows from the Order and ArchivedOrder tables.
+
+Usage:
+    python manage.py backfill_order_rollups [--batch-size N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the daily order rollups of all users in primary key batches.
+
+    Each batch deletes the rollups of its users and inserts them again from the order tables in
+    one transaction (see OrderDailyRollupQuerySet.rebuild). An interrupted run leaves every batch
+    either rebuilt or untouched, and a second run writes the same rows again.
+    """
+
+    help = "Recompute the daily order rollups from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users backfilled per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+        last_pk = 0
+        written = 0
+
+        while True:
+            batch = list(
+                User.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+
+            written += OrderDailyRollup.objects.rebuild(batch)
+            last_pk = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} daily order rollups."))
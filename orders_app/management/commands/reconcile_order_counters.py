@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from authentication_app.models import User
+from orders_app.models import OrderCounter
+
+"""
+Management command to recompute the materialized OrderCounter rows from the Order and
+ArchivedOrder tables.
+
+Usage:
+    python manage.py reconcile_order_counters [--batch-size N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the order counters of all users in primary key batches.
+
+    Each batch upserts the counters that differ from the Order and ArchivedOrder tables and zeros
+    the counters of statuses without orders, in one transaction (see OrderCounterQuerySet.rebuild).
+    Counters that are already correct are not written, so a re-run only reports new drift.
+    """
+
+    help = "Recompute the per-business order counters from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users reconciled per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pk = 0
+        corrected = 0
+
+        while True:
+            batch = list(
+                User.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+
+            corrected += OrderCounter.objects.rebuild(batch)
+            last_pk = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Corrected {corrected} order counters."))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-18 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["business_user", "status"], name="order_business_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("status", "in_progress")),
+                fields=["business_user"],
+                name="order_in_progress_idx",
+            ),
+        ),
+    ]
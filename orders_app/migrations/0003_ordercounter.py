@@ -0,0 +1,86 @@
+# Generated by Django 5.2.1 on 2026-10-18 18:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    Order = apps.get_model("orders_app", "Order")
+    OrderCounter = apps.get_model("orders_app", "OrderCounter")
+    rows = (
+        Order.objects.filter(business_user__isnull=False)
+        .values("business_user", "status")
+        .annotate(count=models.Count("pk"))
+        .order_by()
+    )
+    OrderCounter.objects.bulk_create(
+        OrderCounter(
+            business_user_id=row["business_user"],
+            status=row["status"],
+            count=row["count"],
+        )
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders_app", "0002_order_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("in_progress", "In Progress"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        help_text="Order status counted by this row",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of orders of the business user in this status",
+                    ),
+                ),
+                (
+                    "business_user",
+                    models.ForeignKey(
+                        help_text="Business user whose orders are counted",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_counters",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("business_user", "status"),
+                        name="order_counter_business_status_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.1 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders_app", "0003_ordercounter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["customer_user", "status"], name="order_customer_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["customer_user", "created_at", "id"],
+                name="order_customer_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["customer_user", "updated_at", "id"],
+                name="order_customer_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="order_business_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["business_user", "updated_at", "id"],
+                name="order_business_updated_idx",
+            ),
+        ),
+    ]
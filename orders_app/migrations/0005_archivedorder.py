@@ -0,0 +1,120 @@
+# Generated by Django 5.2.1 on 2026-10-18 19:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0007_offer_ordering_indexes"),
+        ("orders_app", "0004_order_list_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedOrder",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        help_text="Primary key of the original order",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "customer_user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Customer who placed this order",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_orders_as_customer",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "business_user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Business user who fulfilled this order",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_orders_as_business",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("title", models.CharField(blank=True, max_length=255, null=True)),
+                ("revisions", models.PositiveIntegerField(default=0)),
+                ("delivery_time_in_days", models.IntegerField(blank=True, null=True)),
+                (
+                    "price",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=10, null=True
+                    ),
+                ),
+                ("features", models.JSONField(blank=True, default=list)),
+                ("offer_type", models.CharField(blank=True, max_length=10, null=True)),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Timestamp when the order was created",
+                        null=True,
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        help_text="Timestamp when the order was last updated (finished)"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("in_progress", "In Progress"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        help_text="Final status of the order",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "offer_detail",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Reference to the OfferDetail the order was based on",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_orders",
+                        to="offers_app.offerdetail",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["customer_user", "created_at", "id"],
+                        name="archived_customer_created_idx",
+                    ),
+                    models.Index(
+                        fields=["business_user", "created_at", "id"],
+                        name="archived_business_created_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("status__in", ("completed", "cancelled"))),
+                fields=["updated_at"],
+                name="order_finished_updated_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 5.2.1 on 2026-10-18 19:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_rollups(apps, schema_editor):
+    OrderDailyRollup = apps.get_model("orders_app", "OrderDailyRollup")
+    totals = {}
+    for model_name in ("Order", "ArchivedOrder"):
+        rows = (
+            apps.get_model("orders_app", model_name)
+            .objects.filter(business_user__isnull=False, created_at__isnull=False)
+            .annotate(day=TruncDate("created_at"))
+            .values("business_user", "day", "offer_type", "status")
+            .annotate(order_count=models.Count("pk"), price_total=models.Sum("price"))
+            .order_by()
+        )
+        for row in rows:
+            key = (
+                row["business_user"],
+                row["day"],
+                row["offer_type"] or "",
+                row["status"],
+            )
+            count, cents = totals.get(key, (0, 0))
+            totals[key] = (
+                count + row["order_count"],
+                cents + int(round((row["price_total"] or 0) * 100)),
+            )
+    OrderDailyRollup.objects.bulk_create(
+        OrderDailyRollup(
+            business_user_id=business_user_id,
+            day=day,
+            offer_type=offer_type,
+            status=status,
+            order_count=count,
+            price_cents=cents,
+        )
+        for (business_user_id, day, offer_type, status), (
+            count,
+            cents,
+        ) in totals.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders_app", "0005_archivedorder"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(help_text="Day the orders were created on")),
+                (
+                    "offer_type",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Offer tier of the orders",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("in_progress", "In Progress"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        help_text="Current status of the orders",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "order_count",
+                    models.IntegerField(default=0, help_text="Number of orders"),
+                ),
+                (
+                    "price_cents",
+                    models.BigIntegerField(
+                        default=0, help_text="Sum of the order prices in cents"
+                    ),
+                ),
+                (
+                    "business_user",
+                    models.ForeignKey(
+                        help_text="Business user whose orders are rolled up",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("business_user", "day", "offer_type", "status"),
+                        name="order_rollup_business_day_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0007_offer_ordering_indexes"),
+        ("orders_app", "0006_orderdailyrollup"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedorder",
+            name="customer_user",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Customer who placed this order",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="archived_orders_as_customer",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="archivedorder",
+            name="offer_detail",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Reference to the OfferDetail the order was based on",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="archived_orders",
+                to="offers_app.offerdetail",
+            ),
+        ),
+    ]
@@ -1,5 +1,11 @@
-from django.db import models
+from collections import Counter
+from decimal import Decimal
+
+from django.db import connections, models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest, TruncDate
 from django.conf import settings
+from django.utils import timezone
 from offers_app.models import OfferDetail
 
 """
@@ -7,9 +13,13 @@ Data models for the orders_app, defining order tracking and lifecycle for OfferD
 
 Models:
     Order: Represents a purchase request by a customer for a specific OfferDetail, linking customer and business users, pricing, timing, and status.
+    ArchivedOrder: Finished order moved out of the Order table by the archive_orders command.
+    OrderCounter: Materialized number of orders per business user and status, maintained on Order writes.
+    OrderDailyRollup: Order count and price total per business user, day, offer type and status.
 
 Constants:
     STATUS_TYPES: Allowed order statuses ('in_progress', 'completed', 'cancelled').
+    FINISHED_STATUSES: Final statuses; orders in them can be archived.
 """
 
 
@@ -19,6 +29,8 @@ STATUS_TYPES = (
     ("cancelled", "Cancelled"),
 )
 
+FINISHED_STATUSES = ("completed", "cancelled")
+
 
 class Order(models.Model):
     """
@@ -114,3 +126,558 @@ class Order(models.Model):
         blank=True,
         help_text="Reference to the specific OfferDetail this order is based on",
     )
+
+    class Meta:
+        indexes = [
+            # Per-business counts by status (order-count views)
+            models.Index(
+                fields=["business_user", "status"],
+                name="order_business_status_idx",
+            ),
+            # Small partial index covering only the active orders of a business
+            models.Index(
+                fields=["business_user"],
+                condition=Q(status="in_progress"),
+                name="order_in_progress_idx",
+            ),
+            # Order list per role: status filter, and sort keys / updated_since ranges
+            models.Index(
+                fields=["customer_user", "status"],
+                name="order_customer_status_idx",
+            ),
+            models.Index(
+                fields=["customer_user", "created_at", "id"],
+                name="order_customer_created_idx",
+            ),
+            models.Index(
+                fields=["customer_user", "updated_at", "id"],
+                name="order_customer_updated_idx",
+            ),
+            models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="order_business_created_idx",
+            ),
+            models.Index(
+                fields=["business_user", "updated_at", "id"],
+                name="order_business_updated_idx",
+            ),
+            # Finished orders by age, scanned by the archive_orders command
+            models.Index(
+                fields=["updated_at"],
+                condition=Q(status__in=FINISHED_STATUSES),
+                name="order_finished_updated_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The counter update in the post_save handler commits together with the order
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            return super().delete(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_counter_key()
+        instance.remember_rollup_entry()
+        return instance
+
+    def remember_counter_key(self):
+        """
+        Record the (business_user_id, status) pair this order is currently counted under.
+
+        Nothing is recorded if one of the fields is deferred; the counters then look the
+        stored values up before saving.
+        """
+        if "business_user_id" in self.__dict__ and "status" in self.__dict__:
+            self._counter_key = (self.business_user_id, self.status)
+        else:
+            self.__dict__.pop("_counter_key", None)
+
+    def rollup_entry(self):
+        """
+        Return the OrderDailyRollup row this order is counted in and its price in cents.
+
+        Returns:
+            tuple | None: ((business_user_id, day, offer_type, status), price_cents), or None for
+            orders without business user or creation time.
+        """
+        return rollup_entry(
+            self.business_user_id,
+            self.created_at,
+            self.offer_type,
+            self.status,
+            self.price,
+        )
+
+    def remember_rollup_entry(self):
+        """
+        Record the rollup entry this order is currently counted in (see remember_counter_key).
+        """
+        if all(field in self.__dict__ for field in ROLLUP_FIELDS):
+            self._rollup_entry = self.rollup_entry()
+        else:
+            self.__dict__.pop("_rollup_entry", None)
+
+
+# Order columns an OrderDailyRollup entry is derived from
+ROLLUP_FIELDS = ("business_user_id", "created_at", "offer_type", "status", "price")
+
+
+def rollup_entry(business_user_id, created_at, offer_type, status, price):
+    """
+    Return the rollup key and price in cents of an order with the given column values.
+
+    Days are calendar days in the current time zone.
+    """
+    if business_user_id is None or created_at is None:
+        return None
+    day = (
+        timezone.localdate(created_at)
+        if timezone.is_aware(created_at)
+        else created_at.date()
+    )
+    cents = int(Decimal(str(price or 0)) * 100)
+    return (business_user_id, day, offer_type or "", status), cents
+
+
+class ArchivedOrder(models.Model):
+    """
+    A finished order moved out of the hot Order table (see orders_app.archive).
+
+    Keeps the primary key and all columns of the Order, in the same order, so that order lists
+    can combine both tables with a UNION when a client asks for history. Timestamps are copied
+    as they were; updated_at is the time the order was finished. Deleting the customer or the
+    OfferDetail keeps the archived order (SET_NULL); deleting it takes it out of its counter and
+    rollup (see orders_app.signals).
+
+    Attributes:
+        id (BigIntegerField): Primary key of the original Order.
+        All other fields: As on Order.
+    """
+
+    id = models.BigIntegerField(
+        primary_key=True,
+        help_text="Primary key of the original order",
+    )
+    customer_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="archived_orders_as_customer",
+        blank=True,
+        null=True,
+        help_text="Customer who placed this order",
+    )
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_orders_as_business",
+        blank=True,
+        null=True,
+        help_text="Business user who fulfilled this order",
+    )
+    title = models.CharField(max_length=255, null=True, blank=True)
+    revisions = models.PositiveIntegerField(default=0)
+    delivery_time_in_days = models.IntegerField(null=True, blank=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    features = models.JSONField(default=list, blank=True)
+    offer_type = models.CharField(max_length=10, null=True, blank=True)
+    created_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="Timestamp when the order was created",
+    )
+    updated_at = models.DateTimeField(
+        help_text="Timestamp when the order was last updated (finished)",
+    )
+    status = models.CharField(
+        max_length=100,
+        choices=STATUS_TYPES,
+        help_text="Final status of the order",
+    )
+    offer_detail = models.ForeignKey(
+        OfferDetail,
+        on_delete=models.SET_NULL,
+        related_name="archived_orders",
+        null=True,
+        blank=True,
+        help_text="Reference to the OfferDetail the order was based on",
+    )
+
+    class Meta:
+        indexes = [
+            # History lists per role, in the default order list ordering
+            models.Index(
+                fields=["customer_user", "created_at", "id"],
+                name="archived_customer_created_idx",
+            ),
+            models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="archived_business_created_idx",
+            ),
+        ]
+
+
+class OrderCounterQuerySet(models.QuerySet):
+    """
+    QuerySet for OrderCounter with incremental and full recomputation helpers.
+    """
+
+    def adjust(self, business_user_id, status, delta):
+        """
+        Add delta to the counter of a business user and status, creating it if needed.
+
+        Counters never drop below zero; drift is corrected by rebuild().
+
+        Args:
+            business_user_id (int | None): Business user of the order (None is ignored).
+            status (str): Order status.
+            delta (int): Change of the count.
+        """
+        if business_user_id is None or not delta:
+            return
+        counters = self.filter(business_user_id=business_user_id, status=status)
+        if delta < 0:
+            counters.update(count=Greatest(F("count") + delta, 0))
+            return
+
+        connection = connections[self.db]
+        if connection.features.supports_update_conflicts_with_target:
+            self._upsert(connection, business_user_id, status, delta)
+            return
+        with transaction.atomic(using=self.db):
+            counter, created = self.get_or_create(
+                business_user_id=business_user_id,
+                status=status,
+                defaults={"count": delta},
+            )
+        if not created:
+            counters.update(count=F("count") + delta)
+
+    def _upsert(self, connection, business_user_id, status, delta):
+        """
+        Increment a counter with a single INSERT ... ON CONFLICT DO UPDATE statement.
+        """
+        opts = self.model._meta
+        quote = connection.ops.quote_name
+        table = quote(opts.db_table)
+        business_user = quote(opts.get_field("business_user").column)
+        status_column = quote(opts.get_field("status").column)
+        count = quote(opts.get_field("count").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({business_user}, {status_column}, {count}) "
+                f"VALUES (%s, %s, %s) "
+                f"ON CONFLICT ({business_user}, {status_column}) "
+                f"DO UPDATE SET {count} = {table}.{count} + EXCLUDED.{count}",
+                [business_user_id, status, delta],
+            )
+
+    def rebuild(self, business_user_ids):
+        """
+        Recompute the counters of the given business users from the Order and ArchivedOrder tables.
+
+        Args:
+            business_user_ids (Iterable[int]): Business users whose counters are rebuilt.
+
+        Returns:
+            int: Number of counters that were created, changed or removed.
+        """
+        business_user_ids = list(business_user_ids)
+        with transaction.atomic():
+            actual = Counter()
+            for model in (Order, ArchivedOrder):
+                for row in (
+                    model.objects.filter(business_user__in=business_user_ids)
+                    .values("business_user", "status")
+                    .annotate(count=Count("pk"))
+                    .order_by()
+                ):
+                    actual[row["business_user"], row["status"]] += row["count"]
+            stored = {
+                (counter.business_user_id, counter.status): counter
+                for counter in self.select_for_update().filter(
+                    business_user__in=business_user_ids
+                )
+            }
+
+            stale = [
+                counter.pk
+                for key, counter in stored.items()
+                if key not in actual and counter.count
+            ]
+            changed = []
+            for key, count in actual.items():
+                counter = stored.get(key)
+                if counter is None:
+                    counter = self.model(
+                        business_user_id=key[0], status=key[1], count=count
+                    )
+                elif counter.count == count:
+                    continue
+                counter.count = count
+                changed.append(counter)
+
+            self.filter(pk__in=stale).update(count=0)
+            self.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=["business_user", "status"],
+                update_fields=["count"],
+            )
+        return len(stale) + len(changed)
+
+
+class OrderCounter(models.Model):
+    """
+    Number of orders of a business user in one status.
+
+    Rows are adjusted in the same transaction as the Order write that changes them
+    (see orders_app.signals) and can be recomputed with the reconcile_order_counters command.
+    Archived orders stay counted: archiving moves an order without changing its counter.
+
+    Attributes:
+        business_user (ForeignKey): The business user whose orders are counted.
+        status (CharField): Order status, one of STATUS_TYPES.
+        count (PositiveIntegerField): Number of the business user's orders in that status.
+    """
+
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="order_counters",
+        help_text="Business user whose orders are counted",
+    )
+    status = models.CharField(
+        max_length=100,
+        choices=STATUS_TYPES,
+        help_text="Order status counted by this row",
+    )
+    count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of orders of the business user in this status",
+    )
+
+    objects = OrderCounterQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_user", "status"],
+                name="order_counter_business_status_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.business_user_id} {self.status}: {self.count}"
+
+
+class OrderDailyRollupQuerySet(models.QuerySet):
+    """
+    QuerySet for OrderDailyRollup with incremental and full recomputation helpers.
+    """
+
+    def apply(self, deltas):
+        """
+        Add order count and price deltas to rollup rows, creating missing rows.
+
+        Args:
+            deltas (dict[tuple, tuple[int, int]]): (business_user_id, day, offer_type, status)
+                mapped to (order count delta, price delta in cents).
+        """
+        deltas = [
+            (key, count, cents)
+            for key, (count, cents) in deltas.items()
+            if count or cents
+        ]
+        if not deltas:
+            return
+
+        connection = connections[self.db]
+        if connection.features.supports_update_conflicts_with_target:
+            self._upsert(connection, deltas)
+            return
+        for (business_user_id, day, offer_type, status), count, cents in deltas:
+            with transaction.atomic(using=self.db):
+                rollup, created = self.get_or_create(
+                    business_user_id=business_user_id,
+                    day=day,
+                    offer_type=offer_type,
+                    status=status,
+                    defaults={"order_count": count, "price_cents": cents},
+                )
+            if not created:
+                self.filter(pk=rollup.pk).update(
+                    order_count=F("order_count") + count,
+                    price_cents=F("price_cents") + cents,
+                )
+
+    def remove(self, entry):
+        """
+        Take one order out of its rollup row.
+
+        Unlike apply(), a missing row is not created (it was deleted together with its business
+        user) and the order count never drops below zero.
+
+        Args:
+            entry (tuple | None): rollup_entry() of the order; None is ignored.
+        """
+        if entry is None:
+            return
+        (business_user_id, day, offer_type, status), cents = entry
+        self.filter(
+            business_user_id=business_user_id,
+            day=day,
+            offer_type=offer_type,
+            status=status,
+        ).update(
+            order_count=Greatest(F("order_count") - 1, 0),
+            price_cents=F("price_cents") - cents,
+        )
+
+    def _upsert(self, connection, deltas):
+        """
+        Apply all deltas with one executemany() of INSERT ... ON CONFLICT DO UPDATE.
+        """
+        opts = self.model._meta
+        quote = connection.ops.quote_name
+        table = quote(opts.db_table)
+        key = ", ".join(
+            quote(opts.get_field(name).column)
+            for name in ("business_user", "day", "offer_type", "status")
+        )
+        count = quote(opts.get_field("order_count").column)
+        cents = quote(opts.get_field("price_cents").column)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {table} ({key}, {count}, {cents}) "
+                f"VALUES (%s, %s, %s, %s, %s, %s) "
+                f"ON CONFLICT ({key}) DO UPDATE SET "
+                f"{count} = {table}.{count} + EXCLUDED.{count}, "
+                f"{cents} = {table}.{cents} + EXCLUDED.{cents}",
+                [
+                    (
+                        business_user_id,
+                        connection.ops.adapt_datefield_value(day),
+                        offer_type,
+                        status,
+                        order_count,
+                        price_cents,
+                    )
+                    for (
+                        business_user_id,
+                        day,
+                        offer_type,
+                        status,
+                    ), order_count, price_cents in deltas
+                ],
+            )
+
+    def rebuild(self, business_user_ids):
+        """
+        Recompute the rollups of the given business users from the Order and ArchivedOrder tables.
+
+        Args:
+            business_user_ids (Iterable[int]): Business users whose rollups are rebuilt.
+
+        Returns:
+            int: Number of rollup rows written.
+        """
+        business_user_ids = list(business_user_ids)
+        totals = {}
+        with transaction.atomic():
+            for model in (Order, ArchivedOrder):
+                rows = (
+                    model.objects.filter(
+                        business_user__in=business_user_ids, created_at__isnull=False
+                    )
+                    .annotate(day=TruncDate("created_at"))
+                    .values("business_user", "day", "offer_type", "status")
+                    .annotate(order_count=Count("pk"), price_total=Sum("price"))
+                    .order_by()
+                )
+                for row in rows:
+                    key = (
+                        row["business_user"],
+                        row["day"],
+                        row["offer_type"] or "",
+                        row["status"],
+                    )
+                    count, cents = totals.get(key, (0, 0))
+                    totals[key] = (
+                        count + row["order_count"],
+                        cents + int(round((row["price_total"] or 0) * 100)),
+                    )
+
+            self.filter(business_user__in=business_user_ids).delete()
+            self.bulk_create(
+                self.model(
+                    business_user_id=business_user_id,
+                    day=day,
+                    offer_type=offer_type,
+                    status=status,
+                    order_count=count,
+                    price_cents=cents,
+                )
+                for (business_user_id, day, offer_type, status), (
+                    count,
+                    cents,
+                ) in totals.items()
+            )
+        return len(totals)
+
+
+class OrderDailyRollup(models.Model):
+    """
+    Orders of a business user created on one day, per offer type and current status.
+
+    Rows are adjusted in the same transaction as the Order write that changes them
+    (see orders_app.signals) and can be recomputed with the backfill_order_rollups command.
+    Archived orders stay included. Analytics ranges are answered from these rows
+    (see orders_app.analytics).
+
+    Attributes:
+        business_user (ForeignKey): The business user the orders belong to.
+        day (DateField): Creation day of the orders (current time zone).
+        offer_type (CharField): Offer tier of the orders ('' if unknown).
+        status (CharField): Current status of the orders, one of STATUS_TYPES.
+        order_count (IntegerField): Number of orders.
+        price_cents (BigIntegerField): Sum of the order prices, in cents.
+    """
+
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="order_rollups",
+        help_text="Business user whose orders are rolled up",
+    )
+    day = models.DateField(help_text="Day the orders were created on")
+    offer_type = models.CharField(
+        max_length=10,
+        blank=True,
+        default="",
+        help_text="Offer tier of the orders",
+    )
+    status = models.CharField(
+        max_length=100,
+        choices=STATUS_TYPES,
+        help_text="Current status of the orders",
+    )
+    order_count = models.IntegerField(default=0, help_text="Number of orders")
+    price_cents = models.BigIntegerField(
+        default=0, help_text="Sum of the order prices in cents"
+    )
+
+    objects = OrderDailyRollupQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # Also serves the per-business day range scans of the analytics endpoint
+            models.UniqueConstraint(
+                fields=["business_user", "day", "offer_type", "status"],
+                name="order_rollup_business_day_uniq",
+            ),
+        ]
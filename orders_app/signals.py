@@ -0,0 +1,209 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from orders_app.models import (
+    ROLLUP_FIELDS,
+    ArchivedOrder,
+    Order,
+    OrderCounter,
+    OrderDailyRollup,
+    rollup_entry,
+)
+
+"""
+Signal handlers for the orders_app, keeping the materialized OrderCounter and OrderDailyRollup
+rows in sync.
+
+Order.save() and Order.delete() run in a transaction, so the counters change atomically with
+the order. Bulk writes (QuerySet.update / bulk_create) bypass these handlers and have to adjust
+or rebuild the counters themselves. Deletes inside keep_counters() leave the counters and rollups
+unchanged (used when orders are moved to the archive, where they stay counted).
+
+Handlers:
+    load_counter_key: Looks up the stored counter and rollup columns of an order that was not
+        loaded with them (e.g. built by hand or loaded with deferred fields).
+    count_saved_order: Moves an order between counters on create and on status or business changes.
+    count_deleted_order: Decrements the counter of a deleted order.
+    roll_up_saved_order: Moves an order between daily rollups when its rollup columns change.
+    roll_up_deleted_order: Removes a deleted order from its daily rollup.
+    uncount_deleted_archived_order: Takes a deleted archived order (e.g. cascaded from its
+        business user) out of its counter and daily rollup.
+
+Functions:
+    keep_counters: Context manager suppressing the decrement of deleted orders (live and archived).
+"""
+
+
+_keep_counters = ContextVar("keep_order_counters", default=False)
+
+
+@contextmanager
+def keep_counters():
+    """
+    Delete orders without decrementing their counters and rollups within the block.
+    """
+    token = _keep_counters.set(True)
+    try:
+        yield
+    finally:
+        _keep_counters.reset(token)
+
+
+@receiver(pre_save, sender=Order)
+def load_counter_key(sender, instance, raw=False, **kwargs):
+    """
+    Make sure an existing order knows the counter it is currently counted under.
+
+    Args:
+        sender: The Order model class.
+        instance (Order): The order about to be saved.
+    """
+    if raw or instance._state.adding:
+        return
+    if hasattr(instance, "_counter_key") and hasattr(instance, "_rollup_entry"):
+        return
+    stored = Order.objects.filter(pk=instance.pk).values_list(*ROLLUP_FIELDS).first()
+    if stored is None:
+        instance._counter_key = instance._rollup_entry = None
+        return
+    business_user_id, created_at, offer_type, status, price = stored
+    instance._counter_key = (business_user_id, status)
+    instance._rollup_entry = rollup_entry(*stored)
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    """
+    Increment the new counter and decrement the previous one of a saved order.
+
+    Args:
+        sender: The Order model class.
+        instance (Order): The saved order.
+        created (bool): Whether the order was inserted.
+        update_fields (frozenset | None): Fields written by a partial save.
+    """
+    if raw:
+        return
+    if update_fields is not None and not {"business_user", "status"} & update_fields:
+        return
+    previous = None if created else getattr(instance, "_counter_key", None)
+    current = (instance.business_user_id, instance.status)
+    if previous != current:
+        if previous is not None:
+            OrderCounter.objects.adjust(*previous, -1)
+        OrderCounter.objects.adjust(*current, 1)
+    instance._counter_key = current
+
+
+@receiver(post_delete, sender=Order)
+def count_deleted_order(sender, instance, **kwargs):
+    """
+    Decrement the counter of a deleted order.
+
+    Args:
+        sender: The Order model class.
+        instance (Order): The deleted order.
+    """
+    if _keep_counters.get():
+        return
+    key = getattr(instance, "_counter_key", None) or (
+        instance.business_user_id,
+        instance.status,
+    )
+    OrderCounter.objects.adjust(*key, -1)
+
+
+def rollup_deltas(previous, current):
+    """
+    Return the OrderDailyRollup deltas of moving an order from one rollup entry to another.
+
+    Args:
+        previous, current: Order.rollup_entry() values, None where the order is not counted.
+
+    Returns:
+        dict[tuple, tuple[int, int]]: Deltas for OrderDailyRollupQuerySet.apply().
+    """
+    deltas = {}
+    for entry, sign in ((previous, -1), (current, 1)):
+        if entry is not None:
+            key, cents = entry
+            count, total = deltas.get(key, (0, 0))
+            deltas[key] = (count + sign, total + sign * cents)
+    return deltas
+
+
+@receiver(post_save, sender=Order)
+def roll_up_saved_order(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    """
+    Move a saved order to its current daily rollup.
+
+    Args:
+        sender: The Order model class.
+        instance (Order): The saved order.
+        created (bool): Whether the order was inserted.
+        update_fields (frozenset | None): Fields written by a partial save.
+    """
+    if raw:
+        return
+    if (
+        update_fields is not None
+        and not {
+            "business_user",
+            "created_at",
+            "offer_type",
+            "status",
+            "price",
+        }
+        & update_fields
+    ):
+        return
+    previous = None if created else getattr(instance, "_rollup_entry", None)
+    current = instance.rollup_entry()
+    if previous != current:
+        OrderDailyRollup.objects.apply(rollup_deltas(previous, current))
+    instance._rollup_entry = current
+
+
+@receiver(post_delete, sender=Order)
+def roll_up_deleted_order(sender, instance, **kwargs):
+    """
+    Remove a deleted order from its daily rollup.
+
+    Args:
+        sender: The Order model class.
+        instance (Order): The deleted order.
+    """
+    if _keep_counters.get():
+        return
+    # Never re-creates a row: the cascade of a deleted business user removes its rollups first
+    OrderDailyRollup.objects.remove(
+        getattr(instance, "_rollup_entry", None) or instance.rollup_entry()
+    )
+
+
+@receiver(post_delete, sender=ArchivedOrder)
+def uncount_deleted_archived_order(sender, instance, **kwargs):
+    """
+    Take a deleted archived order out of its counter and daily rollup.
+
+    Archived orders stay counted, so deleting one has to decrement like deleting an Order. The
+    decrements never create rows: when the business user is deleted, its counters and rollups
+    are deleted in the same cascade.
+
+    Args:
+        sender: The ArchivedOrder model class.
+        instance (ArchivedOrder): The deleted archived order.
+    """
+    if _keep_counters.get():
+        return
+    OrderCounter.objects.adjust(instance.business_user_id, instance.status, -1)
+    OrderDailyRollup.objects.remove(
+        rollup_entry(*(getattr(instance, field) for field in ROLLUP_FIELDS))
+    )
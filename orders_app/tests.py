@@ -1,3 +1,808 @@
-from django.test import TestCase
+import csv
+import json
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authentication_app.models import User
+from core.testing import (
+    CompiledSerializerAssertionsMixin,
+    QueryCountAssertionsMixin,
+    QueryPlanAssertionsMixin,
+)
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.serializers import OrderSerializer
+from orders_app.archive import archive_orders
+from orders_app.models import ArchivedOrder, Order, OrderCounter, OrderDailyRollup
+
+
+class OrderIndexTests(QueryPlanAssertionsMixin, TestCase):
+    """
+    The hot Order queries must be served by an index.
+    """
+
+    def test_count_by_business_and_status_uses_index(self):
+        for status in ("in_progress", "completed"):
+            self.assertUsesIndex(Order.objects.filter(business_user=1, status=status))
+
+    def test_orders_of_user_use_index(self):
+        self.assertUsesIndex(
+            Order.objects.filter(Q(customer_user=1) | Q(business_user=1))
+        )
+
+    def test_role_lists_are_ordered_by_index(self):
+        since = timezone.now()
+        for role in ("customer_user", "business_user"):
+            for key in ("created_at", "updated_at"):
+                self.assertOrderedByIndex(
+                    Order.objects.filter(**{role: 1}).order_by(f"-{key}", "-id")
+                )
+            self.assertOrderedByIndex(
+                Order.objects.filter(**{role: 1}, updated_at__gte=since).order_by(
+                    "updated_at", "id"
+                ),
+                f"order_{role.split('_')[0]}_updated_idx",
+            )
+
+    def test_role_and_status_use_index(self):
+        self.assertUsesIndex(
+            Order.objects.filter(customer_user=1, status="completed"),
+            "order_customer_status_idx",
+        )
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class OrderQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Order endpoints run a fixed number of queries, independent of the number of rows.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.staff = User.objects.create(username="staff", is_staff=True)
+        offer = Offer.objects.create(business_user=self.business, title="Logo")
+        self.detail = OfferDetail.objects.create(
+            offer=offer, price=10, delivery_time_in_days=3, offer_type="basic"
+        )
+        self.business_client = self.client_for(self.business)
+        self.customer_client = self.client_for(self.customer)
+        self.order = self.create_orders(1)[0]
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def create_orders(self, count):
+        return [
+            Order.objects.create(
+                customer_user=self.customer,
+                business_user=self.business,
+                price=10,
+                offer_detail=self.detail,
+            )
+            for _ in range(count)
+        ]
+
+    def test_list_is_constant_in_row_count(self):
+        for extra in (0, 5):
+            self.create_orders(extra)
+            self.assertQueryCount(2, self.customer_client, "get", "/api/orders/")
+            self.assertQueryCount(2, self.business_client, "get", "/api/orders/")
+
+    def test_counts(self):
+        for url in ("order-count", "completed-order-count", "order-stats"):
+            self.assertQueryCount(
+                1, self.business_client, "get", f"/api/{url}/{self.business.pk}/"
+            )
+
+    def test_detail_endpoints(self):
+        url = f"/api/orders/{self.order.pk}/"
+        self.assertQueryCount(1, self.business_client, "get", url)
+        self.assertQueryCount(
+            5, self.business_client, "patch", url, data={"status": "completed"}
+        )
+        self.assertQueryCount(4, self.client_for(self.staff), "delete", url)
+
+    def test_create(self):
+        self.assertQueryCount(
+            4,
+            self.customer_client,
+            "post",
+            "/api/orders/",
+            data={"offer_detail_id": self.detail.pk},
+            format="json",
+        )
+
+    def test_detail_revalidates(self):
+        url = f"/api/orders/{self.order.pk}/"
+        etag = self.business_client.get(url)["ETag"]
+
+        response = self.assertQueryCount(
+            1, self.business_client, "get", url, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_sparse_fieldset(self):
+        response = self.assertQueryCount(
+            2, self.customer_client, "get", "/api/orders/?omit=features,offer_detail"
+        )
+
+        self.assertNotIn("features", response.json()[0])
+        self.assertIn("status", response.json()[0])
+
+
+class OrderListFilterTests(TestCase):
+    """
+    The order list filters by role, status and updated_since, and supports delta polling.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+        # The business user also placed an order with another business
+        other = User.objects.create(username="other", type="business")
+        self.placed = Order.objects.create(
+            customer_user=self.business, business_user=other
+        )
+        self.assigned = [
+            Order.objects.create(
+                customer_user=self.customer, business_user=self.business
+            )
+            for _ in range(3)
+        ]
+
+    def ids(self, query):
+        response = self.client.get(f"/api/orders/{query}")
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        return [order["id"] for order in data]
+
+    def test_role_and_status(self):
+        self.assigned[0].status = "completed"
+        self.assigned[0].save()
+
+        self.assertEqual(len(self.ids("")), 4)
+        self.assertEqual(self.ids("?role=customer"), [self.placed.pk])
+        self.assertEqual(
+            self.ids("?role=business&status=completed"), [self.assigned[0].pk]
+        )
+
+    def test_default_ordering_is_newest_first(self):
+        self.assertEqual(
+            self.ids("?role=business"), [order.pk for order in reversed(self.assigned)]
+        )
+
+    def test_delta_polling(self):
+        since = timezone.now()
+        self.assigned[1].status = "cancelled"
+        self.assigned[1].save()
+        self.assigned[0].status = "completed"
+        self.assigned[0].save()
+
+        query = f"?updated_since={since.isoformat()}&ordering=updated_at"
+        self.assertEqual(self.ids(query), [self.assigned[1].pk, self.assigned[0].pk])
+
+        page = self.client.get(f"/api/orders/{query}&pagination=cursor&page_size=1")
+        second = self.client.get(page.json()["next"]).json()
+        self.assertEqual(second["results"][0]["id"], self.assigned[0].pk)
+
+    def test_invalid_parameters_are_rejected(self):
+        for query in (
+            "?role=admin",
+            "?status=unknown",
+            "?updated_since=yesterday",
+            "?ordering=price",
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    self.client.get(f"/api/orders/{query}").status_code, 400
+                )
+
+
+class OrderCounterTests(TestCase):
+    """
+    OrderCounter rows follow order writes and can be rebuilt from the Order table.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+
+    def stats(self, pk=None):
+        return self.client.get(f"/api/order-stats/{pk or self.business.pk}/")
+
+    def create_order(self, **kwargs):
+        return Order.objects.create(
+            customer_user=self.customer, business_user=self.business, **kwargs
+        )
+
+    def test_counters_follow_writes(self):
+        order = self.create_order()
+        self.create_order()
+        order.status = "completed"
+        order.save()
+        Order.objects.get(pk=order.pk).delete()
+
+        self.assertEqual(
+            self.stats().json(),
+            {
+                "business_user": self.business.pk,
+                "in_progress": 1,
+                "completed": 0,
+                "cancelled": 0,
+                "total": 1,
+            },
+        )
+        count = self.client.get(f"/api/order-count/{self.business.pk}/").json()
+        self.assertEqual(count, {"order_count": 1})
+
+    def test_partial_save_without_status_keeps_counters(self):
+        order = self.create_order()
+        order.status = "completed"
+        order.save(update_fields=["title"])
+
+        self.assertEqual(self.stats().json()["in_progress"], 1)
+
+    def test_unknown_or_customer_user_is_404(self):
+        self.assertEqual(self.stats(self.customer.pk).status_code, 404)
+        self.assertEqual(self.stats(9999).status_code, 404)
+        self.assertEqual(self.stats().json()["total"], 0)
+
+    def test_reconcile_rebuilds_counters(self):
+        self.create_order()
+        self.create_order(status="completed")
+        Order.objects.update(status="cancelled")
+        OrderCounter.objects.filter(status="in_progress").update(count=7)
+
+        call_command("reconcile_order_counters", batch_size=1, stdout=StringIO())
+
+        counts = self.stats().json()
+        self.assertEqual(
+            [counts["in_progress"], counts["completed"], counts["cancelled"]],
+            [0, 0, 2],
+        )
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class OrderTransitionTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Bulk status transitions follow the state machine and keep the counters in sync.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.other = User.objects.create(username="other", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def create_order(self, business_user=None, **kwargs):
+        return Order.objects.create(
+            customer_user=self.customer,
+            business_user=business_user or self.business,
+            **kwargs,
+        )
+
+    def transition(self, *transitions):
+        return self.client.post(
+            "/api/orders/transitions/",
+            {
+                "transitions": [
+                    {"id": pk, "status": status} for pk, status in transitions
+                ]
+            },
+            format="json",
+        )
+
+    def test_transitions_are_applied_per_order(self):
+        first, second, third = (self.create_order() for _ in range(3))
+        done = self.create_order(status="completed")
+        foreign = self.create_order(business_user=self.other)
+
+        # Savepoint, locking read, one UPDATE per target status, one per counter,
+        # one for the rollups, release
+        response = self.assertQueryCount(
+            9,
+            self.client,
+            "post",
+            "/api/orders/transitions/",
+            data={
+                "transitions": [
+                    {"id": first.pk, "status": "completed"},
+                    {"id": second.pk, "status": "completed"},
+                    {"id": third.pk, "status": "cancelled"},
+                    {"id": done.pk, "status": "in_progress"},
+                    {"id": foreign.pk, "status": "completed"},
+                    {"id": first.pk, "status": "cancelled"},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual((body["updated"], body["failed"]), (3, 3))
+        self.assertEqual(
+            [result.get("error") for result in body["results"]],
+            [
+                None,
+                None,
+                None,
+                "Cannot change status from 'completed' to 'in_progress'.",
+                "Order not found.",
+                "Duplicate order id.",
+            ],
+        )
+        statuses = dict(Order.objects.values_list("pk", "status"))
+        self.assertEqual(statuses[first.pk], "completed")
+        self.assertEqual(statuses[third.pk], "cancelled")
+        self.assertEqual(statuses[foreign.pk], "in_progress")
+        self.assertGreater(Order.objects.get(pk=first.pk).updated_at, first.updated_at)
+        counts = self.client.get(f"/api/order-stats/{self.business.pk}/").json()
+        self.assertEqual(
+            (counts["in_progress"], counts["completed"], counts["cancelled"]),
+            (0, 3, 1),
+        )
+
+    def test_repeated_transition_is_unchanged(self):
+        order = self.create_order(status="completed")
+
+        result = self.transition((order.pk, "completed")).json()["results"][0]
+
+        self.assertEqual(
+            result, {"id": order.pk, "status": "completed", "updated": False}
+        )
+
+    def test_only_business_users_with_valid_payload(self):
+        order = self.create_order()
+        self.assertEqual(self.transition().status_code, 400)
+        self.assertEqual(self.transition((order.pk, "shipped")).status_code, 400)
+
+        self.client.force_authenticate(self.customer)
+        self.assertEqual(self.transition((order.pk, "completed")).status_code, 403)
+
+
+class OrderArchiveTests(TestCase):
+    """
+    Old finished orders move to the archive and only show up in lists that ask for history.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+        self.old = timezone.now() - timedelta(days=400)
+
+    def create_order(self, status="in_progress", updated_at=None, **kwargs):
+        order = Order.objects.create(
+            customer_user=self.customer,
+            business_user=self.business,
+            status=status,
+            **kwargs,
+        )
+        if updated_at is not None:
+            Order.objects.filter(pk=order.pk).update(updated_at=updated_at)
+        return order
+
+    def ids(self, response):
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        rows = data["results"] if isinstance(data, dict) else data
+        return [row["id"] for row in rows]
+
+    def test_command_moves_old_finished_orders_in_batches(self):
+        archived = [
+            self.create_order("completed", self.old, title="Logo"),
+            self.create_order("cancelled", self.old),
+            self.create_order("completed", self.old),
+        ]
+        recent = self.create_order("completed")
+        active = self.create_order(updated_at=self.old)
+
+        call_command("archive_orders", batch_size=2, max_batches=1, stdout=StringIO())
+        self.assertEqual(ArchivedOrder.objects.count(), 2)
+        call_command("archive_orders", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(
+            set(Order.objects.values_list("pk", flat=True)), {recent.pk, active.pk}
+        )
+        row = ArchivedOrder.objects.get(pk=archived[0].pk)
+        self.assertEqual((row.title, row.status), ("Logo", "completed"))
+        self.assertEqual(row.updated_at, self.old)
+        # Archived orders stay counted, also after a rebuild
+        call_command("reconcile_order_counters", stdout=StringIO())
+        counts = self.client.get(f"/api/order-stats/{self.business.pk}/").json()
+        self.assertEqual((counts["completed"], counts["cancelled"]), (3, 1))
+
+    def test_history_lists_include_archive(self):
+        archived = self.create_order("completed", self.old)
+        active = self.create_order()
+        call_command("archive_orders", stdout=StringIO())
+
+        self.assertEqual(self.ids(self.client.get("/api/orders/")), [active.pk])
+        self.assertEqual(
+            self.ids(self.client.get("/api/orders/?history=true")),
+            [active.pk, archived.pk],
+        )
+        self.assertEqual(
+            self.ids(
+                self.client.get("/api/orders/?history=true&status=completed&page=1")
+            ),
+            [archived.pk],
+        )
+        response = self.client.get(
+            "/api/orders/?history=true&fields=id,status&ordering=created_at"
+        )
+        self.assertEqual(
+            response.json(),
+            [
+                {"id": archived.pk, "status": "completed"},
+                {"id": active.pk, "status": "in_progress"},
+            ],
+        )
+        self.assertEqual(
+            self.client.get(f"/api/orders/{archived.pk}/").status_code, 404
+        )
+
+    def counters_and_rollups(self):
+        return (
+            set(OrderCounter.objects.values_list("business_user", "status", "count")),
+            set(
+                OrderDailyRollup.objects.values_list(
+                    "business_user", "day", "status", "order_count", "price_cents"
+                )
+            ),
+        )
+
+    def test_archive_survives_deletes_and_stays_counted(self):
+        offer = Offer.objects.create(business_user=self.business, title="Logo")
+        detail = OfferDetail.objects.create(
+            offer=offer, price=10, delivery_time_in_days=3, offer_type="basic"
+        )
+        kept = self.create_order("completed", self.old, offer_detail=detail, price=10)
+        deleted = self.create_order("completed", self.old, price=25)
+        call_command("archive_orders", stdout=StringIO())
+
+        # Deleting the OfferDetail or the customer keeps the history
+        detail.delete()
+        self.customer.delete()
+        row = ArchivedOrder.objects.get(pk=kept.pk)
+        self.assertEqual((row.offer_detail_id, row.customer_user_id), (None, None))
+
+        # Deleting an archived order takes it out of its counter and rollup
+        ArchivedOrder.objects.get(pk=deleted.pk).delete()
+        stored = self.counters_and_rollups()
+        self.assertIn((self.business.pk, "completed", 1), stored[0])
+        call_command("reconcile_order_counters", stdout=StringIO())
+        call_command("backfill_order_rollups", stdout=StringIO())
+        self.assertEqual(self.counters_and_rollups(), stored)
+
+        self.business.delete()
+        self.assertFalse(ArchivedOrder.objects.exists())
+        self.assertEqual(self.counters_and_rollups(), (set(), set()))
+
+    def test_history_rejects_cursor_and_invalid_values(self):
+        for query in ("history=true&pagination=cursor", "history=yes"):
+            response = self.client.get(f"/api/orders/?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class OrderAnalyticsTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Daily rollups follow order writes and answer the analytics ranges.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def create_order(self, price, offer_type="basic", **kwargs):
+        return Order.objects.create(
+            customer_user=self.customer,
+            business_user=self.business,
+            price=price,
+            offer_type=offer_type,
+            **kwargs,
+        )
+
+    def rollups(self):
+        # Rows emptied by status changes stay behind with zeros until the next backfill
+        return set(
+            OrderDailyRollup.objects.exclude(order_count=0, price_cents=0).values_list(
+                "business_user",
+                "day",
+                "offer_type",
+                "status",
+                "order_count",
+                "price_cents",
+            )
+        )
+
+    def test_rollups_follow_writes_and_match_backfill(self):
+        first = self.create_order("49.90")
+        second = self.create_order("10.00", "premium")
+        third = self.create_order("5.50")
+        first.status = "completed"
+        first.save()
+        second.price = "12.00"
+        second.save(update_fields=["price"])
+        self.client.post(
+            "/api/orders/transitions/",
+            {"transitions": [{"id": third.pk, "status": "cancelled"}]},
+            format="json",
+        )
+        self.create_order("1.00").delete()
+        incremental = self.rollups()
+
+        call_command("backfill_order_rollups", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(incremental, self.rollups())
+        today = timezone.localdate()
+        self.assertIn(
+            (self.business.pk, today, "basic", "completed", 1, 4990), incremental
+        )
+        self.assertIn(
+            (self.business.pk, today, "premium", "in_progress", 1, 1200), incremental
+        )
+
+    def test_deleting_a_business_user_with_orders(self):
+        self.create_order("49.90")
+        self.create_order("10.00", status="completed")
+
+        self.business.delete()
+
+        # SQLite defers foreign key checks to the commit, which a TestCase never reaches
+        connection.check_constraints()
+        self.assertFalse(OrderDailyRollup.objects.exists())
+        self.assertFalse(OrderCounter.objects.exists())
+
+    def test_periods_are_answered_from_rollups(self):
+        days = {
+            "2026-03-02": ("20.00", "completed"),
+            "2026-03-04": ("30.00", "completed"),
+            "2026-03-10": ("99.00", "cancelled"),
+            "2026-04-01": ("15.50", "in_progress"),
+        }
+        for day, (price, status) in days.items():
+            order = self.create_order(price, status=status)
+            Order.objects.filter(pk=order.pk).update(created_at=f"{day}T12:00:00+00:00")
+        call_command("backfill_order_rollups", stdout=StringIO())
+
+        url = f"/api/order-analytics/{self.business.pk}/"
+        weekly = self.assertQueryCount(
+            1,
+            self.client,
+            "get",
+            url + "?interval=week&start=2026-03-01&end=2026-03-31",
+        ).json()
+        self.assertEqual(
+            weekly["totals"],
+            {"orders": 3, "completed": 2, "cancelled": 1, "revenue": "50.00"},
+        )
+        self.assertEqual(
+            [(period["period"], period["orders"]) for period in weekly["periods"]],
+            [
+                ("2026-02-23", 0),
+                ("2026-03-02", 2),
+                ("2026-03-09", 1),
+                ("2026-03-16", 0),
+                ("2026-03-23", 0),
+                ("2026-03-30", 0),
+            ],
+        )
+        self.assertEqual(
+            weekly["periods"][1]["offer_types"]["basic"]["revenue"], "50.00"
+        )
+
+        monthly = self.client.get(
+            url + "?interval=month&start=2026-01-15&end=2026-04-30"
+        ).json()
+        self.assertEqual(
+            [period["orders"] for period in monthly["periods"]], [0, 0, 3, 1]
+        )
+        daily = self.client.get(url + "?start=2026-04-01&end=2026-04-01").json()
+        self.assertEqual(daily["periods"][0]["orders"], 1)
+
+    def test_access_and_parameters(self):
+        other = User.objects.create(username="other", type="business")
+        staff = User.objects.create(username="staff", is_staff=True)
+        url = f"/api/order-analytics/{self.business.pk}/"
+
+        for query in ("interval=year", "start=2026-13-01", "start=2020-01-01"):
+            self.assertEqual(self.client.get(f"{url}?{query}").status_code, 400)
+
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.client.force_authenticate(staff)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        response = self.client.get(f"/api/order-analytics/{self.customer.pk}/")
+        self.assertEqual(response.status_code, 404)
+
+
+class OrderExportTests(TestCase):
+    """
+    GET /api/orders/export/ streams the user's orders as CSV or NDJSON with the list filters.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.business)
+
+    def create_order(self, created_at, status="in_progress", **kwargs):
+        order = Order.objects.create(
+            customer_user=self.customer,
+            business_user=self.business,
+            status=status,
+            price="10.50",
+            **kwargs,
+        )
+        Order.objects.filter(pk=order.pk).update(created_at=created_at)
+        return order
+
+    def export(self, query=""):
+        response = self.client.get(f"/api/orders/export/?{query}")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_csv_has_the_list_representation_in_creation_order(self):
+        now = timezone.now()
+        newer = self.create_order(now, title="=SUM(A1)", features=["Logo"])
+        older = self.create_order(now - timedelta(days=1), title="Logo, v2")
+        User.objects.create(username="other", type="business")
+
+        response, content = self.export()
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('filename="orders.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual([int(row["id"]) for row in rows], [older.pk, newer.pk])
+        listed = self.client.get("/api/orders/").json()[-1]
+        self.assertEqual(list(rows[0]), list(listed))
+        self.assertEqual(rows[0]["title"], "Logo, v2")
+        self.assertEqual(rows[0]["price"], "10.50")
+        self.assertEqual(rows[1]["title"], "'=SUM(A1)")
+        self.assertEqual(rows[1]["features"], '["Logo"]')
+
+    def test_ndjson_filters_by_status_and_creation_range(self):
+        self.create_order(datetime(2026, 8, 31, 23, tzinfo=dt_timezone.utc))
+        september = self.create_order(
+            datetime(2026, 9, 15, tzinfo=dt_timezone.utc), status="completed"
+        )
+        self.create_order(datetime(2026, 9, 16, tzinfo=dt_timezone.utc))
+        self.create_order(datetime(2026, 10, 1, 1, tzinfo=dt_timezone.utc))
+
+        response, content = self.export(
+            "output=ndjson&status=completed"
+            "&created_after=2026-09-01T00:00:00Z&created_before=2026-10-01T00:00:00Z"
+        )
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row["id"] for row in rows], [september.pk])
+
+        _, content = self.export("output=ndjson&created_after=2026-09-01&fields=id")
+        self.assertEqual(len(content.splitlines()), 3)
+        self.assertEqual(json.loads(content.splitlines()[0]), {"id": september.pk})
+
+    def test_history_exports_archived_orders_first(self):
+        archived = self.create_order(timezone.now(), status="completed")
+        archive_orders(timezone.now() + timedelta(seconds=1))
+        active = self.create_order(timezone.now() - timedelta(days=1))
+
+        _, content = self.export("fields=id")
+        self.assertEqual(content.splitlines(), ["id", str(active.pk)])
+        _, content = self.export("fields=id&history=true")
+        self.assertEqual(content.splitlines(), ["id", str(archived.pk), str(active.pk)])
+
+    def test_rejects_invalid_parameters(self):
+        for query in ("output=xml", "created_after=yesterday", "status=open"):
+            response = self.client.get(f"/api/orders/export/?{query}")
+            self.assertEqual(response.status_code, 400)
+
+
+class OrderIdempotencyTests(TestCase):
+    """
+    POST /api/orders/ with an Idempotency-Key creates the order once and replays the response.
+    """
+
+    def setUp(self):
+        cache.clear()
+        business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        offer = Offer.objects.create(business_user=business, title="Logo")
+        self.detail = OfferDetail.objects.create(
+            offer=offer, price=10, delivery_time_in_days=3, offer_type="basic"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+
+    def post(self, key, detail_id=None):
+        return self.client.post(
+            "/api/orders/",
+            {"offer_detail_id": detail_id or self.detail.pk},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_response(self):
+        first = self.post("key-1")
+        retry = self.post("key-1")
+
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(Order.objects.count(), 1)
+
+        self.assertEqual(self.post("key-2").status_code, 201)
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_keys_are_scoped_to_the_user(self):
+        self.post("key-1")
+        other = User.objects.create(username="other", type="customer")
+        self.client.force_authenticate(other)
+
+        self.assertNotIn("Idempotent-Replayed", self.post("key-1"))
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_reused_key_with_other_payload_is_rejected(self):
+        self.post("key-1")
+        self.assertEqual(self.post("key-1", detail_id=9999).status_code, 422)
+
+    def test_failed_request_is_not_stored(self):
+        self.assertEqual(self.post("key-1", detail_id=9999).status_code, 400)
+        self.assertEqual(self.post("key-1").status_code, 201)
+
+    @override_settings(IDEMPOTENCY_WAIT=0)
+    def test_concurrent_duplicate_gets_conflict(self):
+        with mock.patch("core.idempotency.cache.add", return_value=False):
+            response = self.post("key-1")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Order.objects.exists())
+
+
+class OrderCompiledReadTests(CompiledSerializerAssertionsMixin, TestCase):
+    """
+    The compiled list read path renders the same bytes as OrderSerializer.
+    """
+
+    def test_matches_serializer(self):
+        business = User.objects.create(username="business", type="business")
+        customer = User.objects.create(username="customer", type="customer")
+        Order.objects.create(
+            customer_user=customer,
+            business_user=business,
+            title="Logo",
+            price="99.999",
+            features=["Logo", {"files": 3}],
+            offer_type="basic",
+            status="completed",
+        )
+        Order.objects.create()
+
+        self.assertCompiledMatches(OrderSerializer, Order.objects.order_by("id"))
+        self.assertCompiledMatches(
+            OrderSerializer, Order.objects.order_by("id"), omit=["features"]
+        )
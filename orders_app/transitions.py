@@ -0,0 +1,120 @@
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from orders_app.models import (
+    ROLLUP_FIELDS,
+    Order,
+    OrderCounter,
+    OrderDailyRollup,
+    rollup_entry,
+)
+from orders_app.signals import rollup_deltas
+
+"""
+Order status state machine and bulk status transitions.
+
+Allowed transitions:
+    in_progress -> completed
+    in_progress -> cancelled
+
+completed and cancelled are final. Moving an order to the status it already has is accepted and
+leaves it unchanged, so a retried request reports the same outcome.
+
+transition_orders() applies many transitions of one business user in a single transaction: the
+orders are read and locked with one query, then each target status is written with one UPDATE
+(setting updated_at, which QuerySet.update() does not do on its own). QuerySet.update() does not
+send post_save, so the OrderCounter rows are adjusted here, with one statement per changed status,
+and the OrderDailyRollup rows with one batched statement.
+
+Functions:
+    can_transition: Check a single status change against the state machine.
+    transition_orders: Apply a batch of status changes and report the outcome per order.
+"""
+
+
+STATUS_TRANSITIONS = {
+    "in_progress": ("completed", "cancelled"),
+    "completed": (),
+    "cancelled": (),
+}
+
+# Upper bound for the number of transitions accepted in one request
+MAX_BULK_TRANSITIONS = 500
+
+
+def can_transition(current, target):
+    """
+    Return whether an order in status `current` may be moved to `target`.
+    """
+    return target in STATUS_TRANSITIONS.get(current, ())
+
+
+def transition_orders(business_user, transitions):
+    """
+    Apply status transitions to orders of a business user.
+
+    Orders of other business users are reported as not found. Each order may appear once per
+    batch; invalid entries are reported and do not affect the valid ones.
+
+    Args:
+        business_user (User): The business user owning the orders.
+        transitions (Iterable[tuple[int, str]]): (order id, target status) pairs.
+
+    Returns:
+        list[dict]: One result per transition, in input order, either
+        {'id': int, 'status': str, 'updated': bool} or {'id': int, 'error': str}.
+    """
+    transitions = list(transitions)
+    with transaction.atomic():
+        stored = {
+            row[0]: row[1:]
+            for row in Order.objects.select_for_update()
+            .filter(business_user=business_user, pk__in={pk for pk, _ in transitions})
+            .values_list("pk", *ROLLUP_FIELDS)
+        }
+        status_index = ROLLUP_FIELDS.index("status")
+        current = {pk: row[status_index] for pk, row in stored.items()}
+
+        results, seen, targets = [], set(), {}
+        for pk, status in transitions:
+            if pk in seen:
+                results.append({"id": pk, "error": "Duplicate order id."})
+                continue
+            seen.add(pk)
+            if pk not in current:
+                results.append({"id": pk, "error": "Order not found."})
+            elif current[pk] == status:
+                results.append({"id": pk, "status": status, "updated": False})
+            elif not can_transition(current[pk], status):
+                results.append(
+                    {
+                        "id": pk,
+                        "error": f"Cannot change status from '{current[pk]}' to '{status}'.",
+                    }
+                )
+            else:
+                targets.setdefault(status, []).append(pk)
+                results.append({"id": pk, "status": status, "updated": True})
+
+        now = timezone.now()
+        deltas, rollups = Counter(), {}
+        for status, pks in targets.items():
+            Order.objects.filter(pk__in=pks).update(status=status, updated_at=now)
+            deltas[status] += len(pks)
+            for pk in pks:
+                deltas[current[pk]] -= 1
+                row = list(stored[pk])
+                previous = rollup_entry(*row)
+                row[status_index] = status
+                for key, (count, cents) in rollup_deltas(
+                    previous, rollup_entry(*row)
+                ).items():
+                    total_count, total_cents = rollups.get(key, (0, 0))
+                    rollups[key] = (total_count + count, total_cents + cents)
+
+        for status, delta in deltas.items():
+            OrderCounter.objects.adjust(business_user.pk, status, delta)
+        OrderDailyRollup.objects.apply(rollups)
+    return results
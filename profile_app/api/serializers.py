@@ -1,5 +1,8 @@
 from rest_framework import serializers
 from profile_app.models import Profile
+from core.fieldsets import SparseFieldsetSerializerMixin
+from core.images import ImageVariantsField, ProcessedImageField
+from reviews_app.api.serializers import BusinessRatingSummarySerializer
 
 """
 Serializers for the profile_app, managing representation and updates of user profiles.
@@ -9,11 +12,12 @@ This module defines:
 """
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for the Profile model, including nested User information.
 
     Provides read and write access to profile-specific fields and controlled updates for user fields.
+    Accepts `fields` / `omit` keyword arguments for sparse fieldsets (see core.fieldsets).
 
     Fields:
         user (int): Read-only ID of the related User.
@@ -23,7 +27,10 @@ class ProfileSerializer(serializers.ModelSerializer):
         first_name (str): User's first name (optional, writable).
         last_name (str): User's last name (optional, writable).
         created_at (datetime): Read-only timestamp of User.date_joined.
-        file (ImageField): Profile image (optional).
+        rating_summary (dict): Read-only review count, average rating and star histogram of a
+            business user (None for customers and businesses without reviews).
+        file (ImageField): Profile image (optional), validated and stripped of metadata.
+        file_variants (dict): Read-only URLs of the resized picture variants, or None until generated.
         location (str): Profile location (optional).
         tel (str): Profile telephone number (optional).
         description (str): Profile description (optional).
@@ -37,8 +44,12 @@ class ProfileSerializer(serializers.ModelSerializer):
     first_name = serializers.CharField(source="user.first_name", required=False)
     last_name = serializers.CharField(source="user.last_name", required=False)
     created_at = serializers.DateTimeField(source="user.date_joined", read_only=True)
+    rating_summary = BusinessRatingSummarySerializer(
+        source="user.rating_summary", read_only=True, allow_null=True
+    )
 
-    file = serializers.ImageField(required=False, allow_null=True)
+    file = ProcessedImageField(required=False, allow_null=True)
+    file_variants = ImageVariantsField()
     location = serializers.CharField(required=False, allow_null=True)
     tel = serializers.CharField(required=False, allow_null=True)
     description = serializers.CharField(required=False, allow_null=True)
@@ -52,6 +63,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "file",
+            "file_variants",
             "location",
             "tel",
             "description",
@@ -59,6 +71,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             "type",
             "email",
             "created_at",
+            "rating_summary",
         ]
 
     def update(self, instance, validated_data):
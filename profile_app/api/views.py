@@ -1,5 +1,8 @@
 from profile_app.models import Profile
 from .serializers import ProfileSerializer
+from core.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from core.fieldsets import SparseFieldsetViewMixin
+from core.identitymap import IdentityMapMixin, get_identity_map
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 
@@ -10,10 +13,16 @@ Views:
     ProfileListView: List all profiles or create a new profile.
     ProfileDetailView: Retrieve or update a single profile with ownership check.
     ProfileTypeListView: List profiles filtered by associated user type.
+
+GET responses carry conditional GET validators (see core.conditional): an ETag on lists,
+ETag and Last-Modified on single profiles. GET requests support sparse fieldsets
+(`?fields=` / `?omit=`, see core.fieldsets).
 """
 
 
-class ProfileListView(generics.ListCreateAPIView):
+class ProfileListView(
+    ConditionalListMixin, SparseFieldsetViewMixin, generics.ListCreateAPIView
+):
     """
     GET: List all Profile instances.
     POST: Create a new Profile instance.
@@ -25,12 +34,20 @@ class ProfileListView(generics.ListCreateAPIView):
         ProfileSerializer for both read and write operations.
     """
 
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related("user", "user__rating_summary")
     serializer_class = ProfileSerializer
     permission_classes = [permissions.AllowAny]
+    # The embedded rating summary changes the representation without touching the profile
+    related_modified_fields = ("user__rating_summary__updated_at",)
+    query_budget = {"GET": 3, "POST": 3}
 
 
-class ProfileDetailView(generics.RetrieveUpdateAPIView):
+class ProfileDetailView(
+    IdentityMapMixin,
+    ConditionalRetrieveMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateAPIView,
+):
     """
     GET: Retrieve a single Profile by primary key.
     PUT/PATCH: Update the authenticated user's own Profile.
@@ -39,13 +56,17 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
         IsAuthenticated: Only logged-in users may access.
 
     Custom behavior:
-        update: Only allow updates if the request.user.profile.id matches the pk.
-        Otherwise responds with 403 Forbidden.
+        update: Only allow updates if the profile with the pk belongs to request.user.
+        Otherwise responds with 403 Forbidden. The profile is loaded once through the
+        identity map and reused by get_object() (see core.identitymap).
     """
 
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related("user", "user__rating_summary")
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # The embedded rating summary changes the representation without touching the profile
+    related_modified_fields = ("user__rating_summary__updated_at",)
+    query_budget = {"GET": 2, "PUT": 4, "PATCH": 4}
 
     def update(self, request, *args, **kwargs):
         """
@@ -58,7 +79,8 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
         Returns:
             Response: Updated profile data or 403 error if unauthorized.
         """
-        if request.user.profile.id == int(kwargs.get("pk")):
+        profile = get_identity_map(request).get(self.get_queryset(), kwargs.get("pk"))
+        if profile is not None and profile.user_id == request.user.pk:
             return super().update(request, *args, **kwargs)
 
         return Response(
@@ -67,7 +89,9 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
         )
 
 
-class ProfileTypeListView(generics.ListAPIView):
+class ProfileTypeListView(
+    ConditionalListMixin, SparseFieldsetViewMixin, generics.ListAPIView
+):
     """
     GET: List all profiles filtered by the associated user's type.
 
@@ -83,6 +107,9 @@ class ProfileTypeListView(generics.ListAPIView):
 
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # The embedded rating summary changes the representation without touching the profile
+    related_modified_fields = ("user__rating_summary__updated_at",)
+    query_budget = {"GET": 3}
 
     def get_queryset(self):
         """
@@ -92,4 +119,6 @@ class ProfileTypeListView(generics.ListAPIView):
             QuerySet[Profile]: Profiles matching the given profile_type.
         """
         profile_type = self.kwargs.get("profile_type")
-        return Profile.objects.filter(user__type=profile_type)
+        return Profile.objects.select_related("user", "user__rating_summary").filter(
+            user__type=profile_type
+        )
@@ -17,6 +17,7 @@ class Profile(models.Model):
     Attributes:
         user (OneToOneField): Link to the authenticated User (One-to-One relationship).
         file (ImageField): Optional profile picture uploaded to 'profile_pictures/'.
+        file_variants (JSONField): Stored names of the resized picture variants (see core.images).
         location (CharField): Optional address or location description.
         tel (CharField): Optional phone number (e.g., '+49 123 4567 890').
         description (TextField): Optional bio or description text.
@@ -38,6 +39,12 @@ class Profile(models.Model):
         blank=True,
         help_text="Optional profile image stored under 'profile_pictures/'",
     )
+    file_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Names of the generated thumbnail, card and full variants of the picture",
+    )
     location = models.CharField(
         max_length=255,
         blank=True,
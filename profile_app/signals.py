@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core.images import sync_image_variants
+from profile_app.models import Profile
+
+"""
+Signal handlers for the profile_app.
+
+Handlers:
+    generate_profile_picture_variants: Schedules image variant generation when the profile picture changed.
+"""
+
+
+@receiver(post_save, sender=Profile)
+def generate_profile_picture_variants(sender, instance, **kwargs):
+    """
+    Schedule generation of the picture variants if the profile's picture changed.
+
+    Args:
+        sender: The Profile model class.
+        instance (Profile): The saved profile.
+    """
+    sync_image_variants(instance, "file", "file_variants")
@@ -1,3 +1,135 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO
 
-# Create your tests here.
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from authentication_app.models import User
+from core.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin
+from profile_app.models import Profile
+
+
+class ProfileIndexTests(QueryPlanAssertionsMixin, TestCase):
+    """
+    The hot Profile queries must be served by an index.
+    """
+
+    def test_profiles_by_user_type_use_index(self):
+        self.assertUsesIndex(
+            Profile.objects.filter(user__type="business"), "user_type_idx"
+        )
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class ProfileQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Profile endpoints run a fixed number of queries, independent of the number of rows.
+    """
+
+    def setUp(self):
+        self.profile = self.create_profiles(1)[0]
+        self.client = APIClient()
+        self.client.force_authenticate(self.profile.user)
+
+    def create_profiles(self, count):
+        profiles = []
+        for _ in range(count):
+            user = User.objects.create(
+                username=f"user{User.objects.count()}", type="business"
+            )
+            profiles.append(Profile.objects.create(user=user))
+        return profiles
+
+    def test_lists_are_constant_in_row_count(self):
+        for extra in (0, 5):
+            self.create_profiles(extra)
+            self.assertQueryCount(2, APIClient(), "get", "/api/profiles/")
+            self.assertQueryCount(2, self.client, "get", "/api/profiles/business/")
+
+    def test_sparse_fieldset_joins_user_only_when_needed(self):
+        response = self.assertQueryCount(
+            2, self.client, "get", "/api/profiles/?fields=user,username,location"
+        )
+
+        self.assertEqual(list(response.json()[0]), ["user", "username", "location"])
+
+    def test_detail_endpoints(self):
+        url = f"/api/profile/{self.profile.pk}/"
+        self.assertQueryCount(1, self.client, "get", url)
+        self.assertQueryCount(
+            3,
+            self.client,
+            "patch",
+            url,
+            data={"first_name": "Max", "location": "Berlin"},
+            format="json",
+        )
+
+
+class ProfilePictureTests(TestCase):
+    """
+    Uploaded pictures are stripped of metadata and get resized variants after commit.
+    """
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root, IMAGE_PROCESSING_SYNC=True)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        user = User.objects.create(username="business", type="business")
+        self.profile = Profile.objects.create(user=user)
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        self.url = f"/api/profile/{self.profile.pk}/"
+
+    def upload(self, content, name="photo.jpg"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.patch(
+                self.url,
+                {"file": SimpleUploadedFile(name, content)},
+                format="multipart",
+            )
+
+    def jpeg_with_exif(self):
+        exif = Image.Exif()
+        exif[0x010F] = "Camera"
+        buffer = BytesIO()
+        Image.new("RGB", (2000, 1000), "red").save(buffer, "JPEG", exif=exif)
+        return buffer.getvalue()
+
+    def test_upload_is_sanitized_and_variants_are_exposed(self):
+        self.assertEqual(self.upload(self.jpeg_with_exif()).status_code, 200)
+
+        self.profile.refresh_from_db()
+        with Image.open(self.profile.file) as image:
+            self.assertEqual(dict(image.getexif()), {})
+
+        variants = self.client.get(self.url).json()["file_variants"]
+        self.assertEqual(set(variants), {"thumb", "card", "full"})
+        stored = self.profile.file_variants
+        for variant, size in (("thumb", (160, 160)), ("full", (1600, 800))):
+            self.assertTrue(variants[variant]["webp"].startswith("http://testserver/"))
+            with default_storage.open(stored[variant]["webp"]) as fh:
+                with Image.open(fh) as image:
+                    self.assertEqual((image.format, image.size), ("WEBP", size))
+
+    def test_replacing_picture_removes_old_variants(self):
+        self.upload(self.jpeg_with_exif(), "first.jpg")
+        self.profile.refresh_from_db()
+        old = self.profile.file_variants["card"]["jpeg"]
+
+        self.upload(self.jpeg_with_exif(), "second.jpg")
+
+        self.assertFalse(default_storage.exists(old))
+
+    def test_invalid_upload_is_rejected(self):
+        response = self.upload(b"not an image")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file", response.json())
@@ -1,12 +1,13 @@
 from rest_framework import serializers
-from reviews_app.models import Review
+from reviews_app.models import BusinessRatingSummary, Review
 from authentication_app.models import User
 
 """
-Serializer for the reviews_app, handling validation and creation of Review instances.
+Serializers for the reviews_app, handling validation and creation of Review instances.
 
 Classes:
     ReviewSerializer: Validates rating, business_user, and description fields for submissions.
+    BusinessRatingSummarySerializer: Read-only rating summary nested in profile and offer responses.
 """
 
 
@@ -62,3 +63,27 @@ class ReviewSerializer(serializers.ModelSerializer):
         if request and hasattr(request, "user"):
             validated_data["reviewer"] = request.user
         return super().create(validated_data)
+
+
+class BusinessRatingSummarySerializer(serializers.ModelSerializer):
+    """
+    Read-only representation of a BusinessRatingSummary.
+
+    Fields:
+        average_rating (str): Mean star rating as a decimal string, or None without reviews.
+        review_count (int): Number of reviews.
+        stars_1 ... stars_5 (int): Star histogram.
+    """
+
+    class Meta:
+        model = BusinessRatingSummary
+        fields = [
+            "average_rating",
+            "review_count",
+            "stars_1",
+            "stars_2",
+            "stars_3",
+            "stars_4",
+            "stars_5",
+        ]
+        read_only_fields = fields
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import ReviewView, ReviewDetailView
+from .views import ReviewView, ReviewDetailView, ReviewExportView
 
 """
 URL patterns for the reviews_app API.
@@ -9,18 +9,23 @@ Defines REST endpoints under the '/api/' prefix for managing customer reviews of
 Endpoints:
     GET, POST   /api/reviews/         -> ReviewView: List all reviews or submit a new review (customers only).
     GET, PUT, PATCH, DELETE /api/reviews/<pk>/ -> ReviewDetailView: Retrieve, update, or delete a specific review (only by the original reviewer).
+    GET         /api/reviews/export/  -> ReviewExportView: Stream reviews as CSV or NDJSON.
 
 Naming conventions:
     'reviews'         - Collection endpoint for reviews.
     'reviews-detail'  - Detail endpoint for individual review operations (same name used for both paths for simplicity).
+    'review-export'   - Streaming export endpoint for reviews.
 
 Permissions:
     - ReviewView: IsAuthenticated and IsCustomerOrReadOnly (authenticated customers may post reviews).
     - ReviewDetailView: IsAuthenticated and IsReviewer (only the assigned reviewer may modify or delete).
+    - ReviewExportView: IsAuthenticated.
 """
 urlpatterns = [
     # List existing reviews or create a new review
     path("reviews/", ReviewView.as_view(), name="reviews"),
     # Retrieve, update, or delete a specific review by ID
     path("reviews/<int:pk>/", ReviewDetailView.as_view(), name="reviews-detail"),
+    # Stream reviews as CSV or NDJSON
+    path("reviews/export/", ReviewExportView.as_view(), name="review-export"),
 ]
@@ -1,5 +1,13 @@
 from rest_framework import generics, permissions
 from .serializers import ReviewSerializer
+from core.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from core.exports import StreamingExportView
+from core.fastpath import CompiledListMixin
+from core.idempotency import IdempotencyMixin
+from core.identitymap import IdentityMapMixin
+from core.ordering import resolve_ordering
+from core.pagination import OptionalResultsSetPagination
+from reviews_app.filters import filter_reviews
 from reviews_app.models import Review
 from core.permissions import IsCustomerOrReadOnly, IsReviewer
 
@@ -7,16 +15,33 @@ from core.permissions import IsCustomerOrReadOnly, IsReviewer
 API views for the reviews_app, managing listing, creation, retrieval, updating, and deletion of Review instances.
 
 Views:
-    ReviewView: List all reviews or create a new review by a customer.
-    ReviewDetailView: Retrieve, update, or delete a specific review by its ID.
+    ReviewView: List reviews (filtered, ordered, with an ETag) or create a new review by a customer.
+    ReviewDetailView: Retrieve (with ETag / Last-Modified), update, or delete a specific review by its ID.
+    ReviewExportView: Stream reviews as CSV or NDJSON.
 """
 
 
-class ReviewView(generics.ListCreateAPIView):
+class ReviewView(
+    IdempotencyMixin,
+    ConditionalListMixin,
+    CompiledListMixin,
+    generics.ListCreateAPIView,
+):
     """
-    GET: List all reviews across business users.
+    GET: List reviews across business users, newest first.
     POST: Create a new review by the authenticated customer.
 
+    Query Params:
+        business_user_id (int): Only reviews of this business user.
+        reviewer_id (int): Only reviews written by this customer.
+        created_after / created_before (str): ISO 8601 datetime or date; only reviews created
+            in [created_after, created_before).
+        ordering (str): 'created_at', 'updated_at' or 'rating', '-' prefixed for descending
+            (default: '-created_at'). Ties are broken by id.
+
+    A business profile page requests `?business_user_id=<pk>&ordering=-rating&page_size=<n>`,
+    which reads one range of a (business_user, rating, id) index.
+
     Permissions:
         - IsAuthenticated: Only logged-in users can list and create.
         - Write operations (POST) allowed for customers via IsCustomerOrReadOnly.
@@ -24,6 +49,17 @@ class ReviewView(generics.ListCreateAPIView):
     Serializer:
         ReviewSerializer for input validation and output representation.
 
+    Pagination:
+        OptionalResultsSetPagination: Plain list unless pagination is requested;
+        `?pagination=cursor` switches to keyset pagination over keyset_ordering_fields.
+
+    Serialization:
+        GET lists are rendered from values() rows by the compiled read path (see core.fastpath).
+
+    Idempotency:
+        POSTs with an `Idempotency-Key` header are executed once; repeats replay the stored
+        response (see core.idempotency).
+
     Behavior:
         perform_create: Automatically assign the request.user as 'reviewer'.
     """
@@ -31,6 +67,33 @@ class ReviewView(generics.ListCreateAPIView):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [permissions.IsAuthenticated, IsCustomerOrReadOnly]
+    # POST also updates the rating summary and invalidates the business' cached offers; the
+    # worst case is the first review of a business, which creates its summary (7 + token lookup)
+    query_budget = {"GET": 3, "POST": 8}
+    pagination_class = OptionalResultsSetPagination
+    # Sort keys, each backed by a per-business index (see Review.Meta.indexes)
+    ordering_fields = ("created_at", "updated_at", "rating")
+    keyset_ordering_fields = ("created_at", "updated_at", "rating")
+
+    def get_queryset(self):
+        """
+        Filter the reviews by the query parameters and apply the ordering.
+
+        Returns:
+            QuerySet[Review]: Filtered and ordered reviews.
+        """
+        queryset = filter_reviews(super().get_queryset(), self.request.query_params)
+        return queryset.order_by(*self.get_ordering())
+
+    def get_ordering(self):
+        """
+        Return the order_by() arguments requested with the `ordering` parameter.
+        """
+        return resolve_ordering(
+            self.request.query_params.get("ordering"),
+            self.ordering_fields,
+            ("-created_at", "-id"),
+        )
 
     def perform_create(self, serializer):
         """
@@ -43,7 +106,9 @@ class ReviewView(generics.ListCreateAPIView):
         serializer.save(reviewer=reviewer)
 
 
-class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ReviewDetailView(
+    IdentityMapMixin, ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     GET: Retrieve a single Review by its ID with full details.
     PUT/PATCH: Update the review, only allowed for the assigned reviewer via IsReviewer.
@@ -60,3 +125,37 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [permissions.IsAuthenticated, IsReviewer]
+    # Writes also update the rating summary and invalidate the business' cached offers; the worst
+    # case moves a review to a business without a summary yet (10 + token lookup)
+    query_budget = {"GET": 2, "PUT": 11, "PATCH": 11, "DELETE": 6}
+
+
+class ReviewExportView(StreamingExportView):
+    """
+    GET: Stream reviews as CSV or NDJSON, oldest first.
+
+    Rows have the ReviewView representation and are read in chunks with QuerySet.iterator(),
+    so memory stays flat for any number of reviews (see core.exports).
+
+    Query Params:
+        output (str): 'csv' (default) or 'ndjson'.
+        business_user_id / reviewer_id (int): Only reviews of / by this user.
+        created_after / created_before (str): ISO 8601 datetime or date; only reviews created
+            in [created_after, created_before).
+        fields / omit (str): Sparse fieldset selecting the exported columns.
+
+    Permissions:
+        - IsAuthenticated: Require login.
+    """
+
+    queryset = Review.objects.all()
+    serializer_class = ReviewSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    export_basename = "reviews"
+
+    def get_queryset(self):
+        """
+        Filter the reviews by the query parameters, ordered by creation.
+        """
+        queryset = filter_reviews(super().get_queryset(), self.request.query_params)
+        return queryset.order_by("created_at", "id")
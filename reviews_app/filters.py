@@ -0,0 +1,32 @@
+from core.params import filter_created_range, int_param
+
+"""
+Query parameter filters of the review list and export endpoints (ReviewView, ReviewExportView).
+
+Functions:
+    filter_reviews: Apply the business_user_id, reviewer_id and creation range filters.
+"""
+
+
+def filter_reviews(queryset, params):
+    """
+    Filter a Review queryset by the query parameters.
+
+    Args:
+        queryset (QuerySet[Review]): Reviews to filter.
+        params (QueryDict): business_user_id / reviewer_id (user ids) and
+            created_after / created_before (ISO 8601 datetimes or dates, see core.params).
+
+    Raises:
+        ParseError: If a parameter is invalid.
+
+    Returns:
+        QuerySet[Review]: The filtered reviews.
+    """
+    business_user_id = int_param(params, "business_user_id")
+    if business_user_id is not None:
+        queryset = queryset.filter(business_user_id=business_user_id)
+    reviewer_id = int_param(params, "reviewer_id")
+    if reviewer_id is not None:
+        queryset = queryset.filter(reviewer_id=reviewer_id)
+    return filter_created_range(queryset, params)
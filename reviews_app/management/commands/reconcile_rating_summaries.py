@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from authentication_app.models import User
+from reviews_app.models import BusinessRatingSummary
+from reviews_app.signals import invalidate_rated_businesses
+
+"""
+Management command to recompute the BusinessRatingSummary rows from the Review table.
+
+Usage:
+    python manage.py reconcile_rating_summaries [--batch-size N]
+"""
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the rating summaries of all users in primary key batches.
+
+    Each batch upserts the summaries whose histogram differs from the Review table, in one
+    transaction (see BusinessRatingSummaryQuerySet.rebuild); correct summaries are not written, so
+    a re-run only reports new drift. The cached offer responses of corrected business users are
+    invalidated; the new summary updated_at changes their ETags.
+    """
+
+    help = "Recompute the per-business rating summaries from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users reconciled per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pk = 0
+        corrected = 0
+
+        while True:
+            batch = list(
+                User.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+
+            changed = BusinessRatingSummary.objects.rebuild(batch)
+            invalidate_rated_businesses(changed)
+            corrected += len(changed)
+            last_pk = batch[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Corrected {corrected} rating summaries.")
+        )
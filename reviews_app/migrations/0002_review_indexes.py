@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-18 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["business_user", "-updated_at"],
+                name="review_business_updated_idx",
+            ),
+        ),
+    ]
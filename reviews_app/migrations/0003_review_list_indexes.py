@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews_app", "0002_review_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="review",
+            name="review_business_updated_idx",
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="review_business_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["business_user", "updated_at", "id"],
+                name="review_business_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["business_user", "rating", "id"],
+                name="review_business_rating_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["reviewer", "created_at", "id"],
+                name="review_reviewer_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,124 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:40
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+MAX_STARS = 5
+
+
+def populate_summaries(apps, schema_editor):
+    Review = apps.get_model("reviews_app", "Review")
+    BusinessRatingSummary = apps.get_model("reviews_app", "BusinessRatingSummary")
+    histograms = {}
+    rows = (
+        Review.objects.filter(business_user__isnull=False, rating__isnull=False)
+        .values("business_user", "rating")
+        .annotate(count=models.Count("pk"))
+        .order_by()
+    )
+    for row in rows:
+        histogram = histograms.setdefault(row["business_user"], [0] * MAX_STARS)
+        histogram[min(max(row["rating"], 1), MAX_STARS) - 1] += row["count"]
+
+    summaries = []
+    for business_user_id, histogram in histograms.items():
+        review_count = sum(histogram)
+        total = sum(stars * count for stars, count in enumerate(histogram, start=1))
+        summaries.append(
+            BusinessRatingSummary(
+                business_user_id=business_user_id,
+                review_count=review_count,
+                average_rating=(Decimal(total) / review_count).quantize(
+                    Decimal("0.01"), rounding=ROUND_HALF_UP
+                ),
+                **{
+                    f"stars_{stars}": count
+                    for stars, count in enumerate(histogram, start=1)
+                },
+            )
+        )
+    BusinessRatingSummary.objects.bulk_create(summaries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews_app", "0003_review_list_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BusinessRatingSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "review_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of reviews of the business user"
+                    ),
+                ),
+                (
+                    "average_rating",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Mean star rating of the reviews",
+                        max_digits=3,
+                        null=True,
+                    ),
+                ),
+                (
+                    "stars_1",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Reviews with 1 star"
+                    ),
+                ),
+                (
+                    "stars_2",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Reviews with 2 stars"
+                    ),
+                ),
+                (
+                    "stars_3",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Reviews with 3 stars"
+                    ),
+                ),
+                (
+                    "stars_4",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Reviews with 4 stars"
+                    ),
+                ),
+                (
+                    "stars_5",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Reviews with 5 stars"
+                    ),
+                ),
+                (
+                    "business_user",
+                    models.OneToOneField(
+                        help_text="Business user whose reviews are summarized",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rating_summary",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(populate_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:55
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews_app", "0004_businessratingsummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="businessratingsummary",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text="Last change of the summary",
+            ),
+            preserve_default=False,
+        ),
+    ]
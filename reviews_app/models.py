@@ -1,14 +1,32 @@
-from django.db import models
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import models, transaction
+from django.db.models import Count
 from django.conf import settings
 
 """
 Data model for the reviews_app, representing customer reviews for business users.
 
-Model:
+Models:
     Review: Stores rating, reviewer, and description linked to business and customer users.
+    BusinessRatingSummary: Review count, average rating and star histogram per business user,
+        maintained on Review writes.
+
+Constants:
+    MAX_STARS: Top of the star scale; higher ratings are summarized as MAX_STARS.
 """
 
 
+MAX_STARS = 5
+
+
+def rating_stars(rating):
+    """
+    Return the 1..MAX_STARS star bucket of a rating.
+    """
+    return min(max(rating, 1), MAX_STARS)
+
+
 class Review(models.Model):
     """
     Represents a customer's review of a business user.
@@ -57,6 +75,66 @@ class Review(models.Model):
         help_text="Timestamp when this review was last updated",
     )
 
+    class Meta:
+        indexes = [
+            # Review list per business: sort keys with the id tie-breaker (see ReviewView)
+            models.Index(
+                fields=["business_user", "created_at", "id"],
+                name="review_business_created_idx",
+            ),
+            models.Index(
+                fields=["business_user", "updated_at", "id"],
+                name="review_business_updated_idx",
+            ),
+            models.Index(
+                fields=["business_user", "rating", "id"],
+                name="review_business_rating_idx",
+            ),
+            # Reviews written by one customer (few rows, other sort keys sort them in memory)
+            models.Index(
+                fields=["reviewer", "created_at", "id"],
+                name="review_reviewer_created_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The summary update in the post_save handler commits together with the review
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            return super().delete(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_rating_key()
+        return instance
+
+    def rating_key(self):
+        """
+        Return the (business_user_id, stars) pair this review is summarized under.
+
+        Returns:
+            tuple | None: The pair, or None for reviews without business user or rating.
+        """
+        if self.business_user_id is None or self.rating is None:
+            return None
+        return (self.business_user_id, rating_stars(self.rating))
+
+    def remember_rating_key(self):
+        """
+        Record the rating key this review is currently summarized under.
+
+        Nothing is recorded if one of the fields is deferred; the summary handlers then look
+        the stored values up before saving.
+        """
+        if "business_user_id" in self.__dict__ and "rating" in self.__dict__:
+            self._rating_key = self.rating_key()
+        else:
+            self.__dict__.pop("_rating_key", None)
+
     def __str__(self):
         """
         String representation of the Review.
@@ -67,3 +145,188 @@ class Review(models.Model):
         reviewer_name = self.reviewer.username if self.reviewer else "Unknown"
         business_name = self.business_user.username if self.business_user else "Unknown"
         return f"Review {self.id} by {reviewer_name} for {business_name}"
+
+
+class BusinessRatingSummaryQuerySet(models.QuerySet):
+    """
+    QuerySet for BusinessRatingSummary with incremental and full recomputation helpers.
+    """
+
+    def adjust(self, business_user_id, deltas):
+        """
+        Add review count deltas per star bucket to the summary of a business user.
+
+        The row is locked while it is changed, so concurrent reviews of the same business are
+        applied one after the other. Counts never drop below zero; drift is corrected by rebuild().
+        A missing summary is only created for deltas that add reviews: removals (e.g. the cascade
+        of a deleted business user, which deletes the summary too) never re-create it.
+
+        Args:
+            business_user_id (int | None): Reviewed business user (None is ignored).
+            deltas (dict[int, int]): Change of the review count per star bucket.
+
+        Returns:
+            bool: Whether the summary was written.
+        """
+        deltas = {stars: delta for stars, delta in deltas.items() if delta}
+        if business_user_id is None or not deltas:
+            return False
+        with transaction.atomic(using=self.db, savepoint=False):
+            summaries = self.select_for_update().filter(
+                business_user_id=business_user_id
+            )
+            if all(delta < 0 for delta in deltas.values()):
+                summary = summaries.first()
+                if summary is None:
+                    return False
+                created = False
+            else:
+                initial = self.model(business_user_id=business_user_id)
+                initial.add(deltas)
+                summary, created = summaries.get_or_create(
+                    defaults={
+                        field.attname: getattr(initial, field.attname)
+                        for field in self.model._meta.concrete_fields
+                        if not field.primary_key
+                    },
+                )
+            if not created:
+                summary.add(deltas)
+                summary.save()
+        return True
+
+    def rebuild(self, business_user_ids):
+        """
+        Recompute the summaries of the given business users from the Review table.
+
+        Args:
+            business_user_ids (Iterable[int]): Business users whose summaries are rebuilt.
+
+        Returns:
+            list[int]: Business users whose summary was created, changed or reset.
+        """
+        business_user_ids = list(business_user_ids)
+        with transaction.atomic():
+            actual = {}
+            for row in (
+                Review.objects.filter(
+                    business_user__in=business_user_ids, rating__isnull=False
+                )
+                .values("business_user", "rating")
+                .annotate(count=Count("pk"))
+                .order_by()
+            ):
+                histogram = actual.setdefault(row["business_user"], [0] * MAX_STARS)
+                histogram[rating_stars(row["rating"]) - 1] += row["count"]
+            stored = {
+                summary.business_user_id: summary
+                for summary in self.select_for_update().filter(
+                    business_user__in=business_user_ids
+                )
+            }
+
+            changed = []
+            for business_user_id in set(actual) | set(stored):
+                summary = stored.get(business_user_id) or self.model(
+                    business_user_id=business_user_id
+                )
+                histogram = actual.get(business_user_id, [0] * MAX_STARS)
+                if business_user_id in stored and summary.histogram() == histogram:
+                    continue
+                for stars, count in enumerate(histogram, start=1):
+                    setattr(summary, f"stars_{stars}", count)
+                summary.recompute()
+                changed.append(summary)
+
+            self.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=["business_user"],
+                update_fields=[
+                    "review_count",
+                    "average_rating",
+                    *(f"stars_{stars}" for stars in range(1, MAX_STARS + 1)),
+                    "updated_at",
+                ],
+            )
+        return sorted(summary.business_user_id for summary in changed)
+
+
+class BusinessRatingSummary(models.Model):
+    """
+    Review count, average rating and 1-5 star histogram of a business user.
+
+    The row is adjusted in the same transaction as the Review write that changes it (see
+    reviews_app.signals) and can be recomputed with the reconcile_rating_summaries command.
+    Ratings above MAX_STARS are summarized as MAX_STARS stars.
+
+    Attributes:
+        business_user (OneToOneField): The reviewed business user.
+        review_count (PositiveIntegerField): Number of reviews.
+        average_rating (DecimalField): Mean star rating, rounded to two places (None without reviews).
+        stars_1 ... stars_5 (PositiveIntegerField): Number of reviews per star rating.
+        updated_at (DateTimeField): When the summary last changed. Profiles and offers embedding
+            the summary include it in their conditional GET validators.
+    """
+
+    business_user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="rating_summary",
+        help_text="Business user whose reviews are summarized",
+    )
+    review_count = models.PositiveIntegerField(
+        default=0, help_text="Number of reviews of the business user"
+    )
+    average_rating = models.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="Mean star rating of the reviews",
+    )
+    stars_1 = models.PositiveIntegerField(default=0, help_text="Reviews with 1 star")
+    stars_2 = models.PositiveIntegerField(default=0, help_text="Reviews with 2 stars")
+    stars_3 = models.PositiveIntegerField(default=0, help_text="Reviews with 3 stars")
+    stars_4 = models.PositiveIntegerField(default=0, help_text="Reviews with 4 stars")
+    stars_5 = models.PositiveIntegerField(default=0, help_text="Reviews with 5 stars")
+    updated_at = models.DateTimeField(
+        auto_now=True, help_text="Last change of the summary"
+    )
+
+    objects = BusinessRatingSummaryQuerySet.as_manager()
+
+    def histogram(self):
+        """
+        Return the review counts for 1 to MAX_STARS stars.
+        """
+        return [getattr(self, f"stars_{stars}") for stars in range(1, MAX_STARS + 1)]
+
+    def add(self, deltas):
+        """
+        Add review count deltas per star bucket (never below zero) and recompute the totals.
+
+        Args:
+            deltas (dict[int, int]): Change of the review count per star bucket.
+        """
+        for stars, delta in deltas.items():
+            field = f"stars_{stars}"
+            setattr(self, field, max(getattr(self, field) + delta, 0))
+        self.recompute()
+
+    def recompute(self):
+        """
+        Derive review_count and average_rating from the histogram.
+        """
+        histogram = self.histogram()
+        self.review_count = sum(histogram)
+        if not self.review_count:
+            self.average_rating = None
+            return
+        total = sum(stars * count for stars, count in enumerate(histogram, start=1))
+        self.average_rating = (Decimal(total) / self.review_count).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+
+    def __str__(self):
+        return f"{self.business_user_id}: {self.average_rating} ({self.review_count})"
@@ -0,0 +1,122 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from offers_app.cache import bump_offer_versions
+from offers_app.models import Offer
+from reviews_app.models import BusinessRatingSummary, Review
+
+"""
+Signal handlers for the reviews_app, keeping the BusinessRatingSummary rows in sync.
+
+Review.save() and Review.delete() run in a transaction, so the summary changes atomically with
+the review. Profiles and offers embed the summary of their business user: its updated_at is one of
+their conditional GET validators (see core.conditional), and the offer response cache is
+invalidated when it changes. The profiles' and offers' own updated_at is left alone, so a review
+does not reorder `?ordering=updated_at` lists.
+
+Handlers:
+    load_rating_key: Looks up the stored business user and rating of a review that was not
+        loaded with them.
+    summarize_saved_review: Moves a review between star buckets (and businesses) on writes.
+    summarize_deleted_review: Removes a deleted review from its summary.
+
+Functions:
+    invalidate_rated_businesses: Drop the cached offer responses of business users.
+"""
+
+
+def invalidate_rated_businesses(business_user_ids):
+    """
+    Invalidate the cached responses of the offers of business users whose rating summary changed.
+
+    The list version and the versions of all offers are bumped together, once the review write
+    commits (see offers_app.cache.bump_offer_versions).
+
+    Args:
+        business_user_ids (Iterable[int]): The business users.
+    """
+    business_user_ids = list(business_user_ids)
+    if not business_user_ids:
+        return
+    bump_offer_versions(
+        Offer.objects.filter(business_user__in=business_user_ids).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+def _apply(previous, current):
+    """
+    Move a review from the previous to the current rating key and invalidate the affected offers.
+    """
+    deltas = {}
+    for key, sign in ((previous, -1), (current, 1)):
+        if key is not None:
+            business_user_id, stars = key
+            per_stars = deltas.setdefault(business_user_id, {})
+            per_stars[stars] = per_stars.get(stars, 0) + sign
+    invalidate_rated_businesses(
+        business_user_id
+        for business_user_id, per_stars in deltas.items()
+        if BusinessRatingSummary.objects.adjust(business_user_id, per_stars)
+    )
+
+
+@receiver(pre_save, sender=Review)
+def load_rating_key(sender, instance, raw=False, **kwargs):
+    """
+    Make sure an existing review knows the rating key it is currently summarized under.
+
+    Args:
+        sender: The Review model class.
+        instance (Review): The review about to be saved.
+    """
+    if raw or instance._state.adding or hasattr(instance, "_rating_key"):
+        return
+    stored = (
+        Review.objects.filter(pk=instance.pk)
+        .values_list("business_user_id", "rating")
+        .first()
+    )
+    instance._rating_key = (
+        Review(business_user_id=stored[0], rating=stored[1]).rating_key()
+        if stored is not None
+        else None
+    )
+
+
+@receiver(post_save, sender=Review)
+def summarize_saved_review(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    """
+    Update the rating summaries of a saved review.
+
+    Args:
+        sender: The Review model class.
+        instance (Review): The saved review.
+        created (bool): Whether the review was inserted.
+        update_fields (frozenset | None): Fields written by a partial save.
+    """
+    if raw:
+        return
+    if update_fields is not None and not {"business_user", "rating"} & update_fields:
+        return
+    previous = None if created else getattr(instance, "_rating_key", None)
+    current = instance.rating_key()
+    if previous != current:
+        _apply(previous, current)
+    instance._rating_key = current
+
+
+@receiver(post_delete, sender=Review)
+def summarize_deleted_review(sender, instance, **kwargs):
+    """
+    Remove a deleted review from the rating summary of its business user.
+
+    Args:
+        sender: The Review model class.
+        instance (Review): The deleted review.
+    """
+    previous = getattr(instance, "_rating_key", None) or instance.rating_key()
+    _apply(previous, None)
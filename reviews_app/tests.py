@@ -1,3 +1,413 @@
-from django.test import TestCase
+import csv
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from authentication_app.models import User
+from core.testing import (
+    CompiledSerializerAssertionsMixin,
+    QueryCountAssertionsMixin,
+    QueryPlanAssertionsMixin,
+)
+from offers_app.api.serializers import OfferSerializer
+from offers_app.models import Offer
+from profile_app.models import Profile
+from reviews_app.api.serializers import ReviewSerializer
+from reviews_app.models import BusinessRatingSummary, Review
+
+
+class ReviewIndexTests(QueryPlanAssertionsMixin, TestCase):
+    """
+    The hot Review queries must be served by an index.
+    """
+
+    def test_reviews_of_business_use_index(self):
+        self.assertUsesIndex(
+            Review.objects.filter(business_user=1).order_by("-updated_at"),
+            "review_business_updated_idx",
+        )
+
+    def test_list_orderings_are_served_by_index(self):
+        for key in ("created_at", "updated_at", "rating"):
+            for prefix in ("", "-"):
+                self.assertOrderedByIndex(
+                    Review.objects.filter(business_user=1).order_by(
+                        f"{prefix}{key}", f"{prefix}id"
+                    ),
+                    f"review_business_{key.split('_')[0]}_idx",
+                )
+        self.assertOrderedByIndex(
+            Review.objects.filter(reviewer=1).order_by("-created_at", "-id"),
+            "review_reviewer_created_idx",
+        )
+
+
+class ReviewListFilterTests(TestCase):
+    """
+    GET /api/reviews/ filters by business user and reviewer and orders by whitelisted keys.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.other = User.objects.create(username="other", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+        self.low, self.high, self.foreign = (
+            Review.objects.create(
+                business_user=business, reviewer=self.customer, rating=rating
+            )
+            for business, rating in (
+                (self.business, 2),
+                (self.business, 5),
+                (self.other, 3),
+            )
+        )
+
+    def ids(self, query):
+        response = self.client.get(f"/api/reviews/?{query}")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        rows = data["results"] if isinstance(data, dict) else data
+        return [row["id"] for row in rows]
+
+    def test_default_is_newest_first(self):
+        self.assertEqual(self.ids(""), [self.foreign.pk, self.high.pk, self.low.pk])
+
+    def test_filters_and_ordering(self):
+        business = f"business_user_id={self.business.pk}"
+        self.assertEqual(
+            self.ids(f"{business}&ordering=-rating"), [self.high.pk, self.low.pk]
+        )
+        self.assertEqual(
+            self.ids(f"{business}&ordering=rating&page_size=1"), [self.low.pk]
+        )
+        self.assertEqual(
+            self.ids(f"reviewer_id={self.customer.pk}&ordering=updated_at"),
+            [self.low.pk, self.high.pk, self.foreign.pk],
+        )
+        self.assertEqual(self.ids("reviewer_id=999"), [])
+
+    def test_cursor_pages_follow_the_filtered_ordering(self):
+        response = self.client.get(
+            f"/api/reviews/?business_user_id={self.business.pk}"
+            "&ordering=-rating&pagination=cursor&page_size=1"
+        )
+        page = response.json()
+        self.assertEqual([row["id"] for row in page["results"]], [self.high.pk])
+        page = self.client.get(page["next"]).json()
+        self.assertEqual([row["id"] for row in page["results"]], [self.low.pk])
+        self.assertIsNone(page["next"])
+
+    def test_rejects_invalid_parameters(self):
+        for query in ("ordering=description", "business_user_id=x", "reviewer_id=0"):
+            response = self.client.get(f"/api/reviews/?{query}")
+            self.assertEqual(response.status_code, 400)
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+@override_settings(QUERY_BUDGET_RAISE=True)
+class ReviewQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    """
+    Review endpoints run a fixed number of queries, independent of the number of rows.
+
+    The business users have a profile and offers, so writes also pay for the rating summary and
+    the invalidation of the cached offer responses.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        for user in (self.business, self.customer):
+            Profile.objects.create(user=user)
+        Offer.objects.create(business_user=self.business, title="Logo")
+        Offer.objects.create(business_user=self.business, title="Website")
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+        self.review = self.create_reviews(1)[0]
+
+    def create_reviews(self, count):
+        return [
+            Review.objects.create(
+                business_user=self.business,
+                reviewer=self.customer,
+                rating=4,
+                description="Good",
+            )
+            for _ in range(count)
+        ]
+
+    def test_list_is_constant_in_row_count(self):
+        for extra in (0, 5):
+            self.create_reviews(extra)
+            self.assertQueryCount(2, self.client, "get", "/api/reviews/")
+
+    def test_create_with_idempotency_key_replays(self):
+        cache.clear()
+        payload = {"business_user": self.business.pk, "rating": 5, "description": "Top"}
+        for _ in range(2):
+            response = self.client.post(
+                "/api/reviews/", payload, format="json", HTTP_IDEMPOTENCY_KEY="r-1"
+            )
+            self.assertEqual(response.status_code, 201)
+
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+        self.assertEqual(Review.objects.count(), 2)
+
+    def test_create(self):
+        # Business user, insert, rating summary (lock and update), offers of the business
+        self.assertQueryCount(
+            5,
+            self.client,
+            "post",
+            "/api/reviews/",
+            data={"business_user": self.business.pk, "rating": 5, "description": "Top"},
+            format="json",
+        )
+
+    def test_detail_endpoints(self):
+        url = f"/api/reviews/{self.review.pk}/"
+        self.assertQueryCount(1, self.client, "get", url)
+        self.assertQueryCount(5, self.client, "patch", url, data={"rating": 5})
+        self.assertQueryCount(5, self.client, "delete", url)
+
+    def test_writes_creating_a_rating_summary(self):
+        # The first review of a business creates its summary: the worst case of the budgets
+        other = User.objects.create(username="other", type="business")
+        Profile.objects.create(user=other)
+        Offer.objects.create(business_user=other, title="Logo")
+        self.assertQueryCount(
+            7,
+            self.client,
+            "post",
+            "/api/reviews/",
+            data={"business_user": other.pk, "rating": 5, "description": "Top"},
+            format="json",
+        )
+
+        newest = User.objects.create(username="newest", type="business")
+        Offer.objects.create(business_user=newest, title="Logo")
+        self.assertQueryCount(
+            10,
+            self.client,
+            "patch",
+            f"/api/reviews/{self.review.pk}/",
+            data={"business_user": newest.pk},
+            format="json",
+        )
+        self.assertEqual(
+            BusinessRatingSummary.objects.get(business_user=newest).review_count, 1
+        )
+
+
+class ReviewExportTests(TestCase):
+    """
+    GET /api/reviews/export/ streams reviews as CSV or NDJSON, filtered by user and date.
+    """
+
+    def test_exports_filtered_reviews(self):
+        business = User.objects.create(username="business", type="business")
+        other = User.objects.create(username="other", type="business")
+        customer = User.objects.create(username="customer", type="customer")
+        first, second = (
+            Review.objects.create(
+                business_user=business, reviewer=customer, rating=rating
+            )
+            for rating in (4, 5)
+        )
+        Review.objects.create(business_user=other, reviewer=customer, rating=1)
+        client = APIClient()
+        client.force_authenticate(customer)
+
+        response = client.get(f"/api/reviews/export/?business_user_id={business.pk}")
+        self.assertEqual(response.status_code, 200)
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual([int(row["id"]) for row in rows], [first.pk, second.pk])
+        self.assertEqual(rows[1]["rating"], "5")
+
+        response = client.get(
+            f"/api/reviews/export/?output=ndjson&reviewer_id={customer.pk}"
+            "&created_before=2000-01-01"
+        )
+        self.assertEqual(b"".join(response.streaming_content), b"")
+        response = client.get("/api/reviews/export/?business_user_id=abc")
+        self.assertEqual(response.status_code, 400)
+
+
+class BusinessRatingSummaryTests(CompiledSerializerAssertionsMixin, TestCase):
+    """
+    Review writes keep the per-business rating summary in sync; profiles and offers expose it.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create(username="business", type="business")
+        self.customer = User.objects.create(username="customer", type="customer")
+        self.profile = Profile.objects.create(user=self.business)
+        self.offer = Offer.objects.create(business_user=self.business, title="Logo")
+        self.client = APIClient()
+        self.client.force_authenticate(self.customer)
+
+    def summary(self):
+        return BusinessRatingSummary.objects.get(business_user=self.business)
+
+    def test_review_writes_update_the_summary(self):
+        for rating in (5, 4):
+            response = self.client.post(
+                "/api/reviews/",
+                {
+                    "business_user": self.business.pk,
+                    "rating": rating,
+                    "description": "Ok",
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, 201)
+        summary = self.summary()
+        self.assertEqual(
+            (summary.review_count, summary.average_rating), (2, Decimal("4.50"))
+        )
+        self.assertEqual(summary.histogram(), [0, 0, 0, 1, 1])
+
+        url = f"/api/reviews/{response.json()['id']}/"
+        self.client.patch(url, {"rating": 1}, format="json")
+        self.assertEqual(self.summary().histogram(), [1, 0, 0, 0, 1])
+        self.assertEqual(self.summary().average_rating, Decimal("3.00"))
+
+        self.client.delete(url)
+        summary = self.summary()
+        self.assertEqual(
+            (summary.review_count, summary.average_rating), (1, Decimal("5.00"))
+        )
+
+    def test_profile_and_offers_expose_the_summary(self):
+        offer_url = f"/api/offers/{self.offer.pk}/"
+        profile_url = f"/api/profile/{self.profile.pk}/"
+        etags = {
+            url: self.client.get(url)["ETag"]
+            for url in (offer_url, f"{offer_url}?fields=id", "/api/offers/")
+        }
+        self.assertIsNone(self.client.get(profile_url).json()["rating_summary"])
+        profile_etag = self.client.get(profile_url)["ETag"]
+        offer_updated_at = Offer.objects.get(pk=self.offer.pk).updated_at
+
+        Review.objects.create(
+            business_user=self.business, reviewer=self.customer, rating=3
+        )
+
+        # The summary is part of the validators; the offer's own updated_at (and with it
+        # `?ordering=updated_at`) is left alone
+        self.assertEqual(
+            Offer.objects.get(pk=self.offer.pk).updated_at, offer_updated_at
+        )
+        for url, etag in etags.items():
+            self.assertNotEqual(self.client.get(url)["ETag"], etag, url)
+        self.assertNotEqual(self.client.get(profile_url)["ETag"], profile_etag)
+
+        expected = {
+            "average_rating": "3.00",
+            "review_count": 1,
+            "stars_1": 0,
+            "stars_2": 0,
+            "stars_3": 1,
+            "stars_4": 0,
+            "stars_5": 0,
+        }
+        self.assertEqual(
+            self.client.get(profile_url).json()["rating_summary"], expected
+        )
+        response = self.client.get(offer_url)
+        self.assertEqual(response.json()["business_rating"], expected)
+        offers = self.client.get("/api/offers/").json()["results"]
+        self.assertEqual(offers[0]["business_rating"], expected)
+
+        Offer.objects.create(title="Without business")
+        self.assertCompiledMatches(OfferSerializer, Offer.objects.order_by("id"))
+
+    def test_review_writes_invalidate_cached_offers_on_commit(self):
+        cache.clear()
+        Offer.objects.create(business_user=self.business, title="Website")
+        anonymous = APIClient()
+        url = f"/api/offers/{self.offer.pk}/"
+        anonymous.get(url)
+
+        with mock.patch("offers_app.cache.cache.set_many") as set_many:
+            with self.captureOnCommitCallbacks(execute=True):
+                Review.objects.create(
+                    business_user=self.business, reviewer=self.customer, rating=4
+                )
+                set_many.assert_not_called()
+        # The list version and both offer versions in one round trip
+        set_many.assert_called_once()
+        self.assertEqual(len(set_many.call_args.args[0]), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(
+                business_user=self.business, reviewer=self.customer, rating=2
+            )
+        response = anonymous.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["business_rating"]["review_count"], 2)
+
+    def test_deleting_a_business_user_with_reviews(self):
+        for rating in (2, 5):
+            Review.objects.create(
+                business_user=self.business, reviewer=self.customer, rating=rating
+            )
+
+        self.business.delete()
+
+        # SQLite defers foreign key checks to the commit, which a TestCase never reaches
+        connection.check_constraints()
+        self.assertFalse(BusinessRatingSummary.objects.exists())
+
+    def test_reconcile_command_repairs_drift(self):
+        Review.objects.create(
+            business_user=self.business, reviewer=self.customer, rating=2
+        )
+        Review.objects.create(
+            business_user=self.business, reviewer=self.customer, rating=9
+        )
+        BusinessRatingSummary.objects.filter(business_user=self.business).update(
+            review_count=7, stars_2=0
+        )
+        other = User.objects.create(username="other", type="business")
+        BusinessRatingSummary.objects.create(
+            business_user=other, review_count=1, stars_1=1
+        )
+
+        out = StringIO()
+        call_command("reconcile_rating_summaries", stdout=out)
+
+        self.assertIn("Corrected 2 rating summaries.", out.getvalue())
+        summary = self.summary()
+        self.assertEqual(summary.histogram(), [0, 1, 0, 0, 1])
+        self.assertEqual(
+            (summary.review_count, summary.average_rating), (2, Decimal("3.50"))
+        )
+        other_summary = BusinessRatingSummary.objects.get(business_user=other)
+        self.assertEqual(
+            (other_summary.review_count, other_summary.average_rating), (0, None)
+        )
+
+
+class ReviewCompiledReadTests(CompiledSerializerAssertionsMixin, TestCase):
+    """
+    The compiled list read path renders the same bytes as ReviewSerializer.
+    """
+
+    def test_matches_serializer(self):
+        business = User.objects.create(username="business", type="business")
+        customer = User.objects.create(username="customer", type="customer")
+        Review.objects.create(
+            business_user=business, reviewer=customer, rating=5, description="Top ✓"
+        )
+        Review.objects.create(rating=1)
+
+        self.assertCompiledMatches(ReviewSerializer, Review.objects.order_by("id"))